@@ -72,32 +72,36 @@ class Game:
 
         self.status: str = "waiting"  # waiting | in_progress | finished
         self._host_timer: Optional[Timer] = None
+        self._sids: Dict[str, str] = {host_sid: host.id}  # sid → player_id
 
     # ------------------------------------------------------------------ players
     def add_player(self, name: str, sid: str) -> Player:
         player = Player(name, sid)
         self.players[player.id] = player
+        self._sids[sid] = player.id
         return player
 
     def get_player(self, player_id: str) -> Optional[Player]:
         return self.players.get(player_id)
 
     def get_by_sid(self, sid: str) -> Optional[Player]:
-        for p in self.players.values():
-            if p.sid == sid:
-                return p
-        return None
+        pid = self._sids.get(sid)
+        return self.players.get(pid) if pid else None
 
     def mark_offline(self, sid: str):
         if p := self.get_by_sid(sid):
+            self._sids.pop(sid, None)
             p.online = False
             p.sid = ""
             if p.id == self.host_id:
                 self._schedule_close()
 
     def mark_online(self, player: Player, sid: str):
+        if self._sids.get(player.sid) == player.id:
+            self._sids.pop(player.sid)
         player.online = True
         player.sid = sid
+        self._sids[sid] = player.id
         if player.id == self.host_id and self._host_timer:
             self._host_timer.cancel()
             self._host_timer = None
@@ -131,24 +135,35 @@ class Game:
 class GameRegistry:
     def __init__(self):
         self._games: Dict[str, Game] = {}
+        self._sid_games: Dict[str, str] = {}  # sid → game id
 
     # CRUD ---------------------------------------------------------------
     def create(self, host_sid: str, host_name: str) -> Game:
         game = Game(host_sid, host_name)
         self._games[game.id] = game
+        self.bind_sid(host_sid, game.id)
         return game
 
     def get(self, gid: str) -> Optional[Game]:
         return self._games.get(gid)
 
     def remove(self, gid: str):
-        self._games.pop(gid, None)
+        game = self._games.pop(gid, None)
+        for sid in game._sids if game else ():
+            self._sid_games.pop(sid, None)
 
     # -------------------------------------------------------------------
+    def bind_sid(self, sid: str, gid: str):
+        self._sid_games[sid] = gid
+
+    def unbind_sid(self, sid: str):
+        self._sid_games.pop(sid, None)
+
     def player_by_sid(self, sid: str) -> Optional[tuple[Game, Player]]:
-        for g in self._games.values():
-            if p := g.get_by_sid(sid):
-                return g, p
+        gid = self._sid_games.get(sid)
+        g = self._games.get(gid) if gid else None
+        if g and (p := g.get_by_sid(sid)):
+            return g, p
         return None
 
 
@@ -181,6 +196,7 @@ def disconnect():
         return
     game, player = gp
     game.mark_offline(request.sid)
+    registry.unbind_sid(request.sid)
     emit("player_list", game.to_dict(), room=game.id)
 
 
@@ -215,6 +231,7 @@ def join_game(data):
         return
 
     player = game.add_player(name, request.sid)
+    registry.bind_sid(request.sid, game.id)
     join_room(game.id)
 
     emit("joined", {"game": game.to_dict(), "player_id": player.id})
@@ -234,7 +251,9 @@ def rejoin_game(data):
         emit("error", {"message": "Player not recognised"})
         return
 
+    registry.unbind_sid(player.sid)
     game.mark_online(player, request.sid)
+    registry.bind_sid(request.sid, game.id)
     join_room(game.id)
 
     emit("rejoined", {"game": game.to_dict(), "player_id": player.id})
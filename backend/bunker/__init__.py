@@ -1,19 +1,67 @@
 from flask import Flask
 from .config import DevConfig
+from .core.logs import configure_logging
 from .extensions import cors, socketio
 from .sockets import register_socket_events
+from .sockets.events import service
+from .services.journal import GameJournal
+from .services.reaper import ReapPolicy
+from .services.timeouts import TimeoutPolicy
+from .infrastructure.sqlite.event_store import SQLiteEventStore
+from .infrastructure.message_queue import client_manager
+from .core.sharding import ShardMap
+from .routing import init_routing
+from .content import init_content
 from bunker.infrastructure.character_randomizer import load_all_character_pools
 
 
 def create_app(config_object=DevConfig):
     app = Flask(__name__)
     app.config.from_object(config_object)
+    configure_logging(
+        app.config["LOG_LEVEL"],
+        app.config["LOG_LEVELS"],
+        app.config["LOG_JSON_PATH"],
+    )
 
     # ── extensions ─────────────────────────────────────────────
     cors.init_app(app, resources={r"/*": {"origins": "*"}})
-    socketio.init_app(app, cors_allowed_origins="*")
+    # client_manager передается всегда: init_app копит опции в синглтоне,
+    # и очередь одного приложения иначе досталась бы следующему
+    socketio.init_app(
+        app,
+        cors_allowed_origins="*",
+        client_manager=client_manager(app.config["MESSAGE_QUEUE"]),
+    )
+
+    # ── sharding ───────────────────────────────────────────────
+    shards = ShardMap.from_config(app.config)
+    service.configure_shards(shards)
+    init_routing(app, shards)
+    # ящик партии ждет, уступая управление другим green-потокам
+    service.configure_idle(socketio.sleep)
 
     # ── socket events ──────────────────────────────────────────
-    register_socket_events(socketio)
+    register_socket_events(socketio, app.config["BROADCAST_WINDOW"])
     load_all_character_pools()  # теперь все глобальные переменные заполнены
+
+    # ── static content ─────────────────────────────────────────
+    init_content(app, service.content_manifest())
+
+    # ── persistence ────────────────────────────────────────────
+    if app.config["GAME_DB_PATH"]:
+        store = SQLiteEventStore(app.config["GAME_DB_PATH"])
+        service.attach_journal(GameJournal(store, app.config["GAME_CHECKPOINT_EVERY"]))
+        service.recover()
+
+    # ── eviction ───────────────────────────────────────────────
+    service.configure_reaper(ReapPolicy.from_config(app.config))
+    service.start_reaper(socketio.start_background_task, socketio.sleep)
+
+    # ── timers ─────────────────────────────────────────────────
+    service.start_timers(
+        TimeoutPolicy.from_config(app.config),
+        socketio.start_background_task,
+        socketio.sleep,
+    )
     return app
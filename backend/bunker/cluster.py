@@ -0,0 +1,106 @@
+"""Запуск нескольких воркеров-шардов и фронтового роутера.
+
+Каждый воркер — отдельный процесс ``main.py`` со своим портом и номером
+шарда; роутер на ``--port`` отвечает клиентам, на какой воркер
+подключаться (см. ``bunker.routing``)::
+
+    python -m bunker.cluster --workers 4 --port 5000 \\
+        --message-queue redis://localhost:6379/0
+
+Без ``--message-queue`` emit не выходит за пределы своего воркера: комнаты
+липкие, и этого хватает, пока никто не шлет события в чужие партии.
+"""
+
+from __future__ import annotations
+import argparse
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from bunker.core.logs import configure_logging, get_logger
+from bunker.core.sharding import ShardMap
+
+log = get_logger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def shard_db_path(path: Optional[str], index: int) -> Optional[str]:
+    """``games.db`` → ``games.shard1.db``: у каждого воркера свой журнал"""
+    if not path:
+        return None
+    p = Path(path)
+    return str(p.with_name(f"{p.stem}.shard{index}{p.suffix}"))
+
+
+def worker_env(
+    base: Dict[str, str],
+    shards: ShardMap,
+    index: int,
+    port: int,
+    message_queue: Optional[str],
+) -> Dict[str, str]:
+    env = dict(base)
+    env.update(
+        BUNKER_SHARD_INDEX=str(index),
+        BUNKER_SHARDS=str(shards.count),
+        BUNKER_SHARD_URLS=",".join(shards.urls),
+        BUNKER_PORT=str(port),
+    )
+    if message_queue:
+        env["BUNKER_MESSAGE_QUEUE"] = message_queue
+    db = shard_db_path(base.get("BUNKER_DB"), index)
+    if db:
+        env["BUNKER_DB"] = db
+    return env
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Шардированный запуск сервера")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5000, help="порт роутера")
+    parser.add_argument(
+        "--public-host", default="localhost", help="хост в адресах воркеров"
+    )
+    parser.add_argument("--message-queue", default=os.getenv("BUNKER_MESSAGE_QUEUE"))
+    args = parser.parse_args(argv)
+
+    configure_logging("INFO")
+    ports = [args.port + 1 + i for i in range(args.workers)]
+    shards = ShardMap(
+        count=args.workers,
+        urls=tuple(f"http://{args.public_host}:{port}" for port in ports),
+    )
+    if args.workers > 1 and not args.message_queue:
+        log.warning("No message queue: emits stay inside their own worker")
+
+    # SIGTERM → SystemExit, чтобы finally погасил воркеры
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    workers: List[subprocess.Popen] = []
+    try:
+        for index, port in enumerate(ports):
+            env = worker_env(os.environ, shards, index, port, args.message_queue)
+            workers.append(
+                subprocess.Popen([sys.executable, "main.py"], cwd=BACKEND_DIR, env=env)
+            )
+            log.info("Shard %s on port %s (pid %s)", index, port, workers[-1].pid)
+
+        import eventlet
+        from eventlet import wsgi
+
+        from bunker.routing import create_router
+
+        wsgi.server(eventlet.listen((args.host, args.port)), create_router(shards))
+    finally:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,39 @@
 import os
 from pathlib import Path
 
+from .core.sharding import parse_urls
+
 
 class BaseConfig:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
     DEBUG = False
-    # Для будущей БД/Redis можно задать здесь:
-    # SQLALCHEMY_DATABASE_URI = 'sqlite:///' + str(Path(__file__).with_suffix('.db'))
-    # CELERY_BROKER_URL = 'redis://localhost:6379/0'
+    # Логи: общий уровень, уровни отдельных модулей и файл JSON-lines
+    LOG_LEVEL = os.getenv("BUNKER_LOG_LEVEL", "WARNING")
+    LOG_LEVELS: dict = {}  # {"bunker.sockets.events": "DEBUG"}
+    LOG_JSON_PATH = os.getenv("BUNKER_LOG_JSON")
+    # Журнал партий в SQLite (WAL); без пути партии живут только в памяти
+    GAME_DB_PATH = os.getenv("BUNKER_DB")
+    GAME_CHECKPOINT_EVERY = int(os.getenv("BUNKER_CHECKPOINT_EVERY", "50"))
+    # Шарды комнат: номер этого воркера, их число и адреса (через запятую)
+    SHARD_INDEX = int(os.getenv("BUNKER_SHARD_INDEX", "0"))
+    SHARD_COUNT = int(os.getenv("BUNKER_SHARDS", "1"))
+    SHARD_URLS = parse_urls(os.getenv("BUNKER_SHARD_URLS"))
+    # Очередь Socket.IO между воркерами: redis://…, amqp://… или local://<канал>
+    MESSAGE_QUEUE = os.getenv("BUNKER_MESSAGE_QUEUE")
+    # Выселение простаивающих партий из памяти (секунды без активности)
+    GAME_TTL_FINISHED = float(os.getenv("BUNKER_TTL_FINISHED", "600"))
+    GAME_TTL_ABANDONED = float(os.getenv("BUNKER_TTL_ABANDONED", "1800"))
+    GAME_TTL_IDLE = float(os.getenv("BUNKER_TTL_IDLE", "21600"))
+    GAME_REAP_INTERVAL = float(os.getenv("BUNKER_REAP_INTERVAL", "30"))  # 0 — выкл.
+    # Сроки, секунды (0 — срок не действует) и точность колеса таймеров
+    HOST_GRACE_PERIOD = float(os.getenv("BUNKER_HOST_GRACE", "60"))
+    TURN_TIMEOUT = float(os.getenv("BUNKER_TURN_TIMEOUT", "120"))
+    RECONNECT_WINDOW = float(os.getenv("BUNKER_RECONNECT_WINDOW", "90"))
+    TIMER_TICK = float(os.getenv("BUNKER_TIMER_TICK", "0.25"))
+    # Окно склейки рассылок комнате, секунды (0 — каждое изменение сразу)
+    BROADCAST_WINDOW = float(os.getenv("BUNKER_BROADCAST_WINDOW", "0.04"))
 
 
 class DevConfig(BaseConfig):
     DEBUG = True
+    LOG_LEVEL = os.getenv("BUNKER_LOG_LEVEL", "INFO")
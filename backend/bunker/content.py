@@ -0,0 +1,41 @@
+"""HTTP-раздача манифеста статического контента.
+
+::
+
+    GET /content/manifest            → манифест, ETag = версия, no-cache
+    GET /content/manifest?v=<версия> → то же, кэшируется навсегда
+
+Клиент берет версию из снимка (``phase2.content_version``): адрес с
+``?v=`` меняется только вместе с контентом, поэтому его можно кэшировать
+как immutable; без версии ответ перепроверяется по ``If-None-Match``.
+"""
+
+from __future__ import annotations
+
+from flask import Blueprint, Flask, Response, current_app, request
+
+from bunker.domain.phase2.manifest import ContentManifest
+
+__all__ = ("content", "init_content")
+
+EXTENSION = "bunker.content"
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+content = Blueprint("content", __name__)
+
+
+def init_content(app: Flask, manifest: ContentManifest) -> None:
+    app.extensions[EXTENSION] = manifest
+    app.register_blueprint(content)
+
+
+@content.get("/content/manifest")
+def get_manifest():
+    manifest: ContentManifest = current_app.extensions[EXTENSION]
+    response = Response(manifest.body, mimetype="application/json")
+    response.set_etag(manifest.version)
+    if request.args.get("v") == manifest.version:
+        response.headers["Cache-Control"] = IMMUTABLE
+    else:
+        response.headers["Cache-Control"] = "public, no-cache"
+    return response.make_conditional(request)
@@ -0,0 +1,123 @@
+"""Скомпилированный пакет игрового контента.
+
+YAML из ``data/`` разбирается и проверяется один раз, результат (готовые
+записи + сырые данные) пишется рядом в ``.content.pack``. Следующие запуски
+читают пакет, если у исходников не изменились mtime/размер; если изменились —
+сверяется хэш содержимого, и пакет пересобирается только при его смене.
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from bunker.core.logs import get_logger
+
+__all__ = ("PACK_VERSION", "PACK_NAME", "content_hash", "load_pack")
+
+log = get_logger(__name__)
+
+# Поднимать при изменении формата записей (полей dataclass-ов и т.п.)
+PACK_VERSION = 3
+PACK_NAME = ".content.pack"
+
+Stats = Dict[str, Tuple[int, int]]
+
+
+def _stats(files: Iterable[Path]) -> Stats:
+    result = {}
+    for path in files:
+        st = path.stat()
+        result[path.name] = (st.st_mtime_ns, st.st_size)
+    return result
+
+
+def content_hash(files: Iterable[Path]) -> str:
+    """Хэш версии формата и содержимого исходников"""
+    digest = hashlib.sha256(f"bunker-pack:{PACK_VERSION}".encode())
+    for path in sorted(files, key=lambda p: p.name):
+        digest.update(path.name.encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _read_pack(pack_path: Path) -> Tuple[Optional[dict], Optional[Any]]:
+    """Заголовок и байты содержимого (None, если пакета нет или он устарел)"""
+    try:
+        f = pack_path.open("rb")
+    except OSError:
+        return None, None
+    with f:
+        try:
+            header = pickle.load(f)
+            if header.get("version") != PACK_VERSION:
+                return header, None
+            return header, f.read()
+        except Exception:
+            log.warning("Content pack %s is corrupted, rebuilding", pack_path)
+            return None, None
+
+
+def _unpickle(payload: bytes, pack_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return pickle.loads(payload)
+    except Exception:
+        log.warning("Content pack %s is corrupted, rebuilding", pack_path)
+        return None
+
+
+def _write_pack(pack_path: Path, header: dict, payload: bytes) -> None:
+    # атомарно: пишем во временный файл и подменяем
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=pack_path.parent, prefix=PACK_NAME)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.write(payload)
+        os.replace(tmp, pack_path)
+    except OSError as e:
+        if tmp and os.path.exists(tmp):
+            os.unlink(tmp)
+        # каталог данных может быть только для чтения — работаем без пакета
+        log.warning("Cannot write content pack %s: %s", pack_path, e)
+
+
+def load_pack(
+    root: Path | str,
+    files: Iterable[str],
+    build: Callable[[Path], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Содержимое пакета для ``root``; при устаревании собирается ``build(root)``"""
+    root = Path(root)
+    sources = [root / name for name in files]
+    pack_path = root / PACK_NAME
+    stats = _stats(sources)
+
+    digest = None
+    header, payload = _read_pack(pack_path)
+    if payload is not None:
+        fresh = header.get("stats") == stats
+        digest = None if fresh else content_hash(sources)
+        if fresh or header.get("hash") == digest:
+            content = _unpickle(payload, pack_path)
+            if content is not None:
+                if not fresh:
+                    # файлы тронули, но содержимое прежнее — обновляем mtime
+                    _write_pack(pack_path, {**header, "stats": stats}, payload)
+                return content
+
+    digest = digest or content_hash(sources)
+    log.info("Compiling content pack for %s", root)
+    content = build(root)
+    payload = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+    _write_pack(
+        pack_path,
+        {"version": PACK_VERSION, "hash": digest, "stats": stats},
+        payload,
+    )
+    return content
@@ -11,7 +11,9 @@ from bunker.domain.models.phase2_models import (
     Phase2Config,
     MiniGameDef,
 )
-from bunker.domain.models.status_models import StatusDef
+from bunker.domain.models.status_models import StatusDef, index_action_modifiers
+from bunker.domain.phase2.requirements import compile_requirement
+from bunker.core.content_pack import load_pack
 
 LOAD_MAP: dict[str, Callable[[Any], Any]] = {
     "professions": Trait.from_raw,
@@ -40,32 +42,60 @@ def load_any(path: Path) -> list[Any]:
         return yaml.safe_load(f) if path.suffix in {".yml", ".yaml"} else json.load(f)
 
 
+# коллекции, которые хранятся словарями по ключу .id
+DICT_COLLECTIONS = {
+    "bunker_objects",
+    "phase2_actions",
+    "phase2_crises",
+    "mini_games",
+    "statuses",
+}
+
+
+def compile_content(root: Path) -> dict[str, Any]:
+    """Разобрать и проверить все YAML: готовые коллекции + сырые данные"""
+    collections: dict[str, Any] = {}
+    raw_data: dict[str, Any] = {}
+
+    for name, factory in LOAD_MAP.items():
+        raw = load_any(root / BASE_FILES[name])
+        raw_data[name] = raw
+
+        # ← ИСПРАВЛЕНИЕ для phase2_config (это не список)
+        if name == "phase2_config":
+            collections[name] = factory(raw)
+            continue
+
+        if not isinstance(raw, list):
+            raise TypeError(f"{BASE_FILES[name]} must contain a list of records")
+        records = [factory(rec) for rec in raw]
+
+        if name in DICT_COLLECTIONS:
+            # словари по ключу .id
+            collections[name] = {r.id: r for r in records}
+        else:
+            # просто список (professions, hobbies, etc)
+            collections[name] = records
+
+    return {"collections": collections, "raw": raw_data}
+
+
+def load_raw(root: Path | str) -> dict[str, Any]:
+    """Сырые данные всех файлов по имени (пакет читается один раз)"""
+    return load_pack(root, BASE_FILES.values(), compile_content)["raw"]
+
+
 class GameData:
     def __init__(self, root: Path | str):
         root = Path(root)
 
-        for name, factory in LOAD_MAP.items():
-            raw = load_any(root / BASE_FILES[name])
-
-            # ← ИСПРАВЛЕНИЕ для phase2_config (это не список)
-            if name == "phase2_config":
-                setattr(self, name, factory(raw))
-                continue
-
-            records = [factory(rec) for rec in raw]
-
-            # ← ЧЕТКО ОПРЕДЕЛЯЕМ какие коллекции должны быть словарями
-            dict_collections = {
-                "bunker_objects",
-                "phase2_actions",
-                "phase2_crises",
-                "mini_games",
-                "statuses",
-            }
-
-            if name in dict_collections:
-                # словари по ключу .id
-                setattr(self, name, {r.id: r for r in records})
-            else:
-                # просто список (professions, hobbies, etc)
-                setattr(self, name, records)
+        # YAML разбирается один раз; дальше записи читаются из .content.pack
+        content = load_pack(root, BASE_FILES.values(), compile_content)
+        for name, value in content["collections"].items():
+            setattr(self, name, value)
+
+        # требования действий компилируем один раз на загрузку
+        for action in self.phase2_actions.values():
+            action.compiled_requirements = compile_requirement(action.requirements)
+        # action_id → [(status_id, ActionModifier)] для StatusManager
+        self.status_action_modifiers = index_action_modifiers(self.statuses)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+__all__ = (
+    "get_logger",
+    "configure_logging",
+    "parse_levels",
+    "JsonLinesFormatter",
+)
+
+ROOT_LOGGER = "bunker"
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# атрибуты, которые есть у любой LogRecord; всё остальное пришло через extra=
+_RECORD_ATTRS = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+    "message",
+    "asctime",
+}
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Логгер модуля; вызывать как ``get_logger(__name__)``.
+
+    Сообщения передаются шаблоном с аргументами (``log.debug("x=%s", x)``):
+    строка собирается только если уровень включен.
+    """
+    return logging.getLogger(name)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Одна запись — одна JSON-строка (для агрегации логов)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.msg if isinstance(record.msg, str) else repr(record.msg),
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def parse_levels(spec: str | None) -> Dict[str, str]:
+    """``"bunker.sockets=DEBUG,bunker.domain.phase2=INFO"`` → словарь уровней"""
+    levels: Dict[str, str] = {}
+    for item in (spec or "").split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(
+    level: str | int | None = None,
+    module_levels: Optional[Mapping[str, str | int]] = None,
+    json_path: str | Path | None = None,
+    stream=None,
+) -> logging.Logger:
+    """Настроить логгеры пакета ``bunker``.
+
+    Значения по умолчанию берутся из окружения: ``BUNKER_LOG_LEVEL``,
+    ``BUNKER_LOG_LEVELS`` (уровни модулей через запятую) и ``BUNKER_LOG_JSON``
+    (путь к файлу JSON-lines). Выключенные уровни отсекаются в ``isEnabledFor``
+    до форматирования сообщения.
+    """
+    level = level or os.getenv("BUNKER_LOG_LEVEL", "WARNING")
+    levels = parse_levels(os.getenv("BUNKER_LOG_LEVELS"))
+    levels.update(module_levels or {})
+    json_path = json_path or os.getenv("BUNKER_LOG_JSON")
+
+    root = logging.getLogger(ROOT_LOGGER)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    text_handler = logging.StreamHandler(stream or sys.stderr)
+    text_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    root.addHandler(text_handler)
+
+    if json_path:
+        json_handler = logging.FileHandler(json_path, encoding="utf-8")
+        json_handler.setFormatter(JsonLinesFormatter())
+        root.addHandler(json_handler)
+
+    root.setLevel(level)
+    root.propagate = False
+    for name, module_level in levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    return root
@@ -0,0 +1,84 @@
+"""Шардирование комнат по процессам.
+
+Партия живет в одном воркере — том, которому ее id достается по
+``shard_for``. Хэш детерминированный (crc32, а не ``hash()``), поэтому
+роутер, любой воркер и клиент считают владельца одинаково. Новую партию
+воркер создает сразу со «своим» id, так что переносить движки не нужно.
+"""
+
+from __future__ import annotations
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Optional, Sequence, Tuple
+
+__all__ = ("shard_for", "ShardMap", "parse_urls")
+
+
+def shard_for(game_id: str, count: int) -> int:
+    """Номер воркера-владельца партии"""
+    if count <= 1:
+        return 0
+    return zlib.crc32(game_id.encode()) % count
+
+
+@dataclass(frozen=True, slots=True)
+class ShardMap:
+    """Этот воркер (``index``) среди ``count`` шардов и их адреса"""
+
+    index: int = 0
+    count: int = 1
+    urls: Tuple[str, ...] = field(default=())
+
+    def __post_init__(self):
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"Bad shard {self.index} of {self.count}")
+        if self.urls and len(self.urls) != self.count:
+            raise ValueError(f"Expected {self.count} shard urls, got {len(self.urls)}")
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "ShardMap":
+        return cls(
+            index=config.get("SHARD_INDEX", 0),
+            count=config.get("SHARD_COUNT", 1),
+            urls=tuple(config.get("SHARD_URLS") or ()),
+        )
+
+    @property
+    def sharded(self) -> bool:
+        return self.count > 1
+
+    def owner(self, game_id: str) -> int:
+        return shard_for(game_id, self.count)
+
+    def owns(self, game_id: str) -> bool:
+        return self.owner(game_id) == self.index
+
+    def url_for(self, game_id: str) -> Optional[str]:
+        return self.urls[self.owner(game_id)] if self.urls else None
+
+    def new_game_id(self, generate: Callable[[], str]) -> str:
+        """Id новой партии, которая достанется этому воркеру.
+
+        В среднем ``count`` попыток генератора.
+        """
+        while True:
+            game_id = generate()
+            if self.owns(game_id):
+                return game_id
+
+    def route(self, game_id: str) -> dict:
+        """Куда подключаться клиенту партии ``game_id``"""
+        return {
+            "id": game_id,
+            "shard": self.owner(game_id),
+            "url": self.url_for(game_id),
+        }
+
+
+def parse_urls(value: str | Sequence[str] | None) -> Tuple[str, ...]:
+    """``"http://a:5001,http://a:5002"`` → кортеж адресов"""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(url.strip().rstrip("/") for url in value if url.strip())
@@ -0,0 +1,137 @@
+"""Таймеры сервера: одно хешированное колесо на процесс.
+
+Колесо — ``slots`` ячеек по ``tick`` секунд. Таймер кладется в ячейку
+``(текущая + задержка/tick) % slots`` со счетчиком оборотов для задержек
+длиннее одного оборота; постановка и отмена — O(1), каждый тик смотрит
+только одну ячейку. Крутит колесо одна фоновая задача (``run_forever``,
+под eventlet — green-поток), поэтому тысячи таймеров не создают ни одного
+потока ОС.
+
+Таймеры с ключом (``set(key, …)``) заменяют предыдущий с тем же ключом:
+так удобно держать «один таймер хоста на партию» без ручного учета.
+"""
+
+from __future__ import annotations
+import itertools
+import math
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from bunker.core.logs import get_logger
+
+__all__ = ("Timer", "TimerWheel")
+
+log = get_logger(__name__)
+
+
+class Timer:
+    __slots__ = ("id", "key", "slot", "rounds", "callback", "args", "cancelled")
+
+    def __init__(self, id_, key, slot, rounds, callback, args) -> None:
+        self.id = id_
+        self.key = key
+        self.slot = slot
+        self.rounds = rounds
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+class TimerWheel:
+    """Хешированное колесо таймеров с точностью ``tick`` секунд."""
+
+    def __init__(
+        self,
+        tick: float = 0.25,
+        slots: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.tick = tick
+        self.clock = clock
+        self._slots: List[Dict[int, Timer]] = [{} for _ in range(slots)]
+        self._keys: Dict[Hashable, Timer] = {}
+        self._ids = itertools.count()
+        self._cursor = 0  # ячейка, которую обработает следующий тик
+        self._next_tick = clock() + tick
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(
+        self, delay: float, callback: Callable[..., Any], *args, key: Hashable = None
+    ) -> Timer:
+        """Вызвать ``callback(*args)`` через ``delay`` секунд (с точностью тика)"""
+        if key is not None:
+            self.cancel(key)
+        # ячейка курсора сработает в момент ``_next_tick``, каждая следующая —
+        # на тик позже: берем первую, что не раньше ``now + delay``
+        lag = self.clock() + delay - self._next_tick
+        ticks = max(math.ceil(lag / self.tick), 0)
+        rounds, offset = divmod(ticks, len(self._slots))
+        slot = (self._cursor + offset) % len(self._slots)
+        timer = Timer(next(self._ids), key, slot, rounds, callback, args)
+        self._slots[slot][timer.id] = timer
+        if key is not None:
+            self._keys[key] = timer
+        self._count += 1
+        return timer
+
+    def set(self, key: Hashable, delay: float, callback: Callable[..., Any], *args):
+        """``schedule`` с ключом: прежний таймер с тем же ключом отменяется"""
+        return self.schedule(delay, callback, *args, key=key)
+
+    def cancel(self, timer: Timer | Hashable) -> bool:
+        """Отменить таймер (объект или ключ); False — его уже нет"""
+        if not isinstance(timer, Timer):
+            timer = self._keys.get(timer)
+            if timer is None:
+                return False
+        if timer.cancelled or self._slots[timer.slot].pop(timer.id, None) is None:
+            return False
+        timer.cancelled = True
+        self._forget_key(timer)
+        self._count -= 1
+        return True
+
+    def pending(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """Прокрутить колесо до ``now``; вернуть число сработавших таймеров"""
+        now = self.clock() if now is None else now
+        fired = 0
+        while self._next_tick <= now:
+            fired += self._fire_slot()
+            self._next_tick += self.tick
+        return fired
+
+    def run_forever(self, sleep: Callable[[float], Any]) -> None:
+        """Цикл фоновой задачи колеса"""
+        while True:
+            self.advance()
+            sleep(max(self._next_tick - self.clock(), 0.0))
+
+    # ───────────────── Internals ───────────────────────────────────
+    def _fire_slot(self) -> int:
+        bucket = self._slots[self._cursor]
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        due = []
+        for timer in list(bucket.values()):
+            if timer.rounds:
+                timer.rounds -= 1
+                continue
+            del bucket[timer.id]
+            self._forget_key(timer)
+            self._count -= 1
+            due.append(timer)
+        for timer in due:
+            try:
+                timer.callback(*timer.args)
+            except Exception:
+                log.exception("Timer %s failed", timer.key or timer.callback)
+        return len(due)
+
+    def _forget_key(self, timer: Timer) -> None:
+        if timer.key is not None and self._keys.get(timer.key) is timer:
+            del self._keys[timer.key]
@@ -5,8 +5,13 @@ from collections import Counter
 
 from bunker.domain.types import GamePhase, ActionType, GameAction
 from bunker.domain.phase2.phase2_engine import Phase2Engine
+from bunker.domain.phase2.manifest import content_manifest
 from bunker.domain.phase2.types import CrisisResult
+from bunker.domain.models.stats import STATS
 from bunker.core.loader import GameData
+from bunker.core.logs import get_logger
+
+log = get_logger(__name__)
 
 
 class GameEngine:
@@ -21,9 +26,39 @@ class GameEngine:
         # Phase2 engine
         self._phase2_engine: Optional[Phase2Engine] = None
 
+    @property
+    def phase(self) -> GamePhase:
+        return self._phase
+
+    def checkpoint_state(self) -> Dict[str, Any]:
+        """Всё, что нужно для восстановления движка: Game + состояние фаз"""
+        return {
+            "game": self.game,
+            "phase": self._phase.name,
+            "phase2": (
+                self._phase2_engine.export_state() if self._phase2_engine else None
+            ),
+        }
+
+    @classmethod
+    def restore(
+        cls, state: Dict[str, Any], initializer, game_data: GameData = None
+    ) -> "GameEngine":
+        """Движок из ``checkpoint_state`` (после распаковки)"""
+        engine = cls(state["game"], initializer, game_data)
+        engine._phase = GamePhase[state["phase"]]
+        if state["phase2"] is not None:
+            engine._phase2_engine = Phase2Engine(engine.game, game_data)
+            engine._phase2_engine.restore_state(state["phase2"])
+        return engine
+
     def execute(self, action: GameAction) -> None:
         """Выполнить игровое действие"""
-        if not self._can_execute_action(action):
+        if action.type == ActionType.TURN_TIMEOUT:
+            # системное действие таймера: в available_actions его нет
+            if self._phase != GamePhase.PHASE2:
+                raise ValueError(f"Cannot execute {action.type} in {self._phase}")
+        elif not self._can_execute_action(action):
             raise ValueError(f"Cannot execute {action.type} in {self._phase}")
 
         # Диспетчеризация по фазам
@@ -39,7 +74,26 @@ class GameEngine:
             self._execute_phase2_action(action)
 
     def view(self) -> Dict[str, Any]:
-        """Получить представление игры"""
+        """Получить представление игры (публичная база + действия текущего игрока)"""
+        return self.full_view(self.public_view())
+
+    def full_view(self, public: Dict[str, Any]) -> Dict[str, Any]:
+        """``view()`` поверх готовой публичной базы; ``public`` не меняется"""
+        data = dict(public)
+        if data.get("phase2"):
+            current_player = data["phase2"].get("current_player")
+            data["phase2"] = {
+                **data["phase2"],
+                "available_actions": (
+                    self._get_phase2_player_actions(current_player)
+                    if current_player
+                    else []
+                ),
+            }
+        return data
+
+    def public_view(self) -> Dict[str, Any]:
+        """Общая для всей комнаты часть снимка — без скрытых черт и личных действий"""
         data = self.game.to_dict()
         data["phase"] = self._phase.name.lower()
         data["available_actions"] = self._get_available_actions()
@@ -60,6 +114,34 @@ class GameEngine:
 
         return data
 
+    def player_overlay(self, player_id: str) -> Dict[str, Any]:
+        """Личная надбавка игрока: свои черты и свои действия Phase2"""
+        character = self.game.characters.get(player_id)
+        overlay = {
+            "player_id": player_id,
+            "character": character.to_owner_dict() if character else None,
+            "phase2_available_actions": [],
+        }
+        if (
+            self._phase == GamePhase.PHASE2
+            and self._phase2_engine
+            and self._phase2_engine.get_current_player() == player_id
+        ):
+            overlay["phase2_available_actions"] = self._get_phase2_player_actions(
+                player_id
+            )
+        return overlay
+
+    def host_overlay(self) -> Dict[str, Any]:
+        """Поля, которые видит только ведущий"""
+        return {
+            "player_id": self.game.host.id,
+            "characters": {
+                pid: c.to_owner_dict() for pid, c in self.game.characters.items()
+            },
+            "votes": dict(self.game.votes),
+        }
+
     def _execute_phase1_action(self, action: GameAction) -> None:
         """Выполнить действие Phase1"""
         if action.type == ActionType.START_GAME:
@@ -80,7 +162,7 @@ class GameEngine:
         if not self._phase2_engine:
             raise ValueError("Phase2 engine not initialized")
 
-        print(f"\n=== Executing Phase2 action: {action.type} ===")
+        log.debug("Executing Phase2 action: %s", action.type)
 
         if action.type == ActionType.MAKE_ACTION:
             self._phase2_player_action(action.payload)
@@ -90,9 +172,11 @@ class GameEngine:
             self._phase2_resolve_crisis(action.payload)
         elif action.type == ActionType.FINISH_TEAM_TURN:
             self._phase2_finish_team_turn()
+        elif action.type == ActionType.TURN_TIMEOUT:
+            self._phase2_turn_timeout(action.payload or {})
 
         # ВАЖНО: Проверяем победу после КАЖДОГО действия
-        print("Checking victory conditions after action...")
+        log.debug("Checking victory conditions after action...")
         self._check_phase2_victory()
 
     # ======== Phase1 методы ========
@@ -175,8 +259,10 @@ class GameEngine:
             self.game.team_in_bunker = alive
             self.game.team_outside = eliminated
 
-        print(
-            f"Phase2 teams - Bunker: {list(self.game.team_in_bunker)}, Outside: {list(self.game.team_outside)}"
+        log.debug(
+            "Phase2 teams - Bunker: %s, Outside: %s",
+            list(self.game.team_in_bunker),
+            list(self.game.team_outside),
         )
 
         # Инициализируем движок Phase2
@@ -241,22 +327,49 @@ class GameEngine:
         # Проверяем завершение игры
         self._check_phase2_victory()
 
+    def _phase2_turn_timeout(self, payload: Dict[str, Any]):
+        """Истек срок хода команды (или окно переподключения игрока).
+
+        ``team``/``round`` — чей ход имел в виду таймер: если ход уже сменился,
+        таймер устарел. С ``player_id`` пропускается только этот игрок (если
+        сейчас его очередь), без — все, кто не успел выбрать; если после этого
+        обрабатывать нечего, ход команды завершается.
+        """
+        p2 = self._phase2_engine
+        if (
+            payload.get("team") != self.game.phase2_current_team
+            or payload.get("round") != self.game.phase2_round
+        ):
+            raise ValueError("Turn is already over")
+
+        player_id = payload.get("player_id")
+        p2.skip_turn(player_id)
+        if (
+            not player_id
+            and p2.is_team_turn_complete()
+            and not p2.can_process_actions()
+            and not p2.get_current_crisis()
+        ):
+            p2.finish_team_turn()
+
     def _check_phase2_victory(self):
         """Проверить условия победы в Phase2"""
         if not self._phase2_engine:
             return
 
-        print(f"Current phase before victory check: {self._phase}")
+        log.debug("Current phase before victory check: %s", self._phase)
         victory_condition = self._phase2_engine.check_victory_conditions()
 
         if victory_condition:
-            print(
-                f"VICTORY CONDITION MET: {victory_condition}, winner: {self.game.winner}"
+            log.info(
+                "VICTORY CONDITION MET: %s, winner: %s",
+                victory_condition,
+                self.game.winner,
             )
-            print(f"Changing phase from {self._phase} to FINISHED")
+            log.debug("Changing phase from %s to FINISHED", self._phase)
             self._phase = GamePhase.FINISHED
         else:
-            print("No victory condition met, continuing game...")
+            log.debug("No victory condition met, continuing game...")
 
     # ======== Вспомогательные методы ========
     def _get_current_turn_info(self) -> Dict[str, Any]:
@@ -277,67 +390,21 @@ class GameEngine:
             return {"phase2": {}}
 
         current_player = self._phase2_engine.get_current_player()
-        available_actions = []
-
-        # Получаем доступные действия
-        if current_player:
-            actions = self._phase2_engine.get_available_actions_for_player(
-                current_player
-            )
-            for action in actions:
-                status_mods = self._phase2_engine._status_manager.get_action_modifiers(
-                    action.id
-                )
-
-                action_data = {
-                    "id": action.id,
-                    "name": action.name,
-                    "difficulty": action.difficulty,
-                    "stat_weights": action.stat_weights,
-                }
 
-                if status_mods["blocked"]:
-                    action_data["blocked"] = True
-                    action_data["blocking_statuses"] = status_mods["blocking_statuses"]
-                elif status_mods["difficulty_modifier"] != 0:
-                    action_data["modified_difficulty"] = (
-                        action.difficulty + status_mods["difficulty_modifier"]
-                    )
-                    action_data["difficulty_modifier"] = status_mods[
-                        "difficulty_modifier"
-                    ]
-
-                if status_mods["effectiveness"] != 1.0:
-                    action_data["effectiveness_modifier"] = status_mods["effectiveness"]
-
-                available_actions.append(action_data)
-
-        # Получаем кризис
+        # Получаем кризис: название, описание и правила мини-игры — в манифесте
         crisis = self._phase2_engine.get_current_crisis()
         crisis_data = None
         if crisis:
-            mini_game_data = None
-            if crisis.mini_game:
-                mini_game_data = {
-                    "id": crisis.mini_game.mini_game_id,
-                    "name": crisis.mini_game.name,
-                    "rules": crisis.mini_game.rules,
-                }
-
             crisis_data = {
                 "id": crisis.crisis_id,
-                "name": crisis.name,
-                "description": crisis.description,
-                "important_stats": crisis.important_stats,
                 "team_advantages": crisis.team_advantages,
-                "mini_game": mini_game_data,
+                "mini_game": (
+                    {"id": crisis.mini_game.mini_game_id} if crisis.mini_game else None
+                ),
             }
 
         next_action = self._phase2_engine.get_next_action_to_process()
 
-        # ← НОВОЕ: Детальная история действий
-        detailed_history = self._phase2_engine.get_detailed_action_history()
-
         # ← НОВОЕ: Предварительный расчет для текущего действия
         action_preview = None
         if next_action:
@@ -359,7 +426,7 @@ class GameEngine:
             team_debuffs[team] = [
                 {
                     "name": d.name,
-                    "stat_penalties": d.stat_penalties,
+                    "stat_penalties": STATS.nonzero(d.stat_penalties),
                     "remaining_rounds": d.remaining_rounds,
                     "source": d.source,
                 }
@@ -371,12 +438,10 @@ class GameEngine:
             active_phobias[player_id] = {
                 "phobia_name": phobia.phobia_name,
                 "trigger_source": phobia.trigger_source,
-                "affected_stats": phobia.affected_stats,
+                "affected_stats": STATS.nonzero(phobia.affected_stats),
             }
 
-        active_statuses_full = (
-            self._phase2_engine._status_manager.get_statuses_for_api()
-        )
+        active_statuses = self._phase2_engine._status_manager.get_active_statuses()
 
         return {
             "phase2": {
@@ -388,7 +453,6 @@ class GameEngine:
                 "supplies_countdown": self.game.phase2_supplies_countdown,
                 "morale_countdown": self.game.phase2_morale_countdown,
                 "current_player": current_player,
-                "available_actions": available_actions,
                 "action_queue": self.game.phase2_action_queue,
                 "current_action": next_action,
                 "action_preview": action_preview,  # ← НОВОЕ
@@ -398,21 +462,27 @@ class GameEngine:
                 "team_stats": self.game.phase2_team_stats,
                 "team_debuffs": team_debuffs,
                 "active_phobias": active_phobias,
-                "active_statuses": active_statuses_full,
+                "active_statuses": active_statuses,
                 "bunker_objects": bunker_objects,
-                "action_log": self.game.phase2_action_log,  # общая история
-                "detailed_history": detailed_history,  # ← НОВОЕ: детальная история
+                # сама история — отдельным запросом (get_action_history)
+                "history_head": self._phase2_engine.get_history_heads(),
                 "winner": self.game.winner,
+                # статические определения — GET /content/manifest по этой версии
+                "content_version": content_manifest(self._game_data).version,
             }
         }
 
+    def _get_phase2_player_actions(self, player_id: str) -> List[Dict[str, Any]]:
+        """Доступные игроку действия Phase2 с модификаторами статусов"""
+        return self._phase2_engine.get_player_action_table(player_id)
+
     def _is_last_player(self) -> bool:
         return self.game.current_idx >= len(self.game.turn_order) - 1
 
     def _can_execute_action(self, action: GameAction) -> bool:
         """Проверить можно ли выполнить действие"""
         available = self._get_available_actions()
-        print(f"Available actions: {available}")
+        log.debug("Available actions: %s", available)
         return action.type.name.lower() in available
 
     def _get_available_actions(self) -> List[str]:
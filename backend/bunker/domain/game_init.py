@@ -32,15 +32,22 @@ PLURAL_MAP = {
 
 
 class GameInitializer:
+    """Раздача персонажей и карт бункера.
+
+    Без явного ``rng`` броски идут из потока самой партии (``game.rng``),
+    так что один инициализатор можно делить между партиями.
+    """
+
     def __init__(self, data: GameData, rng: random.Random | None = None):
         self._data = data
-        self._rng = rng or random.Random()
+        self._fixed_rng = rng
 
     def setup_new_game(self, game: Game) -> None:
-        self._assign_characters(game)
-        self._assign_bunker_cards(game)
+        rng = self._fixed_rng or game.rng
+        self._assign_characters(game, rng)
+        self._assign_bunker_cards(game, rng)
 
-    def _assign_characters(self, game: Game) -> None:
+    def _assign_characters(self, game: Game, rng: random.Random) -> None:
         n = len(game.players)
         pools = {}
 
@@ -58,7 +65,7 @@ class GameInitializer:
                     f"Pool '{attr}' has only {len(pool)} entries, need {n}"
                 )
 
-        sampled = {attr: self._rng.sample(pool, k=n) for attr, pool in pools.items()}
+        sampled = {attr: rng.sample(pool, k=n) for attr, pool in pools.items()}
 
         templates: List[dict[str, Trait]] = []
         for i in range(n):
@@ -66,14 +73,14 @@ class GameInitializer:
             templates.append(tpl)
 
         # ← ИСПРАВЛЕНИЕ: код должен быть ВНУТРИ метода с правильным отступом
-        self._rng.shuffle(templates)
+        rng.shuffle(templates)
         for pid, tpl in zip(game.players, templates):
             game.characters[pid] = Character(traits=tpl)
 
-    def _assign_bunker_cards(self, game: Game) -> None:
+    def _assign_bunker_cards(self, game: Game, rng: random.Random) -> None:
         # ← ИСПРАВЛЕНИЕ: берем значения из словаря
         cards = list(self._data.bunker_objects.values())
         if len(cards) < 5:
             raise ValueError("Need at least 5 bunker objects")
-        game.bunker_cards = self._rng.sample(cards, k=5)
+        game.bunker_cards = rng.sample(cards, k=5)
         game.bunker_reveal_idx = 0
@@ -2,6 +2,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Any
 
+from bunker.domain.models.stats import STATS, StatVector
+
 __all__ = ("BunkerObject",)
 
 
@@ -16,6 +18,10 @@ class BunkerObject:
     trait_bonuses: Dict[str, Dict[str, float]] = field(
         default_factory=dict
     )  # ← ОБНОВЛЕНО
+    base_vector: StatVector = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.base_vector = STATS.vector(self.base_bonus)
 
     @classmethod
     def from_raw(cls, raw: Any) -> "BunkerObject":
@@ -1,61 +1,110 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
+from bunker.domain.models.stats import STATS, StatVector
 from bunker.domain.models.traits import Trait
 
-__all__ = ("Character",)
+__all__ = ("Character", "stat_profile")
+
+# Раскладка битов раскрытия по набору черт: общая для всех персонажей
+# с одинаковым порядком атрибутов (на практике — одна на процесс)
+_layouts: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Dict[str, int]]] = {}
+
+
+def _layout(order: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    layout = _layouts.get(order)
+    if layout is None:
+        layout = _layouts[order] = (order, {a: 1 << i for i, a in enumerate(order)})
+    return layout
 
 
 @dataclass(slots=True)
 class Character:
+    """Персонаж игрока: общие flyweight-черты и свое состояние раскрытия.
+
+    Раскрытие — битовая маска по ``reveal_order``; порядок раскрытия и
+    суммарные статы считаются один раз при создании, поэтому набор черт
+    персонажа после создания не меняется. Статы хранятся вектором в порядке
+    ``STATS``; ``stat_mask`` — какие статы вообще заданы чертами персонажа.
+    """
+
     traits: Dict[str, Trait]
-    revealed: List[str] = field(default_factory=list)
+    revealed_mask: int = 0
+    reveal_order: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    stat_mask: int = field(init=False, repr=False, compare=False)
+    _bits: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _stats: StatVector = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._index()
+
+    def _index(self) -> None:
+        self.reveal_order, self._bits = _layout(tuple(self.traits))
+        adds = [getattr(tr, "add", {}) for tr in self.traits.values()]
+        self._stats = STATS.sum(adds)
+        self.stat_mask = STATS.mask(code for add in adds for code in add)
 
     def reveal(self, attr: str) -> None:
-        if attr in self.traits and attr not in self.revealed:
-            self.revealed.append(attr)
-            self.traits[attr].revealed = True
+        self.revealed_mask |= self._bits.get(attr, 0)
 
     def is_revealed(self, attr: str) -> bool:
-        return attr in self.revealed
+        return bool(self.revealed_mask & self._bits.get(attr, 0))
+
+    @property
+    def revealed(self) -> List[str]:
+        return [a for a in self.reveal_order if self.revealed_mask & self._bits[a]]
 
-    def to_public_dict(self) -> Dict[str, str | None]:
+    def to_public_dict(self) -> Dict[str, Dict[str, Any] | None]:
+        """Видимое всей комнате: нераскрытые черты скрыты (None)."""
+        mask = self.revealed_mask
         return {
             attr: (
-                self.traits[attr].to_dict()
-                if attr in self.revealed
-                else self.traits[attr].to_dict()
+                {**self.traits[attr].to_dict(), "revealed": True}
+                if mask & bit
+                else None
             )
-            for attr in self.reveal_order
+            for attr, bit in self._bits.items()
         }
 
-    def to_owner_dict(self) -> Dict[str, Dict[str, any]]:
-        """
-        Формирует словарь для фронта, где у каждого трейта есть поле revealed (True/False).
-        """
-        owner_view = {}
-        for attr_key in self.reveal_order:
-            if attr_key in self.traits:
-                trait_obj = self.traits[attr_key]
-                trait_dict = trait_obj.to_dict()
-                trait_dict["revealed"] = self.is_revealed(attr_key)
-                owner_view[attr_key] = trait_dict
-        return owner_view
+    def to_owner_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Свои черты целиком, у каждой — флаг revealed."""
+        mask = self.revealed_mask
+        return {
+            attr: {**self.traits[attr].to_dict(), "revealed": bool(mask & bit)}
+            for attr, bit in self._bits.items()
+        }
 
-    @property
-    def reveal_order(self) -> List[str]:
-        return list(self.traits.keys())
+    def stat_vector(self) -> StatVector:
+        return self._stats
 
     def aggregate_stats(self) -> Dict[str, int]:
-        stats = {}
-        for tr in self.traits.values():
-            for k, v in getattr(tr, "add", {}).items():
-                stats[k] = stats.get(k, 0) + v
-        return stats
+        return STATS.to_dict(self._stats, self.stat_mask)
 
     def has_tag(self, tag: str) -> bool:
         for tr in self.traits.values():
             if tag in getattr(tr, "tags", []):
                 return True
         return False
+
+    # в контрольные точки — только черты и маска; остальное пересчитывается
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"traits": self.traits, "revealed_mask": self.revealed_mask}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.traits = state["traits"]
+        self.revealed_mask = state["revealed_mask"]
+        self._index()
+
+
+def stat_profile(character: Any) -> Tuple[StatVector, int]:
+    """Вектор статов персонажа и маска заданных статов.
+
+    Персонажи без векторов (заглушки в тестах) отдают только
+    ``aggregate_stats()`` — тогда вектор собирается из словаря.
+    """
+    vector = getattr(character, "stat_vector", None)
+    if vector is not None:
+        return vector(), character.stat_mask
+    stats = character.aggregate_stats()
+    return STATS.vector(stats), STATS.mask(stats)
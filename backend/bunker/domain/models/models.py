@@ -4,24 +4,32 @@ from typing import Any, Dict, List, Set, Optional
 import random
 from uuid import uuid4
 from bunker.domain.models.character import Character
+from bunker.domain.models.stats import StatVector
+from bunker.domain.models.status_models import ActiveStatuses
 import string
 from datetime import datetime
 import uuid
 
+# Коды и сиды берутся из системной энтропии: это идентичность партии, а не
+# игровая случайность, и они не должны зависеть от глобального random.
+_entropy = random.SystemRandom()
+
 
 def _gen_player_id() -> str:
     return uuid4().hex[:8].upper()
 
 
 def _gen_game_id(k: int = 6) -> str:
-    import string
-
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=k))
+    return _gen_code(k)
 
 
 # ── helpers ─────────────────────────────────────────────────
 def _gen_code(k: int = 6) -> str:
-    return "".join(random.choices(string.ascii_uppercase + string.digits, k=k))
+    return "".join(_entropy.choices(string.ascii_uppercase + string.digits, k=k))
+
+
+def _gen_seed() -> int:
+    return _entropy.getrandbits(63)
 
 
 @dataclass(slots=True)
@@ -42,7 +50,7 @@ class DebuffEffect:
 
     effect_id: str
     name: str
-    stat_penalties: Dict[str, int]
+    stat_penalties: StatVector  # в порядке STATS
     remaining_rounds: int
     source: str  # откуда пришел дебаф
 
@@ -53,7 +61,30 @@ class PhobiaStatus:
 
     phobia_name: str
     trigger_source: str  # что вызвало фобию
-    affected_stats: Dict[str, int]  # какие статы обнулены
+    affected_stats: StatVector  # сдвиг статов до порога, в порядке STATS
+
+    @classmethod
+    def for_character(
+        cls,
+        phobia_name: str,
+        trigger_source: str,
+        stats: StatVector,
+        mask: int,
+        floor: int,
+    ) -> "PhobiaStatus":
+        """Фобия опускает каждый заданный стат персонажа до ``floor``"""
+        affected = tuple(
+            floor - value if mask >> i & 1 and value > floor else 0
+            for i, value in enumerate(stats)
+        )
+        return cls(phobia_name, trigger_source, affected)
+
+    def apply(self, stats: StatVector, mask: int, floor: int) -> StatVector:
+        """Статы персонажа под фобией (не ниже ``floor``)"""
+        return tuple(
+            max(value + penalty, floor) if penalty and mask >> i & 1 else value
+            for i, (value, penalty) in enumerate(zip(stats, self.affected_stats))
+        )
 
 
 # ───────────────── Player ─────────────────
@@ -75,8 +106,7 @@ class Player:
 
 
 def gen_code(k: int = 6) -> str:
-    alphabet = string.ascii_uppercase + string.digits
-    return "".join(random.choices(alphabet, k=k))
+    return _gen_code(k)
 
 
 # ── Game  (данные, без логики) ─────────────────────────────
@@ -84,9 +114,14 @@ def gen_code(k: int = 6) -> str:
 class Game:
     host: Player
     id: str = field(default_factory=_gen_code)
+    # Вся игровая случайность партии — из одного потока rng(seed).
+    # Состояние rng уходит в контрольные точки вместе с Game.
+    seed: int = field(default_factory=_gen_seed, repr=False)
+    rng: random.Random = field(init=False, repr=False, compare=False)
 
     status: str = "waiting"  # waiting | in_progress | finished
     phase: str = "lobby"  # кэш-поле, обновляет движок
+    state_version: int = 0  # растёт с каждым разосланным изменением снимка
 
     players: Dict[str, Player] = field(default_factory=dict)
     characters: Dict[str, Character] = field(default_factory=dict)
@@ -123,9 +158,8 @@ class Game:
     phase2_player_phobias: Dict[str, PhobiaStatus] = field(
         default_factory=dict
     )  # player_id -> phobia
-    phase2_active_statuses: List[str] = field(
-        default_factory=list
-    )  # глобальные статусы (пожар, заражение)
+    # глобальные статусы (пожар, заражение) с очередью истечения
+    phase2_active_statuses: ActiveStatuses = field(default_factory=ActiveStatuses)
 
     phase2_action_queue: List[Dict[str, Any]] = field(default_factory=list)
     phase2_processed_actions: List[Dict[str, Any]] = field(default_factory=list)
@@ -136,6 +170,9 @@ class Game:
     phase2_action_log: List[Dict[str, Any]] = field(default_factory=list)
     winner: Optional[str] = None
 
+    def __post_init__(self):
+        self.rng = random.Random(self.seed)
+
     def reset_phase2(self):
         """Очистить все phase2-поля, если понадобится рестарт."""
         self.team_in_bunker.clear()
@@ -163,7 +200,7 @@ class Game:
 
     def shuffle_turn_order(self) -> None:
         self.turn_order = self.alive_ids()
-        random.shuffle(self.turn_order)
+        self.rng.shuffle(self.turn_order)
         self.current_idx = 0
 
     def to_dict(self) -> Dict[str, Any]:
@@ -179,7 +216,8 @@ class Game:
             },
             "bunker_reveal_idx": self.bunker_reveal_idx,
             "revealed_bunker_cards": self.revealed_bunker_cards,
-            "eliminated_ids": list(self.eliminated_ids),
-            "team_in_bunker": list(self.team_in_bunker),
-            "team_outside": list(self.team_outside),
+            # sorted: порядок set зависит от PYTHONHASHSEED процесса
+            "eliminated_ids": sorted(self.eliminated_ids),
+            "team_in_bunker": sorted(self.team_in_bunker),
+            "team_outside": sorted(self.team_outside),
         }
@@ -3,6 +3,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Union
 from enum import Enum
 
+from bunker.domain.models.stats import STATS, StatVector
+
 
 @dataclass(slots=True)
 class ActionRequirement:
@@ -41,6 +43,22 @@ class Phase2ActionDef:
     mini_games: List[str] = field(default_factory=list)
     failure_crises: List[str] = field(default_factory=list)
 
+    # предикат из requirements, собирается при загрузке GameData
+    compiled_requirements: Any = field(default=None, repr=False, compare=False)
+
+    # stat_weights и stat_bonuses векторами в порядке STATS
+    weight_vector: StatVector = field(init=False, repr=False, compare=False)
+    bonus_vectors: Dict[str, Dict[str, StatVector]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.weight_vector = STATS.vector(self.stat_weights)
+        self.bonus_vectors = {
+            trait_type: {name: STATS.vector(bonus) for name, bonus in by_name.items()}
+            for trait_type, by_name in self.stat_bonuses.items()
+        }
+
     @classmethod
     def from_raw(cls, raw: Any) -> "Phase2ActionDef":
         if not isinstance(raw, dict) or "id" not in raw:
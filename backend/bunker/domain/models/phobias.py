@@ -8,7 +8,7 @@ from .traits import Trait
 __all__ = ("Phobia",)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class Phobia(Trait):
     # новые поля
     triggers: List[str] = field(default_factory=list)
@@ -23,18 +23,20 @@ class Phobia(Trait):
         чтобы не мутировать объект после создания.
         """
         if isinstance(raw, str):
-            return cls(name=raw)
+            return cls.intern(cls(name=raw))
 
         if not isinstance(raw, dict) or "name" not in raw:
             raise TypeError("Phobia must be str or mapping with a 'name' key")
 
-        return cls(
-            name=raw["name"],
-            add=raw.get("add", {}),
-            mult=raw.get("mult", {}),
-            team_mult=raw.get("team_mult", {}),
-            tags=raw.get("tags", []),
-            triggers=raw.get("triggers", []),
-            penalty=raw.get("on_trigger", {}).get("penalty", {}),
-            status=raw.get("on_trigger", {}).get("status"),
+        return cls.intern(
+            cls(
+                name=raw["name"],
+                add=raw.get("add", {}),
+                mult=raw.get("mult", {}),
+                team_mult=raw.get("team_mult", {}),
+                tags=raw.get("tags", []),
+                triggers=raw.get("triggers", []),
+                penalty=raw.get("on_trigger", {}).get("penalty", {}),
+                status=raw.get("on_trigger", {}).get("status"),
+            )
         )
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-__all__ = ["StatDef", "StatRegistry"]
+__all__ = ["StatDef", "StatRegistry", "StatVector", "STATS"]
+
+# Stat values in registry order (one slot per stat code).
+StatVector = Tuple[float, ...]
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,10 +18,18 @@ class StatDef:
 
 
 class StatRegistry:
-    """Immutable collection of StatDef objects, indexed by code."""
+    """Immutable collection of StatDef objects, indexed by code.
+
+    Every stat also has a fixed position, so stat mappings can be stored as
+    plain tuples (``StatVector``) in registry order and combined without
+    hashing string keys. Dicts are only built at the API boundary.
+    """
 
     def __init__(self, stats: List[StatDef]):
         self._stats: Dict[str, StatDef] = {s.code: s for s in stats}
+        self.codes: Tuple[str, ...] = tuple(self._stats)
+        self._index: Dict[str, int] = {c: i for i, c in enumerate(self.codes)}
+        self.zero: Tuple[int, ...] = (0,) * len(self.codes)
 
     def __getitem__(
         self, code: str
@@ -28,7 +39,83 @@ class StatRegistry:
     def __iter__(self):
         return iter(self._stats.values())
 
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def index(self, code: str) -> int:
+        return self._index[code]
+
+    def position(self, code: str) -> Optional[int]:
+        """Like ``index``, but ``None`` for unknown codes."""
+        return self._index.get(code)
+
     def validate_keys(self, mapping: Dict[str, object], *, ctx: str) -> None:
         unknown = [k for k in mapping if k not in self._stats]
         if unknown:
             raise ValueError(f"{ctx}: unknown stat keys {unknown}")
+
+    # ── vectors ────────────────────────────────────────────
+    def vector(self, mapping: Optional[Mapping[str, float]]) -> StatVector:
+        """Vector for ``mapping``; unknown codes are ignored, missing are 0."""
+        if not mapping:
+            return self.zero
+        values = list(self.zero)
+        for code, value in mapping.items():
+            i = self._index.get(code)
+            if i is not None:
+                values[i] += value
+        return tuple(values)
+
+    def sum(self, mappings: Iterable[Mapping[str, float]]) -> StatVector:
+        values = list(self.zero)
+        for mapping in mappings:
+            for code, value in mapping.items():
+                i = self._index.get(code)
+                if i is not None:
+                    values[i] += value
+        return tuple(values)
+
+    def mask(self, codes: Iterable[str]) -> int:
+        """Bitmask of the known codes in ``codes`` (bit i = stat i)."""
+        mask = 0
+        for code in codes:
+            i = self._index.get(code)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def to_dict(self, vector: StatVector, mask: int = -1) -> Dict[str, float]:
+        """Mapping for ``vector``, limited to the stats set in ``mask``."""
+        return {
+            code: value
+            for i, (code, value) in enumerate(zip(self.codes, vector))
+            if mask >> i & 1
+        }
+
+    def nonzero(self, vector: StatVector) -> Dict[str, float]:
+        return {code: value for code, value in zip(self.codes, vector) if value}
+
+    @staticmethod
+    def add(a: StatVector, b: StatVector) -> StatVector:
+        return tuple(x + y for x, y in zip(a, b))
+
+    @staticmethod
+    def dot(a: StatVector, b: StatVector) -> float:
+        # plain left-to-right sum, same order as phase2.kernel.resolve_batch
+        total = 0
+        for x, y in zip(a, b):
+            total += x * y
+        return total
+
+
+# Fixed layout of the base stats (mirrors data/stats.yml).
+STATS = StatRegistry(
+    [
+        StatDef("ЗДР", "Здоровье", "Общая физическая устойчивость"),
+        StatDef("СИЛ", "Сила", "Грубая физическая мощь"),
+        StatDef("ИНТ", "Интеллект", "Логика и знание"),
+        StatDef("ТЕХ", "Техника", "Работа с механизмами / IT"),
+        StatDef("ЭМП", "Эмпатия", "Сочувствие и психология"),
+        StatDef("ХАР", "Харизма", "Лидерство и убеждение"),
+    ]
+)
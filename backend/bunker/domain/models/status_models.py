@@ -1,6 +1,11 @@
 from __future__ import annotations
+import heapq
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from bunker.core.logs import get_logger
+from bunker.domain.models.stats import STATS, StatVector
+
+log = get_logger(__name__)
 
 __all__ = [
     "StatusDef",
@@ -12,6 +17,8 @@ __all__ = [
     "StatusInteractions",
     "StatusUI",
     "ActiveStatus",
+    "ActiveStatuses",
+    "index_action_modifiers",
 ]
 
 
@@ -145,6 +152,15 @@ class StatusEffects:
     bunker_objects: List[ObjectEffect] = field(default_factory=list)
     triggers_phobias: List[str] = field(default_factory=list)
     player_effects: List[PlayerEffect] = field(default_factory=list)
+    # team_stats векторами в порядке STATS
+    team_stat_vectors: Dict[str, StatVector] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.team_stat_vectors = {
+            team: STATS.vector(mods) for team, mods in self.team_stats.items()
+        }
 
     @classmethod
     def from_raw(cls, raw: Any) -> "StatusEffects":
@@ -205,6 +221,17 @@ class StatusDef:
         )
 
 
+def index_action_modifiers(
+    statuses: Dict[str, StatusDef],
+) -> Dict[str, List[Tuple[str, ActionModifier]]]:
+    """Обратный индекс: action_id → [(status_id, ActionModifier)]"""
+    index: Dict[str, List[Tuple[str, ActionModifier]]] = {}
+    for status_id, status_def in statuses.items():
+        for action_mod in status_def.effects.action_modifiers:
+            index.setdefault(action_mod.action_id, []).append((status_id, action_mod))
+    return index
+
+
 @dataclass(slots=True)
 class ActiveStatus:
     """Активный статус в игре"""
@@ -217,12 +244,16 @@ class ActiveStatus:
 
     def is_expired(self, current_round: int) -> bool:
         """Проверить истек ли статус"""
-        print(f"Checking expiration for {self.status_id} at round {current_round}")
+        log.debug(
+            "Checking expiration for %s at round %s", self.status_id, current_round
+        )
         if self.remaining_rounds == -1:  # until_removed
             return False
 
         rounds_passed = current_round - self.applied_at_round
-        print(f"Rounds passed: {rounds_passed}, remaining: {self.remaining_rounds}")
+        log.debug(
+            "Rounds passed: %s, remaining: %s", rounds_passed, self.remaining_rounds
+        )
         return rounds_passed > self.remaining_rounds
 
     def to_dict(self) -> Dict[str, Any]:
@@ -234,3 +265,109 @@ class ActiveStatus:
             "source": self.source,
             "enhanced_by": self.enhanced_by,
         }
+
+
+class ActiveStatuses:
+    """Активные статусы партии в порядке применения.
+
+    Словарь ``status_id → ActiveStatus`` (членство и снятие — O(1)) плюс
+    очередь истечения: корзины по раунду истечения и куча номеров раундов.
+    В конце раунда ``due`` трогает только истекающие статусы. Снаружи
+    ведет себя как прежний список id: ``in``, итерация, ``append``/``remove``.
+    """
+
+    __slots__ = ("_items", "_rank", "_buckets", "_rounds", "_seq")
+
+    def __init__(self, status_ids: Iterable[str] = ()) -> None:
+        self._items: Dict[str, ActiveStatus] = {}
+        self._rank: Dict[str, int] = {}
+        self._buckets: Dict[int, List[str]] = {}
+        self._rounds: List[int] = []
+        self._seq = 0
+        for status_id in status_ids:
+            self.append(status_id)
+
+    @staticmethod
+    def expiry_round(active: ActiveStatus) -> Optional[int]:
+        """Первый раунд, в котором ``active.is_expired`` истинно"""
+        if active.remaining_rounds == -1:
+            return None
+        return active.applied_at_round + active.remaining_rounds + 1
+
+    def add(self, active: ActiveStatus) -> None:
+        status_id = active.status_id
+        if status_id in self._items:
+            self.discard(status_id)
+        self._items[status_id] = active
+        self._rank[status_id] = self._seq
+        self._seq += 1
+        expires = self.expiry_round(active)
+        if expires is not None:
+            if expires not in self._buckets:
+                self._buckets[expires] = []
+                heapq.heappush(self._rounds, expires)
+            self._buckets[expires].append(status_id)
+
+    def append(self, status_id: str) -> None:
+        """Совместимость со списком: статус без срока и источника"""
+        if status_id not in self._items:
+            self.add(ActiveStatus(status_id=status_id, applied_at_round=0))
+
+    def discard(self, status_id: str) -> Optional[ActiveStatus]:
+        # запись в корзине истечения остается и пропускается в ``due``
+        self._rank.pop(status_id, None)
+        return self._items.pop(status_id, None)
+
+    def remove(self, status_id: str) -> None:
+        if self.discard(status_id) is None:
+            raise ValueError(f"{status_id} is not active")
+
+    def get(self, status_id: str) -> Optional[ActiveStatus]:
+        return self._items.get(status_id)
+
+    def rank(self, status_id: str) -> int:
+        """Порядковый номер применения (для стабильного порядка сложения)"""
+        return self._rank[status_id]
+
+    def due(self, current_round: int) -> List[str]:
+        """Снять с очереди и вернуть статусы, истекшие к ``current_round``"""
+        expired: List[str] = []
+        while self._rounds and self._rounds[0] <= current_round:
+            expires = heapq.heappop(self._rounds)
+            for status_id in self._buckets.pop(expires, ()):
+                active = self._items.get(status_id)
+                # статус сняли или применили заново с другим сроком
+                if active is not None and self.expiry_round(active) == expires:
+                    expired.append(status_id)
+        return expired
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._rank.clear()
+        self._buckets.clear()
+        self._rounds.clear()
+        self._seq = 0
+
+    def values(self) -> Iterator[ActiveStatus]:
+        return iter(self._items.values())
+
+    def __contains__(self, status_id: object) -> bool:
+        return status_id in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ActiveStatuses):
+            return list(self._items.items()) == list(other._items.items())
+        if isinstance(other, (list, tuple)):
+            return list(self._items) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ActiveStatuses({list(self._items)!r})"
@@ -1,40 +1,72 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, List, Tuple
 
 __all__ = ("Trait",)
 
+# Интернированные черты: одна неизменяемая запись на содержимое на процесс
+_interned: Dict[Tuple, "Trait"] = {}
 
-@dataclass(slots=True)
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(slots=True, frozen=True)
 class Trait:
+    """Черта персонажа — неизменяемый flyweight, общий для всех партий.
+
+    Раскрыта ли черта, знает персонаж (``Character``), а не сама черта.
+    """
+
     name: str
     add: Dict[str, int] = field(default_factory=dict)
     mult: Dict[str, float] = field(default_factory=dict)
     team_mult: Dict[str, float] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)
-    revealed: bool = False
 
     @classmethod
     def from_raw(cls, raw: Any) -> "Trait":
         if isinstance(raw, str):
-            return cls(name=raw)
+            return cls.intern(cls(name=raw))
         if not isinstance(raw, dict) or "name" not in raw:
             raise TypeError("Trait must be str or mapping with a 'name' key")
-        return cls(
-            name=raw["name"],
-            add=raw.get("add", {}),
-            mult=raw.get("mult", {}),
-            team_mult=raw.get("team_mult", {}),
-            tags=raw.get("tags", []),
-            revealed=raw.get("revealed", False),
+        return cls.intern(
+            cls(
+                name=raw["name"],
+                add=raw.get("add", {}),
+                mult=raw.get("mult", {}),
+                team_mult=raw.get("team_mult", {}),
+                tags=raw.get("tags", []),
+            )
         )
 
-    def to_dict(self):
+    @staticmethod
+    def intern(trait: "Trait") -> "Trait":
+        """Общий экземпляр с тем же содержимым (первый встреченный)"""
+        key = (type(trait), *(_freeze(getattr(trait, f.name)) for f in fields(trait)))
+        return _interned.setdefault(key, trait)
+
+    def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
             "add": self.add,
             "mult": self.mult,
             "team_mult": self.team_mult,
             "tags": self.tags,
-            "revealed": self.revealed,
         }
+
+    # pickle (пакет контента, контрольные точки) отдает тот же flyweight
+    def __reduce__(self):
+        return _restore, (
+            type(self),
+            tuple(getattr(self, f.name) for f in fields(self)),
+        )
+
+
+def _restore(cls, values: Tuple) -> Trait:
+    return Trait.intern(cls(*values))
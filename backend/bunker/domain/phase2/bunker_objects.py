@@ -3,6 +3,7 @@ from typing import Dict, List, Set
 from bunker.domain.models.models import Game, BunkerObjectState
 from bunker.domain.models.character import Character
 from bunker.domain.models.bunker_object import BunkerObject
+from bunker.domain.models.stats import STATS, StatVector
 
 
 class BunkerObjectBonusCalculator:
@@ -14,30 +15,40 @@ class BunkerObjectBonusCalculator:
 
     def calculate_team_bonuses(self, team_players: Set[str]) -> Dict[str, int]:
         """Рассчитать бонусы от всех рабочих объектов для команды"""
-        total_bonuses = {}
+        total_bonuses = STATS.zero
 
-        for obj_id, obj_state in self.game.phase2_bunker_objects.items():
-            if not obj_state.is_usable():  # объект поврежден
-                continue
+        for obj_id in self.game.phase2_bunker_objects:
+            total_bonuses = STATS.add(
+                total_bonuses, self.object_bonus_vector(obj_id, team_players)
+            )
 
-            if obj_id not in self.bunker_objects_data:
-                continue
+        return STATS.nonzero(total_bonuses)
 
-            obj_def = self.bunker_objects_data[obj_id]
-            obj_bonuses = self._calculate_object_bonus(obj_def, team_players)
+    def calculate_object_bonus(
+        self, obj_id: str, team_players: Set[str]
+    ) -> Dict[str, int]:
+        """Бонус одного объекта (пусто, если объект не работает или неизвестен)"""
+        return STATS.nonzero(self.object_bonus_vector(obj_id, team_players))
 
-            # Суммируем бонусы
-            for stat, bonus in obj_bonuses.items():
-                total_bonuses[stat] = total_bonuses.get(stat, 0) + bonus
+    def object_bonus_vector(self, obj_id: str, team_players: Set[str]) -> StatVector:
+        """Бонус одного объекта вектором в порядке STATS"""
+        obj_state = self.game.phase2_bunker_objects.get(obj_id)
+        if not obj_state or not obj_state.is_usable():  # объект поврежден
+            return STATS.zero
 
-        return total_bonuses
+        if obj_id not in self.bunker_objects_data:
+            return STATS.zero
+
+        return self._calculate_object_bonus(
+            self.bunker_objects_data[obj_id], team_players
+        )
 
     def _calculate_object_bonus(
         self, obj_def: BunkerObject, team_players: Set[str]
-    ) -> Dict[str, int]:
+    ) -> StatVector:
         """Рассчитать бонус от одного объекта"""
         if not obj_def.base_bonus:
-            return {}
+            return STATS.zero
 
         # Находим все уникальные черты в команде
         team_traits = self._get_team_traits(team_players)
@@ -55,11 +66,7 @@ class BunkerObjectBonusCalculator:
                     )
 
         # Применяем множитель к базовому бонусу
-        final_bonuses = {}
-        for stat, base_value in obj_def.base_bonus.items():
-            final_bonuses[stat] = int(base_value * total_multiplier)
-
-        return final_bonuses
+        return tuple(int(value * total_multiplier) for value in obj_def.base_vector)
 
     def _get_team_traits(self, team_players: Set[str]) -> Dict[str, Set[str]]:
         """Получить все уникальные черты команды"""
@@ -103,8 +110,8 @@ class BunkerObjectBonusCalculator:
 
         if obj_state.is_usable():
             # Рассчитываем текущий бонус
-            result["current_bonus"] = self._calculate_object_bonus(
-                obj_def, team_players
+            result["current_bonus"] = STATS.nonzero(
+                self._calculate_object_bonus(obj_def, team_players)
             )
 
             # Находим активные черты
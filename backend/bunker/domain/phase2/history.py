@@ -0,0 +1,57 @@
+from __future__ import annotations
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+__all__ = ("Cursor", "ActionHistory")
+
+# (раунд, номер записи внутри раунда)
+Cursor = Tuple[int, int]
+
+
+class ActionHistory:
+    """Журнал записей Phase2 только на дописывание, с постраничным чтением.
+
+    Записи не пересобираются: каждая попадает сюда один раз, в момент
+    логирования. Курсор — ключ последней полученной клиентом записи; страница
+    после него находится бинарным поиском.
+    """
+
+    def __init__(self) -> None:
+        self._entries: List[Dict[str, Any]] = []
+        self._keys: List[Cursor] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys.clear()
+
+    def extend(self, round_: int, entries: Iterable[Dict[str, Any]]) -> None:
+        """Дописать записи раунда ``round_`` (раунды не убывают)."""
+        for entry in entries:
+            last = self._keys[-1] if self._keys else None
+            index = last[1] + 1 if last and last[0] == round_ else 0
+            self._keys.append((round_, index))
+            self._entries.append(entry)
+
+    @property
+    def head(self) -> Optional[Cursor]:
+        """Ключ последней записи (None — история пуста)"""
+        return self._keys[-1] if self._keys else None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return list(self._entries)
+
+    def page(
+        self, after: Optional[Sequence[int]] = None, limit: int = 50
+    ) -> Tuple[List[Dict[str, Any]], Optional[Cursor], bool]:
+        """Записи после курсора ``after``: (записи, новый курсор, есть ли еще)"""
+        start = bisect_right(self._keys, tuple(after)) if after else 0
+        end = min(start + max(limit, 0), len(self._entries))
+        cursor = self._keys[end - 1] if end > start else _cursor(after)
+        return self._entries[start:end], cursor, end < len(self._entries)
+
+
+def _cursor(after: Optional[Sequence[int]]) -> Optional[Cursor]:
+    return (after[0], after[1]) if after else None
@@ -0,0 +1,152 @@
+"""Векторное разрешение бросков Phase2 для N независимых партий.
+
+Каждая строка пакета — одна группа действия в одной партии: матрица итоговых
+статов участников, веса статов действия, сложность с модификатором статусов,
+эффективность и бросок d20. ``resolve_batch`` считает все строки одним
+проходом NumPy с тем же порядком сложения и теми же усечениями, что и
+``Phase2Engine.process_current_action``, поэтому при тех же бросках результат
+совпадает бит в бит.
+
+NumPy — необязательная зависимость: без нее модуль импортируется, но
+``resolve_batch`` и ``encode_rows`` падают с ``RuntimeError``.
+"""
+
+from __future__ import annotations
+import random
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple
+
+from bunker.domain.models.stats import STATS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - зависит от окружения
+    np = None
+
+__all__ = (
+    "RoundBatch",
+    "BatchResult",
+    "encode_rows",
+    "draw_rolls",
+    "resolve_batch",
+)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("numpy is required for the batch resolution kernel")
+
+
+@dataclass(slots=True)
+class RoundBatch:
+    """Закодированные строки действий (N — строки, P — участники, K — статы)"""
+
+    stats: Any  # (N, P, K) int64 — итоговые статы участников, 0 для пустых
+    weights: Any  # (N, K) float64 — веса статов в порядке STATS
+    counts: Any  # (N,) int64 — сколько участников заявлено в группе
+    group_rate: Any  # (N,) float64 — group_action_bonus
+    difficulty: Any  # (N,) int64 — сложность с модификатором статусов
+    effectiveness: Any  # (N,) float64
+    blocked: Any  # (N,) bool
+
+
+@dataclass(slots=True)
+class BatchResult:
+    combined: Any  # (N,) int64 — статы до модификатора эффективности
+    total_stats: Any  # (N,) int64 — статы, с которыми сравнивается бросок
+    rolls: Any  # (N,) int64 — 0 для заблокированных строк
+    success: Any  # (N,) bool
+
+
+def encode_rows(rows: Sequence[Tuple[Any, List[str], str]]) -> RoundBatch:
+    """Собрать пакет из ``(phase2_engine, participants, action_id)``.
+
+    Статы берутся из кэша вкладов движка, модификаторы — из StatusManager,
+    то есть ровно те же входные данные, что и у скалярного пути.
+    """
+    _require_numpy()
+    encoded = []
+    for engine, participants, action_id in rows:
+        action_def = engine.data.phase2_actions[action_id]
+        modifiers = engine._status_manager.get_action_modifiers(action_id)
+        matrix = []
+        for player_id in participants:
+            contribution = engine._odds.contribution(player_id, action_def)
+            if contribution is not None:
+                matrix.append(contribution.final_stats)
+        encoded.append(
+            (
+                matrix,
+                action_def.weight_vector,
+                len(participants),
+                engine.config.coefficients.get("group_action_bonus", 0.5),
+                action_def.difficulty + modifiers["difficulty_modifier"],
+                modifiers["effectiveness"],
+                bool(modifiers["blocked"]),
+            )
+        )
+
+    n = len(encoded)
+    p = max((len(row[0]) for row in encoded), default=0)
+    k = len(STATS)
+    stats = np.zeros((n, p, k), dtype=np.int64)
+    weights = np.zeros((n, k), dtype=np.float64)
+    for i, (matrix, row_weights, *_rest) in enumerate(encoded):
+        if matrix:
+            stats[i, : len(matrix)] = matrix
+        weights[i] = row_weights
+
+    return RoundBatch(
+        stats=stats,
+        weights=weights,
+        counts=np.array([row[2] for row in encoded], dtype=np.int64),
+        group_rate=np.array([row[3] for row in encoded], dtype=np.float64),
+        difficulty=np.array([row[4] for row in encoded], dtype=np.int64),
+        effectiveness=np.array([row[5] for row in encoded], dtype=np.float64),
+        blocked=np.array([row[6] for row in encoded], dtype=bool),
+    )
+
+
+def draw_rolls(rngs: Sequence[random.Random], blocked: Sequence[bool]) -> List[int]:
+    """Броски из потоков партий в том же порядке, что и скалярный путь.
+
+    Заблокированное действие кубик не бросает и поток не сдвигает.
+    """
+    return [0 if skip else rng.randint(1, 20) for rng, skip in zip(rngs, blocked)]
+
+
+def resolve_batch(
+    batch: RoundBatch, rolls: Optional[Sequence[int]] = None
+) -> BatchResult:
+    """Разрешить все строки пакета одним проходом.
+
+    Сложение идет по участникам и статам последовательно (а не попарной
+    суммой NumPy), чтобы совпасть с float-арифметикой скалярного пути.
+    """
+    _require_numpy()
+    n, p, k = batch.stats.shape
+    stats = batch.stats.astype(np.float64)
+
+    total = np.zeros(n, dtype=np.float64)
+    for j in range(p):
+        contribution = np.zeros(n, dtype=np.float64)
+        for s in range(k):
+            contribution += stats[:, j, s] * batch.weights[:, s]
+        total += contribution
+
+    group_bonus = np.where(batch.counts > 1, batch.counts * batch.group_rate, 0.0)
+    combined = np.trunc(total + group_bonus).astype(np.int64)
+    total_stats = np.trunc(combined * batch.effectiveness).astype(np.int64)
+
+    roll_values = (
+        np.zeros(n, dtype=np.int64)
+        if rolls is None
+        else np.asarray(rolls, dtype=np.int64)
+    )
+    success = ~batch.blocked & (roll_values + total_stats >= batch.difficulty)
+    return BatchResult(
+        combined=combined,
+        total_stats=total_stats,
+        rolls=np.where(batch.blocked, 0, roll_values),
+        success=success,
+    )
@@ -0,0 +1,83 @@
+"""Манифест статического контента Phase2.
+
+Определения действий, кризисов, мини-игр и статусов не меняются за время
+жизни процесса, поэтому в снимки партий идут только их id и динамические
+поля, а сами определения клиент один раз забирает по HTTP
+(``GET /content/manifest``, см. ``bunker.content``) и кэширует по ETag.
+
+Версия манифеста — хэш его содержимого; она же приходит в снимке
+(``phase2.content_version``), чтобы клиент знал, когда перечитать манифест.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import weakref
+from typing import Any, Dict
+
+from bunker.core.loader import GameData
+from .status_manager import describe_status
+
+__all__ = ("ContentManifest", "build_manifest", "content_manifest")
+
+_manifests: "weakref.WeakKeyDictionary[GameData, ContentManifest]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class ContentManifest:
+    """Готовое тело ответа (JSON в байтах) и его версия — она же ETag"""
+
+    __slots__ = ("version", "body", "content")
+
+    def __init__(self, content: Dict[str, Any]) -> None:
+        digest = hashlib.sha256(
+            json.dumps(content, sort_keys=True, ensure_ascii=False).encode()
+        )
+        self.version = digest.hexdigest()[:16]
+        self.content = content
+        self.body = json.dumps(
+            {"version": self.version, **content},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+
+def build_manifest(data: GameData) -> ContentManifest:
+    return ContentManifest(
+        {
+            "actions": {
+                action.id: {
+                    "name": action.name,
+                    "team": action.team,
+                    "difficulty": action.difficulty,
+                    "stat_weights": action.stat_weights,
+                }
+                for action in data.phase2_actions.values()
+            },
+            "crises": {
+                crisis.id: {
+                    "name": crisis.name,
+                    "description": crisis.description,
+                    "important_stats": crisis.important_stats,
+                }
+                for crisis in data.phase2_crises.values()
+            },
+            "mini_games": {
+                mini_game.id: {"name": mini_game.name, "rules": mini_game.rules}
+                for mini_game in data.mini_games.values()
+            },
+            "statuses": {
+                status_id: describe_status(status_def)
+                for status_id, status_def in data.statuses.items()
+            },
+        }
+    )
+
+
+def content_manifest(data: GameData) -> ContentManifest:
+    """Манифест для ``data``; собирается один раз на загруженные данные"""
+    manifest = _manifests.get(data)
+    if manifest is None:
+        manifest = _manifests[data] = build_manifest(data)
+    return manifest
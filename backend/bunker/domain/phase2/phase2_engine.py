@@ -1,6 +1,7 @@
 from __future__ import annotations
+import logging
 import random
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass
 
 from bunker.domain.phase2.bunker_objects import BunkerObjectBonusCalculator
@@ -11,7 +12,8 @@ from bunker.domain.models.models import (
     DebuffEffect,
     PhobiaStatus,
 )
-from bunker.domain.models.character import Character
+from bunker.domain.models.character import Character, stat_profile
+from bunker.domain.models.stats import STATS, StatVector
 from bunker.domain.models.phase2_models import (
     Phase2ActionDef,
     Phase2CrisisDef,
@@ -29,6 +31,15 @@ from .types import (
 )
 from .action_filter import ActionFilter
 from .status_manager import StatusManager
+from .stat_ledger import TeamStatLedger
+from .history import ActionHistory, Cursor
+from .probability import ActionOddsCalculator
+from bunker.core.logs import get_logger
+
+log = get_logger(__name__)
+
+# выбор «ничего не делать» при пропуске хода (в очередь действий не попадает)
+NOOP_ACTION = "noop"
 
 
 class Phase2Engine:
@@ -38,18 +49,38 @@ class Phase2Engine:
         self.game = game
         self.data = game_data
         self.config = game_data.phase2_config
-        self.rng = rng or random.Random()
+        # по умолчанию — общий поток случайности партии
+        self.rng = rng or game.rng
 
         # Состояние команд
         self._team_states: Dict[str, TeamTurnState] = {}
         self._current_crisis: Optional[CrisisEvent] = None
         self._action_filter = ActionFilter(game)
+        self._odds = ActionOddsCalculator(
+            game, game_data, self._action_filter.calculate_action_effectiveness
+        )
 
         # Калькулятор бонусов объектов
         self._bunker_bonus_calc = BunkerObjectBonusCalculator(
             game, game_data.bunker_objects
         )
-        self._status_manager = StatusManager(game, game_data)
+        self._status_manager = StatusManager(
+            game, game_data, on_stats_change=self._mark_stats_dirty
+        )
+
+        # Инкрементальные статы команд: вклад каждого источника отдельно
+        self._stat_ledger = TeamStatLedger()
+        self._dirty_stat_sources: Set[Tuple[str, str]] = set()
+        self._stats_need_rebuild = True
+
+        # Доступные действия игроков: считаются один раз на эпоху состояния.
+        # Эпоха растет при смене статусов, объектов, фобий и составов команд.
+        self._availability_epoch = 0
+        self._available_actions: Dict[str, Tuple[int, List[Phase2ActionDef]]] = {}
+        self._action_tables: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
+        # История для клиента: сырой лог и детальные записи, по мере логирования
+        self._history = {"log": ActionHistory(), "detailed": ActionHistory()}
 
     def initialize_phase2(self) -> None:
         """Инициализация Phase2"""
@@ -70,6 +101,8 @@ class Phase2Engine:
         self.game.phase2_processed_actions.clear()
         self.game.phase2_current_action_index = 0
         self.game.phase2_action_log.clear()
+        for history in self._history.values():
+            history.clear()
         self.game.winner = None
 
         # Инициализация объектов бункера
@@ -79,19 +112,42 @@ class Phase2Engine:
         self.game.phase2_team_debuffs.clear()
         self.game.phase2_player_phobias.clear()
         self.game.phase2_active_statuses.clear()
+        self._status_manager.rebuild()
 
         # Инициализация команд
         self._setup_teams()
         self._calculate_team_stats()
-        if not hasattr(self.game, "phase2_active_statuses_detailed"):
-            self.game.phase2_active_statuses_detailed = {}
+
+    def export_state(self) -> Dict[str, Any]:
+        """Состояние движка вне ``Game`` — для контрольных точек.
+
+        Кэши (статы, доступность, вклады) не сохраняются: они пересобираются
+        из ``Game`` после ``restore_state``.
+        """
+        return {
+            "team_states": self._team_states,
+            "current_crisis": self._current_crisis,
+            "rng": self.rng.getstate(),
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Вернуть состояние из ``export_state`` (Game уже восстановлен)"""
+        self._team_states = state["team_states"]
+        self._current_crisis = state["current_crisis"]
+        self.rng.setstate(state["rng"])
+        self._odds.clear()
+        self._status_manager.rebuild()
+        self._stats_need_rebuild = True
+        self._invalidate_availability()
+        self._calculate_team_stats()
+        self._rebuild_history()
 
     def _setup_bunker_objects(self) -> None:
         """Настройка начальных объектов бункера"""
         self.game.phase2_bunker_objects.clear()
 
         initial_objects = self.config.game_settings.get("initial_bunker_objects", [])
-        print(f"Setting up bunker objects: {len(initial_objects)} objects found")
+        log.debug("Setting up bunker objects: %s objects found", len(initial_objects))
 
         for obj_data in initial_objects:
             obj = BunkerObjectState(
@@ -100,16 +156,18 @@ class Phase2Engine:
                 status=obj_data.get("status", "working"),
             )
             self.game.phase2_bunker_objects[obj.object_id] = obj
-            print(f"  Added object: {obj.object_id} ({obj.name}) - {obj.status}")
+            log.debug("Added object: %s (%s) - %s", obj.object_id, obj.name, obj.status)
 
-        print(
-            f"Total bunker objects initialized: {len(self.game.phase2_bunker_objects)}"
+        log.debug(
+            "Total bunker objects initialized: %s", len(self.game.phase2_bunker_objects)
         )
 
     def _setup_teams(self) -> None:
         """Настройка команд для Phase2"""
-        bunker_players = list(self.game.team_in_bunker)
-        outside_players = list(self.game.team_outside)
+        # sorted: порядок обхода set зависит от PYTHONHASHSEED, а от него —
+        # результат перемешивания, и повтор партии в другом процессе разошелся бы
+        bunker_players = sorted(self.game.team_in_bunker)
+        outside_players = sorted(self.game.team_outside)
 
         # Убедимся что есть игроки в командах
         if not bunker_players or not outside_players:
@@ -135,62 +193,115 @@ class Phase2Engine:
             ),
         }
 
-        print(f"Teams setup: bunker={bunker_players}, outside={outside_players}")
+        self._stats_need_rebuild = True
+        self._invalidate_availability()
+        log.debug("Teams setup: bunker=%s, outside=%s", bunker_players, outside_players)
 
     def _calculate_team_stats(self) -> None:
-        """Расчет характеристик команд с учетом дебафов, фобий, объектов И СТАТУСОВ"""
-        stats = {}
+        """Расчет характеристик команд с учетом дебафов, фобий, объектов И СТАТУСОВ
+
+        Пересчитываются только источники, помеченные через _mark_stats_dirty;
+        полная перестройка — только при смене состава команд.
+        """
+        if self._stats_need_rebuild:
+            self._rebuild_team_stats()
+
+        dirty, self._dirty_stat_sources = self._dirty_stat_sources, set()
+        for kind, key in dirty:
+            self._refresh_stat_source(kind, key)
+
+        self.game.phase2_team_stats = self._stat_ledger.totals()
 
+    def _rebuild_team_stats(self) -> None:
+        """Собрать вклады всех источников с нуля"""
+        self._stats_need_rebuild = False
+        self._stat_ledger.reset(self._team_states.keys())
+
+        sources = set()
         for team_name, team_state in self._team_states.items():
-            team_stats = {"ЗДР": 0, "СИЛ": 0, "ИНТ": 0, "ТЕХ": 0, "ЭМП": 0, "ХАР": 0}
-
-            # Базовые статы игроков (существующий код)
-            for player_id in team_state.players:
-                if player_id in self.game.characters:
-                    char_stats = self.game.characters[player_id].aggregate_stats()
-
-                    # Применяем эффекты фобий
-                    if player_id in self.game.phase2_player_phobias:
-                        phobia = self.game.phase2_player_phobias[player_id]
-                        for stat, penalty in phobia.affected_stats.items():
-                            if stat in char_stats:
-                                char_stats[stat] = max(
-                                    char_stats[stat] + penalty,
-                                    self.config.mechanics.get("phobia_stat_floor", -2),
-                                )
-
-                    # Суммируем в командные статы
-                    for stat, value in char_stats.items():
-                        if stat in team_stats:
-                            team_stats[stat] += value
-
-            # Применяем командные дебафы (существующий код)
-            if team_name in self.game.phase2_team_debuffs:
-                for debuff in self.game.phase2_team_debuffs[team_name]:
-                    for stat, penalty in debuff.stat_penalties.items():
-                        if stat in team_stats:
-                            team_stats[stat] += penalty
-
-            # Применяем бонусы от объектов бункера (существующий код)
-            if team_name == "bunker":
-                team_players = set(team_state.players)
-                object_bonuses = self._bunker_bonus_calc.calculate_team_bonuses(
-                    team_players
+            sources.update(("player", pid) for pid in team_state.players)
+            sources.add(("debuffs", team_name))
+        sources.update(("object", obj_id) for obj_id in self.game.phase2_bunker_objects)
+        sources.update(
+            ("status", status_id) for status_id in self.game.phase2_active_statuses
+        )
+        self._dirty_stat_sources |= sources
+
+    def _mark_stats_dirty(self, kind: str, key: str) -> None:
+        """Пометить источник вклада в статы команд для пересчета"""
+        self._dirty_stat_sources.add((kind, key))
+        if kind == "player":
+            # фобия игрока меняет и его вклад в действия
+            self._odds.forget_player(key)
+        # статусы, объекты и фобии игроков влияют и на доступность действий
+        if kind != "debuffs":
+            self._invalidate_availability()
+
+    def _invalidate_availability(self) -> None:
+        """Сбросить таблицы доступных действий всех игроков"""
+        self._availability_epoch += 1
+
+    @property
+    def availability_epoch(self) -> int:
+        return self._availability_epoch
+
+    def _refresh_stat_source(self, kind: str, key: str) -> None:
+        """Пересчитать дельту одного источника и обновить итоги"""
+        if kind == "player":
+            team_name = self._team_of(key)
+            if team_name:
+                self._stat_ledger.set(
+                    team_name, ("player", key), self._player_stats(key)
+                )
+
+        elif kind == "debuffs":
+            penalties = STATS.zero
+            for debuff in self.game.phase2_team_debuffs.get(key, []):
+                penalties = STATS.add(penalties, debuff.stat_penalties)
+            self._stat_ledger.set(key, ("debuffs", key), penalties)
+
+        elif kind == "object":
+            # Бонусы объектов бункера получает только команда бункера
+            bunker_team = self._team_states.get("bunker")
+            bonus = (
+                self._bunker_bonus_calc.object_bonus_vector(
+                    key, set(bunker_team.players)
+                )
+                if bunker_team
+                else STATS.zero
+            )
+            self._stat_ledger.set("bunker", ("object", key), bonus)
+
+        elif kind == "status":
+            status_def = self._status_manager.status_definitions.get(key)
+            active = status_def and key in self.game.phase2_active_statuses
+            for team_name in self._team_states:
+                mods = (
+                    status_def.effects.team_stat_vectors.get(team_name, STATS.zero)
+                    if active
+                    else STATS.zero
                 )
-                for stat, bonus in object_bonuses.items():
-                    if stat in team_stats:
-                        team_stats[stat] += bonus
+                self._stat_ledger.set(team_name, ("status", key), mods)
+
+    def _player_stats(self, player_id: str) -> StatVector:
+        """Статы игрока (вектор) с учетом активной фобии"""
+        if player_id not in self.game.characters:
+            return STATS.zero
 
-            # ← НОВОЕ: Применяем модификаторы от статусов
-            status_modifiers = self._status_manager.get_team_stat_modifiers()
-            if team_name in status_modifiers:
-                for stat, modifier in status_modifiers[team_name].items():
-                    if stat in team_stats:
-                        team_stats[stat] += modifier
+        char_stats, mask = stat_profile(self.game.characters[player_id])
 
-            stats[team_name] = team_stats
+        # Применяем эффекты фобий
+        phobia = self.game.phase2_player_phobias.get(player_id)
+        if phobia is not None:
+            floor = self.config.mechanics.get("phobia_stat_floor", -2)
+            char_stats = phobia.apply(char_stats, mask, floor)
+        return char_stats
 
-        self.game.phase2_team_stats = stats
+    def _team_of(self, player_id: str) -> Optional[str]:
+        for team_name, team_state in self._team_states.items():
+            if player_id in team_state.players:
+                return team_name
+        return None
 
     def get_bunker_objects_details(self) -> Dict[str, Any]:
         """Получить детальную информацию о всех объектах бункера для UI"""
@@ -208,22 +319,61 @@ class Phase2Engine:
 
     def get_available_actions_for_player(self, player_id: str) -> List[Phase2ActionDef]:
         """Получить доступные действия для конкретного игрока"""
+        cached = self._available_actions.get(player_id)
+        if cached and cached[0] == self._availability_epoch:
+            return list(cached[1])
+
         if player_id in self.game.team_in_bunker:
             team = "bunker"
         elif player_id in self.game.team_outside:
             team = "outside"
         else:
-            print(f"Player {player_id} not in any team!")
+            log.warning("Player %s not in any team", player_id)
             return []
 
         available = self._action_filter.get_available_actions(
             player_id, team, self.data.phase2_actions
         )
+        self._available_actions[player_id] = (self._availability_epoch, available)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Available actions for %s (team %s): %s",
+                player_id,
+                team,
+                [a.id for a in available],
+            )
+        return list(available)
+
+    def get_player_action_table(self, player_id: str) -> List[Dict[str, Any]]:
+        """Доступные игроку действия с модификаторами статусов (для UI)"""
+        cached = self._action_tables.get(player_id)
+        if cached and cached[0] == self._availability_epoch:
+            return [dict(row) for row in cached[1]]
+
+        table = []
+        for action in self.get_available_actions_for_player(player_id):
+            status_mods = self._status_manager.get_action_modifiers(action.id)
+
+            # имя, сложность и веса статов — в манифесте контента
+            action_data = {"id": action.id}
+
+            if status_mods["blocked"]:
+                action_data["blocked"] = True
+                action_data["blocking_statuses"] = status_mods["blocking_statuses"]
+            elif status_mods["difficulty_modifier"] != 0:
+                action_data["modified_difficulty"] = (
+                    action.difficulty + status_mods["difficulty_modifier"]
+                )
+                action_data["difficulty_modifier"] = status_mods["difficulty_modifier"]
 
-        print(
-            f"Available actions for {player_id} (team {team}): {[a.id for a in available]}"
-        )
-        return available
+            if status_mods["effectiveness"] != 1.0:
+                action_data["effectiveness_modifier"] = status_mods["effectiveness"]
+
+            table.append(action_data)
+
+        self._action_tables[player_id] = (self._availability_epoch, table)
+        return [dict(row) for row in table]
 
     def get_available_actions(self, team: str) -> List[Phase2ActionDef]:
         """Получить доступные действия для команды (общий список)"""
@@ -249,20 +399,19 @@ class Phase2Engine:
         self, player_id: str, action_id: str, params: Dict[str, Any] = None
     ) -> bool:
         """Добавить действие игрока в очередь"""
-        print(f"\n--- Adding player action for action_id - {action_id}---")
+        log.debug("Adding player action for action_id - %s", action_id)
         current_team = self._team_states.get(self.game.phase2_current_team)
         if not current_team or current_team.get_current_player() != player_id:
             return False
 
         # Проверяем доступность действия для игрока
         available_actions = self.get_available_actions_for_player(player_id)
-        print("Available actions for player:", [a.id for a in available_actions])
         action_def = None
         for action in available_actions:
             if action.id == action_id:
                 action_def = action
                 break
-        print(f"Selected action: {action_id} (found: {action_def is not None})")
+        log.debug("Selected action: %s (found: %s)", action_id, action_def is not None)
         if not action_def:
             return False
 
@@ -284,6 +433,30 @@ class Phase2Engine:
 
         return True
 
+    def skip_turn(self, player_id: Optional[str] = None) -> List[str]:
+        """Пропустить ход (noop): игрока ``player_id``, если сейчас его очередь,
+        или всех, кто в текущей команде еще не выбрал действие.
+
+        Пропуск засчитывается как выбор без действия — в очередь ничего не
+        попадает, но ход команды может завершиться.
+        """
+        current_team = self._team_states.get(self.game.phase2_current_team)
+        skipped: List[str] = []
+        while current_team:
+            pid = current_team.get_current_player()
+            if pid is None or (player_id and pid != player_id):
+                break
+            current_team.completed_actions[pid] = Phase2Action(
+                player_id=pid, action_type=NOOP_ACTION, params={}
+            )
+            current_team.current_player_index += 1
+            skipped.append(pid)
+            if player_id:
+                break
+        if skipped:
+            log.debug("Skipped turn for %s", skipped)
+        return skipped
+
     def _update_action_queue(self, new_action: Phase2Action) -> None:
         """Обновить очередь действий, группируя одинаковые"""
         # Ищем существующую группу с таким же действием
@@ -368,7 +541,7 @@ class Phase2Engine:
         combined_stats = self._calculate_action_stats_with_bonuses(
             action_data["participants"], action_def
         )
-        combined_stats = int(combined_stats * status_modifiers["effectiveness"])
+        combined_stats = self._odds.effective_stats(combined_stats, status_modifiers)
 
         roll = self.rng.randint(1, 20)
         modified_difficulty = (
@@ -377,8 +550,13 @@ class Phase2Engine:
         total = roll + combined_stats
         success = total >= modified_difficulty
 
-        print(
-            f"Action {action_data['action_type']}: roll={roll}, stats={combined_stats}, difficulty={modified_difficulty}, success={success}"
+        log.debug(
+            "Action %s: roll=%s, stats=%s, difficulty=%s, success=%s",
+            action_data["action_type"],
+            roll,
+            combined_stats,
+            modified_difficulty,
+            success,
         )
 
         # Создание результата
@@ -398,7 +576,7 @@ class Phase2Engine:
             effects = action_def.effects.get("success", {})
             self._apply_action_effects(effects, result, action_def)
             self._check_status_removal(action_data["action_type"])
-            print(f"Action succeeded, applied effects: {effects}")
+            log.debug("Action succeeded, applied effects: %s", effects)
 
         else:
             # Провал
@@ -412,18 +590,19 @@ class Phase2Engine:
                     self._current_crisis = self._create_action_minigame_event(
                         action_def, mini_game_info
                     )
-                    print(
-                        f"Bunker action failed, starting mini-game: {mini_game_info.name}"
+                    log.debug(
+                        "Bunker action failed, starting mini-game: %s",
+                        mini_game_info.name,
                     )
                 else:
-                    print(
-                        f"No mini-game found for failed bunker action {action_def.id}"
+                    log.debug(
+                        "No mini-game found for failed bunker action %s", action_def.id
                     )
             else:
                 # Команда снаружи - применяем эффекты провала сразу
                 effects = action_def.effects.get("failure", {})
                 self._apply_action_effects(effects, result, action_def)
-                print(f"Outside team action failed, applied effects: {effects}")
+                log.debug("Outside team action failed, applied effects: %s", effects)
 
         # Сохраняем результат
         self._save_action_result(action_data, result, action_preview, status_modifiers)
@@ -490,14 +669,16 @@ class Phase2Engine:
         all_mini_games = list(self.data.mini_games.values())
 
         if not all_mini_games:
-            print(f"WARNING: No mini-games available")
+            log.warning("No mini-games available")
             return None
 
         # Выбираем случайную мини-игру из всех доступных
         selected_game = self.rng.choice(all_mini_games)
 
-        print(
-            f"Selected random mini-game '{selected_game.name}' for failed action {action_def.id}"
+        log.debug(
+            "Selected random mini-game '%s' for failed action %s",
+            selected_game.name,
+            action_def.id,
         )
 
         return MiniGameInfo(
@@ -513,13 +694,15 @@ class Phase2Engine:
         all_mini_games = list(self.data.mini_games.values())
 
         if not all_mini_games:
-            print(f"WARNING: No mini-games available for crisis {crisis_id}")
+            log.warning("No mini-games available for crisis %s", crisis_id)
             return None
 
         # Выбираем случайную мини-игру
         selected_game = self.rng.choice(all_mini_games)
-        print(
-            f"Selected random mini-game '{selected_game.name}' for crisis {crisis_id}"
+        log.debug(
+            "Selected random mini-game '%s' for crisis %s",
+            selected_game.name,
+            crisis_id,
         )
 
         return MiniGameInfo(
@@ -562,63 +745,28 @@ class Phase2Engine:
         self, participants: List[str], action_def: Phase2ActionDef
     ) -> int:
         """Расчет комбинированных характеристик участников с бонусами от черт"""
-        total = 0
-
-        for player_id in participants:
-            if player_id in self.game.characters:
-                char_stats = self.game.characters[player_id].aggregate_stats()
-
-                # Применяем фобии (обнуляем характеристики если активна фобия)
-                if player_id in self.game.phase2_player_phobias:
-                    phobia = self.game.phase2_player_phobias[player_id]
-                    for stat, penalty in phobia.affected_stats.items():
-                        if stat in char_stats:
-                            char_stats[stat] = max(
-                                char_stats[stat] + penalty,
-                                self.config.mechanics.get("phobia_stat_floor", -2),
-                            )
-
-                # Получаем бонусы от черт для этого действия
-                trait_bonuses = self._action_filter.calculate_action_effectiveness(
-                    player_id, action_def
-                )
-
-                # Применяем бонусы к характеристикам
-                for stat, bonus in trait_bonuses.items():
-                    if stat in char_stats:
-                        char_stats[stat] += bonus
-
-                # Считаем вклад в действие
-                for stat, weight in action_def.stat_weights.items():
-                    total += char_stats.get(stat, 0) * weight
-
-        # Бонус за групповое действие
-        if len(participants) > 1:
-            group_bonus = self.config.coefficients.get("group_action_bonus", 0.5)
-            total += len(participants) * group_bonus
-
-        return int(total)
+        return self._odds.combined_stats(participants, action_def)
 
     def _apply_action_effects(
         self, effects: Dict[str, Any], result: ActionResult, action_def: Phase2ActionDef
     ) -> None:
         """Применить эффекты действия С ПОДДЕРЖКОЙ СТАТУСОВ"""
-        print(f"\n--- Applying action effects ---")
-        print(f"Effects to apply: {effects}")
+        log.debug("Applying action effects")
+        log.debug("Effects to apply: %s", effects)
 
         result.effects = effects.copy()
 
         # Урон/лечение бункера
         if "bunker_damage" in effects:
             damage = effects["bunker_damage"]
-            print(f"Applying bunker damage: {damage}")
+            log.debug("Applying bunker damage: %s", damage)
             self.game.phase2_bunker_hp -= damage
             self.game.phase2_bunker_hp = max(0, self.game.phase2_bunker_hp)
-            print(f"New bunker HP: {self.game.phase2_bunker_hp}")
+            log.debug("New bunker HP: %s", self.game.phase2_bunker_hp)
 
         if "bunker_heal" in effects:
             heal = effects["bunker_heal"]
-            print(f"Applying bunker heal: {heal}")
+            log.debug("Applying bunker heal: %s", heal)
             # ← ИСПРАВЛЕНИЕ: используем max_bunker_hp если есть, иначе starting_bunker_hp
             max_hp = self.config.game_settings.get(
                 "max_bunker_hp", self.config.game_settings.get("starting_bunker_hp", 10)
@@ -626,62 +774,79 @@ class Phase2Engine:
             old_hp = self.game.phase2_bunker_hp
             self.game.phase2_bunker_hp += heal
             self.game.phase2_bunker_hp = min(max_hp, self.game.phase2_bunker_hp)
-            print(
-                f"Bunker HP: {old_hp} + {heal} = {old_hp + heal}, capped at {max_hp} = {self.game.phase2_bunker_hp}"
+            log.debug(
+                "Bunker HP: %s + %s = %s, capped at %s = %s",
+                old_hp,
+                heal,
+                old_hp + heal,
+                max_hp,
+                self.game.phase2_bunker_hp,
             )
 
         # Урон/лечение морали
         if "morale_damage" in effects:
             damage = effects["morale_damage"]
-            print(f"Applying morale damage: {damage}")
+            log.debug("Applying morale damage: %s", damage)
             self.game.phase2_morale -= damage
             self.game.phase2_morale = max(0, self.game.phase2_morale)
-            print(f"New morale: {self.game.phase2_morale}")
+            log.debug("New morale: %s", self.game.phase2_morale)
 
         if "morale_heal" in effects:
             heal = effects["morale_heal"]
-            print(f"Applying morale heal: {heal}")
+            log.debug("Applying morale heal: %s", heal)
             max_morale = self.config.game_settings.get(
                 "max_morale", self.config.game_settings.get("starting_morale", 10)
             )
             old_morale = self.game.phase2_morale
             self.game.phase2_morale += heal
             self.game.phase2_morale = min(max_morale, self.game.phase2_morale)
-            print(
-                f"Morale: {old_morale} + {heal} = {old_morale + heal}, capped at {max_morale} = {self.game.phase2_morale}"
+            log.debug(
+                "Morale: %s + %s = %s, capped at %s = %s",
+                old_morale,
+                heal,
+                old_morale + heal,
+                max_morale,
+                self.game.phase2_morale,
             )
 
         # Урон/лечение припасов
         if "supplies_damage" in effects:
             damage = effects["supplies_damage"]
-            print(f"Applying supplies damage: {damage}")
+            log.debug("Applying supplies damage: %s", damage)
             self.game.phase2_supplies -= damage
             self.game.phase2_supplies = max(0, self.game.phase2_supplies)
-            print(f"New supplies: {self.game.phase2_supplies}")
+            log.debug("New supplies: %s", self.game.phase2_supplies)
 
         if "supplies_heal" in effects:
             heal = effects["supplies_heal"]
-            print(f"Applying supplies heal: {heal}")
+            log.debug("Applying supplies heal: %s", heal)
             max_supplies = self.config.game_settings.get(
                 "max_supplies", self.config.game_settings.get("starting_supplies", 10)
             )
             old_supplies = self.game.phase2_supplies
             self.game.phase2_supplies += heal
             self.game.phase2_supplies = min(max_supplies, self.game.phase2_supplies)
-            print(
-                f"Supplies: {old_supplies} + {heal} = {old_supplies + heal}, capped at {max_supplies} = {self.game.phase2_supplies}"
+            log.debug(
+                "Supplies: %s + %s = %s, capped at %s = %s",
+                old_supplies,
+                heal,
+                old_supplies + heal,
+                max_supplies,
+                self.game.phase2_supplies,
             )
 
         if "object_damage" in effects:
             for obj_id in effects["object_damage"]:
                 if obj_id in self.game.phase2_bunker_objects:
                     self.game.phase2_bunker_objects[obj_id].status = "damaged"
+                    self._mark_stats_dirty("object", obj_id)
 
         # Ремонт объектов
         if "repair_object" in effects:
             obj_id = effects["repair_object"]
             if obj_id in self.game.phase2_bunker_objects:
                 self.game.phase2_bunker_objects[obj_id].status = "working"
+                self._mark_stats_dirty("object", obj_id)
 
         # Командные дебафы
         if "team_debuff" in effects:
@@ -691,7 +856,7 @@ class Phase2Engine:
             debuff = DebuffEffect(
                 effect_id=debuff_data["effect"],
                 name=debuff_data["effect"],
-                stat_penalties=debuff_data["stat_penalties"],
+                stat_penalties=STATS.vector(debuff_data["stat_penalties"]),
                 remaining_rounds=debuff_data["duration"],
                 source=f"action_{action_def.id}",
             )
@@ -699,6 +864,7 @@ class Phase2Engine:
             if target_team not in self.game.phase2_team_debuffs:
                 self.game.phase2_team_debuffs[target_team] = []
             self.game.phase2_team_debuffs[target_team].append(debuff)
+            self._mark_stats_dirty("debuffs", target_team)
 
         # Снятие дебафов
         if "remove_team_debuff" in effects:
@@ -709,6 +875,7 @@ class Phase2Engine:
                     for d in self.game.phase2_team_debuffs[team]
                     if d.effect_id != debuff_name
                 ]
+                self._mark_stats_dirty("debuffs", team)
 
         if "apply_status" in effects:
             status_id = effects["apply_status"]
@@ -729,18 +896,22 @@ class Phase2Engine:
             for participant in result.participants:
                 if participant in self.game.phase2_player_phobias:
                     del self.game.phase2_player_phobias[participant]
+                    self._mark_stats_dirty("player", participant)
                     cured_players.append(participant)
             result.effects["phobias_cured"] = cured_players
 
         self._calculate_team_stats()
-        print(
-            f"After effects - HP: {self.game.phase2_bunker_hp}, Morale: {self.game.phase2_morale}, Supplies: {self.game.phase2_supplies}"
+        log.debug(
+            "After effects - HP: %s, Morale: %s, Supplies: %s",
+            self.game.phase2_bunker_hp,
+            self.game.phase2_morale,
+            self.game.phase2_supplies,
         )
 
     def _create_crisis_event(self, crisis_id: str) -> CrisisEvent:
         """Создать событие кризиса с мини-игрой"""
         crisis_def = self.data.phase2_crises.get(crisis_id)
-        print(f"Creating crisis event for crisis_id: {crisis_id}")
+        log.debug("Creating crisis event for crisis_id: %s", crisis_id)
 
         if not crisis_def:
             raise ValueError(f"Unknown crisis: {crisis_id}")
@@ -782,7 +953,7 @@ class Phase2Engine:
                 suitable_games.append(mini_game)
 
         if not suitable_games:
-            print(f"WARNING: No mini-games found for crisis {crisis_id}")
+            log.warning("No mini-games found for crisis %s", crisis_id)
             return None
 
         # Выбираем случайную из подходящих
@@ -825,7 +996,7 @@ class Phase2Engine:
                 )
 
         # Логируем и очищаем
-        self.game.phase2_action_log.append(
+        self._log_action(
             {
                 "type": (
                     "minigame"
@@ -862,7 +1033,7 @@ class Phase2Engine:
         """Разрешить мини-игру от провалившегося действия"""
         if result == CrisisResult.BUNKER_WIN:
             # Команда выиграла мини-игру - никаких эффектов
-            print("Bunker won mini-game - no negative effects")
+            log.debug("Bunker won mini-game - no negative effects")
             return
 
         # Команда проиграла мини-игру - выбираем случайный кризис и применяем его
@@ -871,7 +1042,7 @@ class Phase2Engine:
         failure_crises = penalty_data.get("failure_crises", [])
 
         if not failure_crises:
-            print(f"No failure crises defined for action {action_id}")
+            log.debug("No failure crises defined for action %s", action_id)
             return
 
         # Выбираем случайный кризис
@@ -879,10 +1050,10 @@ class Phase2Engine:
         crisis_def = self.data.phase2_crises.get(selected_crisis_id)
 
         if not crisis_def:
-            print(f"Crisis {selected_crisis_id} not found")
+            log.debug("Crisis %s not found", selected_crisis_id)
             return
 
-        print(f"Bunker lost mini-game, applying crisis: {selected_crisis_id}")
+        log.debug("Bunker lost mini-game, applying crisis: %s", selected_crisis_id)
 
         # Применяем ВСЕ эффекты кризиса
         self._apply_crisis_penalties(crisis_def.penalty_on_fail)
@@ -910,7 +1081,7 @@ class Phase2Engine:
         # Если был crisis_trigger, создаем обычный кризис
         if "crisis_trigger" in effects:
             crisis_id = effects["crisis_trigger"]
-            print(f"Action failure triggered additional crisis: {crisis_id}")
+            log.debug("Action failure triggered additional crisis: %s", crisis_id)
             # Можем либо сразу создать кризис, либо отложить на следующий ход
             # Для простоты пока создадим сразу (но это может быть слишком сложно)
 
@@ -930,6 +1101,7 @@ class Phase2Engine:
                 for obj_id in value:
                     if obj_id in self.game.phase2_bunker_objects:
                         self.game.phase2_bunker_objects[obj_id].status = "damaged"
+                        self._mark_stats_dirty("object", obj_id)
             elif effect == "team_debuff":
                 debuff_data = value
                 target_team = debuff_data["target"]
@@ -937,7 +1109,7 @@ class Phase2Engine:
                 debuff = DebuffEffect(
                     effect_id=debuff_data["effect"],
                     name=debuff_data["effect"],
-                    stat_penalties=debuff_data["stat_penalties"],
+                    stat_penalties=STATS.vector(debuff_data["stat_penalties"]),
                     remaining_rounds=debuff_data["duration"],
                     source="crisis",
                 )
@@ -945,6 +1117,7 @@ class Phase2Engine:
                 if target_team not in self.game.phase2_team_debuffs:
                     self.game.phase2_team_debuffs[target_team] = []
                 self.game.phase2_team_debuffs[target_team].append(debuff)
+                self._mark_stats_dirty("debuffs", target_team)
 
     def _trigger_phobias(self, phobia_names: List[str], trigger_source: str) -> None:
         """Триггерить фобии у игроков команды бункера"""
@@ -959,21 +1132,14 @@ class Phase2Engine:
             player_phobia = character.traits["phobia"].name
             if player_phobia in phobia_names:
                 # Обнуляем характеристики (делаем их минимальными)
-                char_stats = character.aggregate_stats()
-                affected_stats = {}
+                char_stats, mask = stat_profile(character)
                 floor = self.config.mechanics.get("phobia_stat_floor", -2)
-
-                for stat, value in char_stats.items():
-                    if value > floor:
-                        affected_stats[stat] = floor - value  # отрицательное значение
-
-                phobia_status = PhobiaStatus(
-                    phobia_name=player_phobia,
-                    trigger_source=trigger_source,
-                    affected_stats=affected_stats,
+                phobia_status = PhobiaStatus.for_character(
+                    player_phobia, trigger_source, char_stats, mask, floor
                 )
 
                 self.game.phase2_player_phobias[player_id] = phobia_status
+                self._mark_stats_dirty("player", player_id)
 
     def finish_team_turn(self) -> None:
         """Завершить ход команды"""
@@ -981,7 +1147,7 @@ class Phase2Engine:
         if not current_team:
             return
 
-        print(f"\n--- Finishing turn for team {self.game.phase2_current_team} ---")
+        log.debug("Finishing turn for team %s", self.game.phase2_current_team)
 
         # Обновляем дебафы (уменьшаем длительность) - ПЕРЕД проверкой победы
         self._update_debuffs()
@@ -989,9 +1155,9 @@ class Phase2Engine:
         # Если переходим к новому раунду - проверяем условия истощения ресурсов
         if self.game.phase2_current_team == "bunker":
             status_effects = self._status_manager.apply_per_round_effects()
-            print("End of round - checking resource depletion...")
+            log.debug("End of round - checking resource depletion...")
             if status_effects:
-                self.game.phase2_action_log.append(
+                self._log_action(
                     {
                         "type": "status_effects",
                         "round": self.game.phase2_round,
@@ -1000,7 +1166,7 @@ class Phase2Engine:
                 )
             expired_statuses = self._status_manager.update_statuses_for_round()
             if expired_statuses:
-                self.game.phase2_action_log.append(
+                self._log_action(
                     {
                         "type": "statuses_expired",
                         "round": self.game.phase2_round,
@@ -1010,8 +1176,9 @@ class Phase2Engine:
             # Мораль упала до 0 - увеличиваем счетчик
             if self.game.phase2_morale <= 0:
                 self.game.phase2_morale_countdown += 1
-                print(
-                    f"Morale countdown increased to: {self.game.phase2_morale_countdown}"
+                log.debug(
+                    "Morale countdown increased to: %s",
+                    self.game.phase2_morale_countdown,
                 )
             else:
                 self.game.phase2_morale_countdown = 0
@@ -1019,15 +1186,16 @@ class Phase2Engine:
             # Припасы закончились - увеличиваем счетчик
             if self.game.phase2_supplies <= 0:
                 self.game.phase2_supplies_countdown += 1
-                print(
-                    f"Supplies countdown increased to: {self.game.phase2_supplies_countdown}"
+                log.debug(
+                    "Supplies countdown increased to: %s",
+                    self.game.phase2_supplies_countdown,
                 )
             else:
                 self.game.phase2_supplies_countdown = 0
 
         # Логируем ход команды только если были действия
         if self.game.phase2_processed_actions:
-            self.game.phase2_action_log.append(
+            self._log_action(
                 {
                     "type": "team_turn",
                     "round": self.game.phase2_round,
@@ -1052,20 +1220,18 @@ class Phase2Engine:
         else:
             self.game.phase2_current_team = "outside"
             self.game.phase2_round += 1
-            print(f"New round started: {self.game.phase2_round}")
+            log.debug("New round started: %s", self.game.phase2_round)
 
         # Перемешиваем порядок игроков в новой команде
         next_team = self._team_states.get(self.game.phase2_current_team)
         if next_team:
-            import random
-
-            random.shuffle(next_team.players)
+            self.rng.shuffle(next_team.players)
             next_team.current_player_index = 0
 
         # Пересчитываем статы команд после изменений
         self._calculate_team_stats()
 
-        print(f"Turn finished. New team: {self.game.phase2_current_team}")
+        log.debug("Turn finished. New team: %s", self.game.phase2_current_team)
 
     def apply_status_from_crisis(self, crisis_id: str) -> None:
         """Применить статус от кризиса"""
@@ -1095,38 +1261,40 @@ class Phase2Engine:
                 debuff.remaining_rounds -= 1
                 if debuff.remaining_rounds > 0:
                     active_debuffs.append(debuff)
+            if len(active_debuffs) != len(self.game.phase2_team_debuffs[team]):
+                self._mark_stats_dirty("debuffs", team)
             self.game.phase2_team_debuffs[team] = active_debuffs
 
     def check_victory_conditions(self) -> Optional[str]:
         """Проверить условия победы"""
-        print(f"\n--- Checking victory conditions ---")
-        print(
-            f"Round: {self.game.phase2_round}, Max rounds: {self.config.game_settings.get('max_rounds', 10)}"
-        )
-        print(f"Bunker HP: {self.game.phase2_bunker_hp}")
-        print(
-            f"Morale: {self.game.phase2_morale} (countdown: {self.game.phase2_morale_countdown})"
-        )
-        print(
-            f"Supplies: {self.game.phase2_supplies} (countdown: {self.game.phase2_supplies_countdown})"
+        log.debug(
+            "Checking victory conditions: round=%s hp=%s morale=%s (countdown %s) supplies=%s (countdown %s)",
+            self.game.phase2_round,
+            self.game.phase2_bunker_hp,
+            self.game.phase2_morale,
+            self.game.phase2_morale_countdown,
+            self.game.phase2_supplies,
+            self.game.phase2_supplies_countdown,
         )
 
         # Бункер уничтожен
         if self.game.phase2_bunker_hp <= 0:
             self.game.winner = "outside"
-            print(f"VICTORY: Bunker destroyed!")
+            log.info("VICTORY: Bunker destroyed!")
             return "bunker_destroyed"
 
         # Мораль упала до 0
         if self.game.phase2_morale <= 0:
             self.game.phase2_morale_countdown += 1
             morale_limit = self.config.game_settings.get("morale_countdown_limit", 1)
-            print(
-                f"Morale is 0, countdown: {self.game.phase2_morale_countdown}/{morale_limit}"
+            log.debug(
+                "Morale is 0, countdown: %s/%s",
+                self.game.phase2_morale_countdown,
+                morale_limit,
             )
             if self.game.phase2_morale_countdown >= morale_limit:
                 self.game.winner = "outside"
-                print(f"VICTORY: Morale broken!")
+                log.info("VICTORY: Morale broken!")
                 return "morale_broken"
         else:
             self.game.phase2_morale_countdown = 0
@@ -1137,12 +1305,14 @@ class Phase2Engine:
             supplies_limit = self.config.game_settings.get(
                 "supplies_countdown_limit", 2
             )
-            print(
-                f"Supplies are 0, countdown: {self.game.phase2_supplies_countdown}/{supplies_limit}"
+            log.debug(
+                "Supplies are 0, countdown: %s/%s",
+                self.game.phase2_supplies_countdown,
+                supplies_limit,
             )
             if self.game.phase2_supplies_countdown >= supplies_limit:
                 self.game.winner = "outside"
-                print(f"VICTORY: Supplies exhausted!")
+                log.info("VICTORY: Supplies exhausted!")
                 return "supplies_exhausted"
         else:
             self.game.phase2_supplies_countdown = 0
@@ -1151,10 +1321,10 @@ class Phase2Engine:
         max_rounds = self.config.game_settings.get("max_rounds", 10)
         if self.game.phase2_round > max_rounds:
             self.game.winner = "bunker"
-            print(f"VICTORY: Time limit reached!")
+            log.info("VICTORY: Time limit reached!")
             return "time_limit"
 
-        print(f"No victory condition met yet.")
+        log.debug("No victory condition met yet.")
         return None
 
     def force_setup_teams(
@@ -1183,9 +1353,13 @@ class Phase2Engine:
         }
 
         # Пересчитываем статы команд
+        self._stats_need_rebuild = True
+        self._invalidate_availability()
         self._calculate_team_stats()
 
-        print(f"Force setup teams: bunker={bunker_players}, outside={outside_players}")
+        log.debug(
+            "Force setup teams: bunker=%s, outside=%s", bunker_players, outside_players
+        )
 
     def get_action_preview(
         self, participants: List[str], action_id: str
@@ -1199,55 +1373,13 @@ class Phase2Engine:
         # Получаем модификаторы от статусов
         status_modifiers = self._status_manager.get_action_modifiers(action_id)
 
-        # Детальная информация по каждому участнику
+        # Детальная информация по каждому участнику (вклады берутся из кэша)
         participants_details = []
-        total_stats = 0
-
         for player_id in participants:
-            if player_id not in self.game.characters:
+            contribution = self._odds.contribution(player_id, action_def)
+            if contribution is None:
                 continue
 
-            character = self.game.characters[player_id]
-            base_stats = character.aggregate_stats()
-
-            # Применяем эффекты фобий
-            phobia_penalties = {}
-            if player_id in self.game.phase2_player_phobias:
-                phobia = self.game.phase2_player_phobias[player_id]
-                phobia_penalties = phobia.affected_stats
-                for stat, penalty in phobia_penalties.items():
-                    if stat in base_stats:
-                        base_stats[stat] = max(
-                            base_stats[stat] + penalty,
-                            self.config.mechanics.get("phobia_stat_floor", -2),
-                        )
-
-            # Получаем бонусы от черт
-            trait_bonuses = self._action_filter.calculate_action_effectiveness(
-                player_id, action_def
-            )
-
-            # Применяем бонусы к характеристикам
-            modified_stats = base_stats.copy()
-            for stat, bonus in trait_bonuses.items():
-                if stat in modified_stats:
-                    modified_stats[stat] += bonus
-
-            # Считаем вклад игрока в действие
-            player_contribution = 0
-            stat_contributions = {}
-            for stat, weight in action_def.stat_weights.items():
-                contribution = modified_stats.get(stat, 0) * weight
-                player_contribution += contribution
-                stat_contributions[stat] = {
-                    "base": base_stats.get(stat, 0),
-                    "trait_bonus": trait_bonuses.get(stat, 0),
-                    "phobia_penalty": phobia_penalties.get(stat, 0),
-                    "final": modified_stats.get(stat, 0),
-                    "weight": weight,
-                    "contribution": contribution,
-                }
-
             participants_details.append(
                 {
                     "player_id": player_id,
@@ -1256,78 +1388,117 @@ class Phase2Engine:
                         if player_id in self.game.players
                         else player_id
                     ),
-                    "base_stats": base_stats,
-                    "trait_bonuses": trait_bonuses,
-                    "phobia_penalties": phobia_penalties,
-                    "final_stats": modified_stats,
-                    "stat_contributions": stat_contributions,
-                    "total_contribution": player_contribution,
+                    "base_stats": contribution.stats_dict(contribution.base_stats),
+                    "trait_bonuses": STATS.nonzero(contribution.trait_bonuses),
+                    "phobia_penalties": STATS.nonzero(contribution.phobia_penalties),
+                    "final_stats": contribution.stats_dict(contribution.final_stats),
+                    "stat_contributions": contribution.stat_contributions(
+                        action_def.stat_weights
+                    ),
+                    "total_contribution": contribution.total,
                 }
             )
 
-            total_stats += player_contribution
-
-        # Бонус за групповое действие
-        group_bonus = 0
-        if len(participants) > 1:
-            group_bonus_rate = self.config.coefficients.get("group_action_bonus", 0.5)
-            group_bonus = len(participants) * group_bonus_rate
-            total_stats += group_bonus
-
-        # Применяем модификаторы эффективности от статусов
-        total_stats = int(total_stats * status_modifiers["effectiveness"])
-
-        # Расчет сложности с модификаторами статусов
-        base_difficulty = action_def.difficulty
-        modified_difficulty = base_difficulty + status_modifiers["difficulty_modifier"]
-
-        # Расчет шанса успеха
-        # Нужно выкинуть >= (modified_difficulty - total_stats) на d20
-        required_roll = max(1, modified_difficulty - total_stats)
-        success_chance = max(0, min(100, (21 - required_roll) * 5))  # в процентах
+        # Точный шанс d20 с тем же округлением, что и при броске
+        odds = self._odds.odds(participants, action_def, status_modifiers)
 
         return {
             "action_id": action_id,
-            "action_name": action_def.name,
             "participants": participants_details,
-            "group_bonus": group_bonus,
-            "total_stats": total_stats,
-            "base_difficulty": base_difficulty,
+            "group_bonus": self._odds.group_bonus(len(participants)),
+            "total_stats": odds["total_stats"],
+            "base_difficulty": action_def.difficulty,
             "status_modifiers": status_modifiers,
-            "modified_difficulty": modified_difficulty,
-            "required_roll": required_roll,
-            "success_chance": success_chance,
+            "modified_difficulty": odds["modified_difficulty"],
+            "required_roll": odds["required_roll"],
+            "success_chance": odds["success_chance"],
+            "success_probability": odds["success_probability"],
             "blocked": status_modifiers["blocked"],
             "blocking_statuses": status_modifiers.get("blocking_statuses", []),
         }
 
+    def get_action_previews(
+        self,
+        action_id: str,
+        candidates: Optional[List[str]] = None,
+        max_group: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Шансы действия для всех наборов участников сразу.
+
+        По умолчанию кандидаты — игроки команды, которой принадлежит действие.
+        """
+        action_def = self.data.phase2_actions.get(action_id)
+        if not action_def:
+            return []
+
+        if candidates is None:
+            team_state = self._team_states.get(action_def.team)
+            candidates = list(team_state.players) if team_state else []
+
+        status_modifiers = self._status_manager.get_action_modifiers(action_id)
+        return self._odds.odds_for_candidates(
+            candidates, action_def, status_modifiers, max_group
+        )
+
     def get_detailed_action_history(self) -> List[Dict[str, Any]]:
         """Получить детальную историю всех действий за игру"""
-        detailed_history = []
+        return self._history["detailed"].entries()
 
-        for log_entry in self.game.phase2_action_log:
-            if log_entry.get("type") == "team_turn" and "actions" in log_entry:
-                for action_result in log_entry["actions"]:
-                    if "action_type" in action_result:
-                        # Преобразуем в детальный формат для UI
-                        detailed_action = self._format_action_for_history(
-                            action_result, log_entry
-                        )
-                        detailed_history.append(detailed_action)
-
-            elif log_entry.get("type") == "crisis":
-                # Добавляем кризисы в историю
-                detailed_history.append(
-                    {
-                        "type": "crisis",
-                        "round": log_entry.get("round", "unknown"),
-                        "crisis_id": log_entry["crisis_id"],
-                        "result": log_entry["result"],
-                        "penalty_applied": log_entry.get("penalty_applied", False),
-                    }
-                )
+    def get_history_page(
+        self,
+        kind: str = "detailed",
+        after: Optional[Sequence[int]] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Cursor], bool]:
+        """Страница истории ``kind`` ("detailed" или "log") после курсора"""
+        return self._history[kind].page(after, limit)
+
+    def get_history_heads(self) -> Dict[str, Optional[List[int]]]:
+        """Курсоры последних записей — чтобы клиент знал, что дочитать"""
+        return {
+            kind: list(history.head) if history.head else None
+            for kind, history in self._history.items()
+        }
 
-        return detailed_history
+    def _log_action(self, log_entry: Dict[str, Any]) -> None:
+        """Записать событие в лог партии и сразу дописать историю"""
+        self.game.phase2_action_log.append(log_entry)
+        self._append_history(log_entry)
+
+    def _append_history(self, log_entry: Dict[str, Any]) -> None:
+        round_ = log_entry.get("round", self.game.phase2_round)
+        self._history["log"].extend(round_, [log_entry])
+        self._history["detailed"].extend(round_, self._history_entries(log_entry))
+
+    def _rebuild_history(self) -> None:
+        """После восстановления из контрольной точки — один проход по логу"""
+        for history in self._history.values():
+            history.clear()
+        for log_entry in self.game.phase2_action_log:
+            self._append_history(log_entry)
+
+    def _history_entries(self, log_entry: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Детальные записи для UI из одной записи лога"""
+        if log_entry.get("type") == "team_turn" and "actions" in log_entry:
+            # Преобразуем в детальный формат для UI
+            return [
+                self._format_action_for_history(action_result, log_entry)
+                for action_result in log_entry["actions"]
+                if "action_type" in action_result
+            ]
+
+        if log_entry.get("type") == "crisis":
+            # Добавляем кризисы в историю
+            return [
+                {
+                    "type": "crisis",
+                    "round": log_entry.get("round", "unknown"),
+                    "crisis_id": log_entry["crisis_id"],
+                    "result": log_entry["result"],
+                    "penalty_applied": log_entry.get("penalty_applied", False),
+                }
+            ]
+        return []
 
     def _format_action_for_history(
         self, action_result: Dict[str, Any], log_entry: Dict[str, Any]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from bunker.core.loader import GameData
+from bunker.domain.models.character import stat_profile
+from bunker.domain.models.models import Game
+from bunker.domain.models.phase2_models import Phase2ActionDef
+from bunker.domain.models.stats import STATS, StatVector
+
+__all__ = (
+    "DIE_SIDES",
+    "SUCCESS_COUNTS",
+    "required_roll",
+    "success_chance",
+    "PlayerContribution",
+    "ActionOddsCalculator",
+)
+
+DIE_SIDES = 20
+
+# SUCCESS_COUNTS[k] — сколько граней d20 дают успех, если нужно выкинуть >= k.
+# k = 1 … DIE_SIDES + 1; нулевой индекс не используется.
+SUCCESS_COUNTS: Tuple[int, ...] = (DIE_SIDES,) + tuple(
+    sum(1 for face in range(1, DIE_SIDES + 1) if face >= k)
+    for k in range(1, DIE_SIDES + 2)
+)
+
+
+def required_roll(difficulty: int, combined_stats: int) -> int:
+    """Минимальный бросок d20 для успеха (roll + stats >= difficulty)"""
+    return min(max(1, difficulty - combined_stats), DIE_SIDES + 1)
+
+
+def success_chance(difficulty: int, combined_stats: int) -> float:
+    """Точная вероятность успеха одного броска d20"""
+    return SUCCESS_COUNTS[required_roll(difficulty, combined_stats)] / DIE_SIDES
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerContribution:
+    """Вклад одного игрока в конкретное действие (статы — векторы по STATS)"""
+
+    player_id: str
+    base_stats: StatVector
+    trait_bonuses: StatVector
+    phobia_penalties: StatVector
+    final_stats: StatVector
+    total: float
+    stat_mask: int = -1  # статы, заданные чертами персонажа
+
+    def stats_dict(self, vector: StatVector) -> Dict[str, int]:
+        """Статы персонажа словарем — только заданные его чертами"""
+        return STATS.to_dict(vector, self.stat_mask)
+
+    def stat_contributions(
+        self, stat_weights: Dict[str, float]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Разбивка вклада по статам из ``stat_weights`` действия (для UI)"""
+        details = {}
+        for code, weight in stat_weights.items():
+            i = STATS.position(code)
+            final = self.final_stats[i] if i is not None else 0
+            details[code] = {
+                "base": self.base_stats[i] if i is not None else 0,
+                "trait_bonus": self.trait_bonuses[i] if i is not None else 0,
+                "phobia_penalty": self.phobia_penalties[i] if i is not None else 0,
+                "final": final,
+                "weight": weight,
+                "contribution": final * weight,
+            }
+        return details
+
+
+class ActionOddsCalculator:
+    """Шансы действий Phase2: кэш вкладов игроков + таблица d20.
+
+    Вклад игрока в действие зависит только от его черт и активной фобии,
+    поэтому считается один раз и сбрасывается через ``forget_player`` при
+    срабатывании или лечении фобии. Превью набора участников — это сумма
+    готовых вкладов и поиск в ``SUCCESS_COUNTS``.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        game_data: GameData,
+        trait_bonuses: Callable[[str, Phase2ActionDef], StatVector],
+    ):
+        self.game = game
+        self.config = game_data.phase2_config
+        self._trait_bonuses = trait_bonuses
+        self._contributions: Dict[Tuple[str, str], PlayerContribution] = {}
+
+    # ── кэш вкладов ────────────────────────────────────────
+    def forget_player(self, player_id: str) -> None:
+        for key in [k for k in self._contributions if k[0] == player_id]:
+            del self._contributions[key]
+
+    def clear(self) -> None:
+        self._contributions.clear()
+
+    def contribution(
+        self, player_id: str, action_def: Phase2ActionDef
+    ) -> Optional[PlayerContribution]:
+        """Вклад игрока в действие (None, если персонажа нет)"""
+        key = (player_id, action_def.id)
+        cached = self._contributions.get(key)
+        if cached is None:
+            if player_id not in self.game.characters:
+                return None
+            cached = self._contributions[key] = self._build_contribution(
+                player_id, action_def
+            )
+        return cached
+
+    def _build_contribution(
+        self, player_id: str, action_def: Phase2ActionDef
+    ) -> PlayerContribution:
+        base_stats, mask = stat_profile(self.game.characters[player_id])
+
+        # Фобия снижает характеристики, но не ниже порога
+        phobia_penalties = STATS.zero
+        phobia = self.game.phase2_player_phobias.get(player_id)
+        if phobia is not None:
+            phobia_penalties = phobia.affected_stats
+            floor = self.config.mechanics.get("phobia_stat_floor", -2)
+            base_stats = phobia.apply(base_stats, mask, floor)
+
+        # Бонусы черт — только к статам, которые заданы у персонажа
+        trait_bonuses = self._trait_bonuses(player_id, action_def)
+        final_stats = tuple(
+            value + bonus if mask >> i & 1 else value
+            for i, (value, bonus) in enumerate(zip(base_stats, trait_bonuses))
+        )
+
+        return PlayerContribution(
+            player_id=player_id,
+            base_stats=base_stats,
+            trait_bonuses=trait_bonuses,
+            phobia_penalties=phobia_penalties,
+            final_stats=final_stats,
+            total=STATS.dot(final_stats, action_def.weight_vector),
+            stat_mask=mask,
+        )
+
+    # ── суммы и шансы ──────────────────────────────────────
+    def group_bonus(self, participants_count: int) -> float:
+        if participants_count <= 1:
+            return 0
+        rate = self.config.coefficients.get("group_action_bonus", 0.5)
+        return participants_count * rate
+
+    def combined_stats(
+        self, participants: List[str], action_def: Phase2ActionDef
+    ) -> int:
+        """Сумма вкладов участников с групповым бонусом (до статусов)"""
+        total = 0
+        for player_id in participants:
+            contribution = self.contribution(player_id, action_def)
+            if contribution is not None:
+                total += contribution.total
+        return int(total + self.group_bonus(len(participants)))
+
+    @staticmethod
+    def effective_stats(combined: int, status_modifiers: Dict[str, Any]) -> int:
+        return int(combined * status_modifiers["effectiveness"])
+
+    def odds(
+        self,
+        participants: List[str],
+        action_def: Phase2ActionDef,
+        status_modifiers: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Итоговые статы, нужный бросок и шанс успеха набора участников"""
+        total_stats = self.effective_stats(
+            self.combined_stats(participants, action_def), status_modifiers
+        )
+        difficulty = action_def.difficulty + status_modifiers["difficulty_modifier"]
+        chance = 0.0
+        if not status_modifiers["blocked"]:
+            chance = success_chance(difficulty, total_stats)
+        return {
+            "participants": list(participants),
+            "total_stats": total_stats,
+            "modified_difficulty": difficulty,
+            "required_roll": required_roll(difficulty, total_stats),
+            "success_probability": chance,
+            "success_chance": round(chance * 100),
+        }
+
+    def odds_for_candidates(
+        self,
+        candidates: Iterable[str],
+        action_def: Phase2ActionDef,
+        status_modifiers: Dict[str, Any],
+        max_group: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Шансы для всех непустых наборов участников из ``candidates``"""
+        players = list(candidates)
+        limit = len(players) if max_group is None else min(max_group, len(players))
+        return [
+            self.odds(list(group), action_def, status_modifiers)
+            for size in range(1, limit + 1)
+            for group in combinations(players, size)
+        ]
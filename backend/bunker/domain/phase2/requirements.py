@@ -0,0 +1,175 @@
+"""Компиляция требований действий Phase2 в предикаты.
+
+``requirements`` из ``phase2_actions.yml`` разбираются один раз при загрузке
+``GameData``: каждое требование превращается в замыкание, а вместе с ним
+запоминается, от каких игровых фактов оно зависит. ``ActionFilter`` по этим
+зависимостям перепроверяет только действия, чьи факты изменились.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+
+from bunker.domain.models.character import Character
+from bunker.domain.models.models import Game
+from bunker.domain.models.phase2_models import ActionRequirement
+
+__all__ = (
+    "FACT_TRAITS",
+    "FACT_OBJECTS",
+    "FACT_STATUSES",
+    "FACT_PHOBIAS",
+    "FACT_TEAMS",
+    "RequirementContext",
+    "CompiledRequirement",
+    "compile_requirement",
+)
+
+# Игровые факты, от которых может зависеть доступность действия
+FACT_TRAITS = "traits"
+FACT_OBJECTS = "objects"
+FACT_STATUSES = "statuses"
+FACT_PHOBIAS = "phobias"
+FACT_TEAMS = "teams"
+
+TRAIT_REQUIREMENTS = ("profession", "item", "hobby", "personality", "phobia")
+
+
+@dataclass(slots=True)
+class RequirementContext:
+    """То, на чем вычисляются предикаты требований"""
+
+    game: Game
+    player_id: str
+    character: Character
+
+
+Predicate = Callable[[RequirementContext], bool]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRequirement:
+    """Скомпилированное требование действия и его зависимости"""
+
+    predicate: Predicate
+    depends_on: FrozenSet[str]
+
+    def __call__(self, ctx: RequirementContext) -> bool:
+        return self.predicate(ctx)
+
+
+def _always(_ctx: RequirementContext) -> bool:
+    return True
+
+
+# ── атомарные проверки ─────────────────────────────────────
+def _trait(trait_type: str, required_values: Any) -> Predicate:
+    # списки превращаем в множества; строку оставляем как есть (``in`` по строке)
+    values = (
+        frozenset(required_values)
+        if isinstance(required_values, (list, tuple, set))
+        else required_values
+    )
+
+    def check(ctx: RequirementContext) -> bool:
+        trait = ctx.character.traits.get(trait_type)
+        return trait is not None and trait.name in values
+
+    return check
+
+
+def _bunker_object(object_id: str, required_state: str) -> Predicate:
+    def check(ctx: RequirementContext) -> bool:
+        obj = ctx.game.phase2_bunker_objects.get(object_id)
+        return obj is not None and obj.status == required_state
+
+    return check
+
+
+def _status_active(status_id: str, expected: bool) -> Predicate:
+    def check(ctx: RequirementContext) -> bool:
+        return (status_id in ctx.game.phase2_active_statuses) is expected
+
+    return check
+
+
+def _own_phobia(expected: bool) -> Predicate:
+    def check(ctx: RequirementContext) -> bool:
+        return (ctx.player_id in ctx.game.phase2_player_phobias) is expected
+
+    return check
+
+
+def _team_member_with_phobia(ctx: RequirementContext) -> bool:
+    game = ctx.game
+    team = (
+        game.team_in_bunker
+        if ctx.player_id in game.team_in_bunker
+        else game.team_outside
+    )
+    return any(member_id in game.phase2_player_phobias for member_id in team)
+
+
+# ── компиляция ─────────────────────────────────────────────
+def _compile_single(req: Dict[str, Any]) -> Tuple[Predicate, FrozenSet[str]]:
+    """Одно требование — это И по всем его ключам"""
+    checks: List[Predicate] = []
+    deps = set()
+
+    for req_type, req_value in req.items():
+        if req_type in TRAIT_REQUIREMENTS:
+            checks.append(_trait(req_type, req_value))
+            deps.add(FACT_TRAITS)
+        elif req_type == "bunker_object":
+            # состояние берется из этого же требования
+            state = req.get("bunker_object_state", "working")
+            checks.append(_bunker_object(req_value, state))
+            deps.add(FACT_OBJECTS)
+        elif req_type == "active_status":
+            checks.append(_status_active(req_value, True))
+            deps.add(FACT_STATUSES)
+        elif req_type == "status_not_active":
+            checks.append(_status_active(req_value, False))
+            deps.add(FACT_STATUSES)
+        elif req_type == "active_phobia":
+            checks.append(_own_phobia(bool(req_value)))
+            deps.add(FACT_PHOBIAS)
+        elif req_type == "target_has_phobia":
+            # Для лечения фобий - нужен хотя бы один игрок с фобией в команде
+            if req_value:
+                checks.append(_team_member_with_phobia)
+                deps.update((FACT_PHOBIAS, FACT_TEAMS))
+        # bunker_object_state обрабатывается вместе с bunker_object,
+        # неизвестные ключи не ограничивают действие
+
+    if not checks:
+        return _always, frozenset()
+    if len(checks) == 1:
+        return checks[0], frozenset(deps)
+    return (lambda ctx: all(check(ctx) for check in checks)), frozenset(deps)
+
+
+def compile_requirement(req: ActionRequirement) -> CompiledRequirement:
+    """Скомпилировать all_of / any_of / not_having в один предикат"""
+    all_of = [_compile_single(r) for r in req.all_of]
+    any_of = [_compile_single(r) for r in req.any_of]
+    not_having = [_compile_single(r) for r in req.not_having]
+
+    deps = frozenset().union(*(d for _, d in all_of + any_of + not_having))
+    if not (all_of or any_of or not_having):
+        return CompiledRequirement(_always, deps)
+
+    all_checks = tuple(p for p, _ in all_of)
+    any_checks = tuple(p for p, _ in any_of)
+    none_checks = tuple(p for p, _ in not_having)
+
+    def predicate(ctx: RequirementContext) -> bool:
+        if all_checks and not all(check(ctx) for check in all_checks):
+            return False
+        if any_checks and not any(check(ctx) for check in any_checks):
+            return False
+        if none_checks and any(check(ctx) for check in none_checks):
+            return False
+        return True
+
+    return CompiledRequirement(predicate, deps)
@@ -0,0 +1,323 @@
+"""Безголовый прогон Phase2 для проверки баланса.
+
+Играет партии напрямую через ``Phase2Engine`` — без сокетов, снимков и
+GameEngine — ботами с подключаемыми политиками, раскидывая партии по пулу
+процессов. Пример::
+
+    python -m bunker.domain.phase2.simulation --games 5000 --policy greedy
+"""
+
+from __future__ import annotations
+import argparse
+from abc import ABC, abstractmethod
+import copy
+import json
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from bunker.core.loader import GameData
+from bunker.domain.game_init import GameInitializer
+from bunker.domain.models.models import Game, Player
+from bunker.domain.models.phase2_models import Phase2ActionDef, Phase2Config
+from bunker.domain.phase2.phase2_engine import Phase2Engine
+from bunker.domain.phase2.types import CrisisEvent, CrisisResult
+
+__all__ = (
+    "BotPolicy",
+    "RandomPolicy",
+    "GreedyPolicy",
+    "POLICIES",
+    "SimulationReport",
+    "play_game",
+    "run_batch",
+)
+
+DATA_DIR = Path(__file__).resolve().parents[3] / "data"
+
+
+# ───────────────── Политики ботов ─────────────────────────────────
+class BotPolicy(ABC):
+    """Выбор действий и исход мини-игр за живых игроков"""
+
+    def __init__(self, rng: random.Random, crisis_win_rate: float = 0.5):
+        self.rng = rng
+        self.crisis_win_rate = crisis_win_rate
+
+    @abstractmethod
+    def choose_action(
+        self, engine: Phase2Engine, player_id: str, actions: List[Phase2ActionDef]
+    ) -> Phase2ActionDef: ...
+
+    def resolve_crisis(self, engine: Phase2Engine, crisis: CrisisEvent) -> CrisisResult:
+        if self.rng.random() < self.crisis_win_rate:
+            return CrisisResult.BUNKER_WIN
+        return CrisisResult.BUNKER_LOSE
+
+
+class RandomPolicy(BotPolicy):
+    """Случайное доступное действие"""
+
+    def choose_action(self, engine, player_id, actions):
+        return self.rng.choice(actions)
+
+
+class GreedyPolicy(BotPolicy):
+    """Действие с наибольшим шансом успеха для игрока в одиночку"""
+
+    def choose_action(self, engine, player_id, actions):
+        chances = [
+            engine.get_action_preview([player_id], a.id)["success_probability"]
+            for a in actions
+        ]
+        best = max(chances)
+        return self.rng.choice([a for a, c in zip(actions, chances) if c == best])
+
+
+POLICIES: Dict[str, Type[BotPolicy]] = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+}
+
+
+# ───────────────── Отчет ──────────────────────────────────────────
+@dataclass(slots=True)
+class SimulationReport:
+    """Агрегированные итоги серии партий"""
+
+    games: int = 0
+    winners: Counter = field(default_factory=Counter)
+    conditions: Counter = field(default_factory=Counter)
+    rounds: Counter = field(default_factory=Counter)
+    stalled: int = 0
+    # action_id -> [попыток, успехов]
+    actions: Dict[str, List[int]] = field(default_factory=dict)
+
+    def record_action(self, action_id: str, success: bool) -> None:
+        stats = self.actions.setdefault(action_id, [0, 0])
+        stats[0] += 1
+        stats[1] += int(success)
+
+    def merge(self, other: "SimulationReport") -> "SimulationReport":
+        self.games += other.games
+        self.winners.update(other.winners)
+        self.conditions.update(other.conditions)
+        self.rounds.update(other.rounds)
+        self.stalled += other.stalled
+        for action_id, (attempts, successes) in other.actions.items():
+            stats = self.actions.setdefault(action_id, [0, 0])
+            stats[0] += attempts
+            stats[1] += successes
+        return self
+
+    def win_rates(self) -> Dict[str, float]:
+        if not self.games:
+            return {}
+        return {team: n / self.games for team, n in self.winners.items()}
+
+    def success_rates(self) -> Dict[str, float]:
+        return {
+            action_id: successes / attempts
+            for action_id, (attempts, successes) in self.actions.items()
+            if attempts
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "games": self.games,
+            "stalled": self.stalled,
+            "win_rates": self.win_rates(),
+            "victory_conditions": dict(self.conditions),
+            "rounds": dict(sorted(self.rounds.items())),
+            "action_success": {
+                action_id: {
+                    "attempts": attempts,
+                    "successes": successes,
+                    "rate": successes / attempts,
+                }
+                for action_id, (attempts, successes) in sorted(self.actions.items())
+                if attempts
+            },
+        }
+
+
+# ───────────────── Одна партия ────────────────────────────────────
+def _with_overrides(
+    game_data: GameData, overrides: Optional[Dict[str, Dict[str, Any]]]
+) -> GameData:
+    """Копия GameData с подмененными секциями phase2_config"""
+    if not overrides:
+        return game_data
+    config = game_data.phase2_config
+    patched = copy.copy(game_data)
+    patched.phase2_config = Phase2Config(
+        game_settings={**config.game_settings, **overrides.get("game_settings", {})},
+        victory_conditions={
+            **config.victory_conditions,
+            **overrides.get("victory_conditions", {}),
+        },
+        mechanics={**config.mechanics, **overrides.get("mechanics", {})},
+        coefficients={**config.coefficients, **overrides.get("coefficients", {})},
+    )
+    return patched
+
+
+def play_game(
+    game_data: GameData,
+    policy: BotPolicy,
+    seed: int,
+    players: int = 6,
+    bunker_size: Optional[int] = None,
+    report: Optional[SimulationReport] = None,
+    max_steps: int = 10_000,
+) -> SimulationReport:
+    """Сыграть одну партию Phase2 и дописать итог в ``report``"""
+    report = report or SimulationReport()
+    game = Game(Player("Host", "sim-host"), seed=seed)
+    for i in range(players):
+        player = Player(f"Bot{i}", f"sim-{i}", id=f"BOT{i}")
+        game.players[player.id] = player
+    GameInitializer(game_data).setup_new_game(game)
+
+    player_ids = list(game.players)
+    game.rng.shuffle(player_ids)
+    cut = bunker_size if bunker_size is not None else players // 2
+    game.team_in_bunker = set(player_ids[:cut])
+    game.team_outside = set(player_ids[cut:])
+
+    engine = Phase2Engine(game, game_data)
+    engine.initialize_phase2()
+
+    condition = None
+    for _ in range(max_steps):
+        crisis = engine.get_current_crisis()
+        player_id = engine.get_current_player()
+        if crisis:
+            engine.resolve_crisis(policy.resolve_crisis(engine, crisis))
+        elif player_id is not None:
+            actions = engine.get_available_actions_for_player(player_id)
+            if not actions:
+                break
+            choice = policy.choose_action(engine, player_id, actions)
+            engine.add_player_action(player_id, choice.id)
+        elif engine.can_process_actions():
+            result = engine.process_current_action()
+            report.record_action(result.action_type, result.success)
+        else:
+            engine.finish_team_turn()
+
+        condition = engine.check_victory_conditions()
+        if condition:
+            break
+
+    report.games += 1
+    if condition:
+        report.winners[game.winner] += 1
+        report.conditions[condition] += 1
+        report.rounds[game.phase2_round] += 1
+    else:
+        report.stalled += 1
+    return report
+
+
+# ───────────────── Пул процессов ──────────────────────────────────
+_worker_data: Dict[str, GameData] = {}
+
+
+def _game_data(data_dir: str) -> GameData:
+    # GameData грузится один раз на процесс
+    if data_dir not in _worker_data:
+        _worker_data[data_dir] = GameData(root=data_dir)
+    return _worker_data[data_dir]
+
+
+def _play_chunk(
+    args: Tuple[str, str, Sequence[int], Dict[str, Any]],
+) -> SimulationReport:
+    data_dir, policy_name, seeds, options = args
+    game_data = _with_overrides(_game_data(data_dir), options.get("overrides"))
+    report = SimulationReport()
+    for seed in seeds:
+        policy = POLICIES[policy_name](
+            random.Random(seed ^ 0x5EED), options.get("crisis_win_rate", 0.5)
+        )
+        play_game(
+            game_data,
+            policy,
+            seed,
+            players=options.get("players", 6),
+            bunker_size=options.get("bunker_size"),
+            report=report,
+        )
+    return report
+
+
+def run_batch(
+    games: int,
+    policy: str = "random",
+    seed: int = 0,
+    workers: Optional[int] = None,
+    data_dir: Path | str = DATA_DIR,
+    chunk_size: int = 100,
+    **options: Any,
+) -> SimulationReport:
+    """Сыграть ``games`` партий и собрать общий отчет.
+
+    ``workers=0`` — в текущем процессе; иначе через ProcessPoolExecutor.
+    ``options``: players, bunker_size, crisis_win_rate и overrides —
+    подмена секций phase2_config, например
+    ``{"game_settings": {"max_rounds": 7}}``.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}'")
+
+    seeds = list(range(seed, seed + games))
+    chunks = [
+        (str(data_dir), policy, seeds[i : i + chunk_size], options)
+        for i in range(0, len(seeds), chunk_size)
+    ]
+
+    report = SimulationReport()
+    if workers == 0:
+        for chunk in chunks:
+            report.merge(_play_chunk(chunk))
+        return report
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for partial in pool.map(_play_chunk, chunks):
+            report.merge(partial)
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo прогон Phase2")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--crisis-win-rate", type=float, default=0.5)
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    parser.add_argument(
+        "--overrides", default=None, help='JSON, например {"game_settings": {...}}'
+    )
+    args = parser.parse_args(argv)
+
+    report = run_batch(
+        args.games,
+        policy=args.policy,
+        seed=args.seed,
+        workers=args.workers,
+        data_dir=args.data_dir,
+        players=args.players,
+        crisis_win_rate=args.crisis_win_rate,
+        overrides=json.loads(args.overrides) if args.overrides else None,
+    )
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+from bunker.domain.models.stats import STATS, StatRegistry, StatVector
+
+__all__ = ("TEAM_STAT_KEYS", "TeamStatLedger")
+
+TEAM_STAT_KEYS = STATS.codes
+
+
+class TeamStatLedger:
+    """Командные статы как сумма отдельных вкладов.
+
+    Каждый источник (черты игрока с фобией, дебафы команды, объект бункера,
+    статус) хранится отдельной дельтой — вектором в порядке реестра статов.
+    При изменении источника из итога вычитается его старая дельта и
+    прибавляется новая; словари собираются только в ``totals()``.
+    """
+
+    def __init__(self, registry: StatRegistry = STATS):
+        self._registry = registry
+        self._totals: Dict[str, List[int]] = {}
+        self._deltas: Dict[Tuple[str, Hashable], StatVector] = {}
+
+    def reset(self, teams: Iterable[str]) -> None:
+        """Обнулить итоги и забыть все вклады."""
+        self._totals = {team: list(self._registry.zero) for team in teams}
+        self._deltas.clear()
+
+    def set(self, team: str, source: Hashable, delta: StatVector) -> None:
+        """Заменить вклад источника в статы команды."""
+        totals = self._totals.get(team)
+        if totals is None:
+            return
+
+        old = self._deltas.pop((team, source), None)
+        if old:
+            for i, value in enumerate(old):
+                totals[i] -= value
+
+        if any(delta):
+            for i, value in enumerate(delta):
+                totals[i] += value
+            self._deltas[(team, source)] = delta
+
+    def discard(self, team: str, source: Hashable) -> None:
+        """Убрать вклад источника."""
+        self.set(team, source, self._registry.zero)
+
+    def delta(self, team: str, source: Hashable) -> StatVector:
+        return self._deltas.get((team, source), self._registry.zero)
+
+    def totals(self) -> Dict[str, Dict[str, int]]:
+        """Итоговые статы по командам (словари для снимка партии)."""
+        to_dict = self._registry.to_dict
+        return {team: to_dict(stats) for team, stats in self._totals.items()}
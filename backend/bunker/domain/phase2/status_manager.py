@@ -1,28 +1,67 @@
 from __future__ import annotations
-from typing import Dict, List, Set, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from bunker.domain.models.character import stat_profile
 from bunker.domain.models.models import Game
-from bunker.domain.models.status_models import StatusDef, ActiveStatus
+from bunker.domain.models.status_models import (
+    ActionModifier,
+    ActiveStatus,
+    StatusDef,
+    index_action_modifiers,
+)
 from bunker.core.loader import GameData
+from bunker.core.logs import get_logger
 
+log = get_logger(__name__)
+
+
+def _neutral_modifiers() -> Dict[str, Any]:
+    return {
+        "difficulty_modifier": 0,
+        "effectiveness": 1.0,
+        "blocked": False,
+        "blocking_statuses": [],
+    }
 
-class StatusManager:
-    """Менеджер активных статусов в игре"""
 
-    def __init__(self, game: Game, game_data: GameData):
+class StatusManager:
+    """Менеджер активных статусов в игре.
+
+    Модификаторы действий и статов команд хранятся уже сложенными и
+    обновляются только на то, что вносит применяемый или снимаемый статус.
+    Кто меняет ``game.phase2_active_statuses`` в обход менеджера, должен
+    вызвать ``rebuild()``.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        game_data: GameData,
+        on_stats_change: Optional[Callable[[str, str], None]] = None,
+    ):
         self.game = game
         self.status_definitions = game_data.statuses
+        # индекс строится при загрузке данных; без него (моки) — здесь
+        self._modifier_index: Dict[str, List[Tuple[str, ActionModifier]]] = getattr(
+            game_data, "status_action_modifiers", None
+        ) or index_action_modifiers(self.status_definitions)
+        self._action_modifiers: Dict[str, Dict[str, Any]] = {}
+        # статические описания статусов для API, собираются один раз
+        self._descriptions: Dict[str, Dict[str, Any]] = {}
+        self.rebuild()
+        # (kind, key) источника командных статов, который надо пересчитать
+        self._on_stats_change = on_stats_change
 
     def apply_status(self, status_id: str, source: str = "") -> bool:
         """Применить статус к игре"""
         if status_id not in self.status_definitions:
-            print(f"WARNING: Unknown status {status_id}")
+            log.warning("Unknown status %s", status_id)
             return False
 
         # Проверяем что статус не активен (не стакается)
         if self.is_status_active(status_id):
-            print(f"Status {status_id} already active, ignoring")
+            log.debug("Status %s already active, ignoring", status_id)
             return False
 
         status_def = self.status_definitions[status_id]
@@ -30,7 +69,7 @@ class StatusManager:
         # Проверяем конфликты
         for conflict_id in status_def.interactions.conflicts_with:
             if self.is_status_active(conflict_id):
-                print(f"Status {status_id} conflicts with active {conflict_id}")
+                log.debug("Status %s conflicts with active %s", status_id, conflict_id)
                 return False
 
         # Создаем активный статус
@@ -51,14 +90,10 @@ class StatusManager:
                 active_status.enhanced_by.append(enhancer_id)
 
         # Добавляем в игру
-        if not hasattr(self.game, "phase2_active_statuses_detailed"):
-            self.game.phase2_active_statuses_detailed = {}
-
-        self.game.phase2_active_statuses_detailed[status_id] = active_status
+        self.game.phase2_active_statuses.add(active_status)
 
-        # Обновляем простой список для совместимости
-        if status_id not in self.game.phase2_active_statuses:
-            self.game.phase2_active_statuses.append(status_id)
+        self._recalculate_team_effects(status_id)
+        self._reaggregate(status_def)
 
         # Применяем немедленные эффекты
         self._apply_immediate_effects(status_def)
@@ -66,7 +101,7 @@ class StatusManager:
         # Триггерим фобии
         self._trigger_phobias(status_def)
 
-        print(f"Applied status {status_id} from {source}")
+        log.debug("Applied status %s from %s", status_id, source)
         return True
 
     def remove_status(self, status_id: str) -> bool:
@@ -74,18 +109,14 @@ class StatusManager:
         if not self.is_status_active(status_id):
             return False
 
-        # Удаляем из детального списка
-        if hasattr(self.game, "phase2_active_statuses_detailed"):
-            self.game.phase2_active_statuses_detailed.pop(status_id, None)
-
-        # Удаляем из простого списка
-        if status_id in self.game.phase2_active_statuses:
-            self.game.phase2_active_statuses.remove(status_id)
+        self.game.phase2_active_statuses.discard(status_id)
 
         # Снимаем эффекты (пересчитываем статы команд)
-        self._recalculate_team_effects()
+        self._recalculate_team_effects(status_id)
+        if status_id in self.status_definitions:
+            self._reaggregate(self.status_definitions[status_id])
 
-        print(f"Removed status {status_id}")
+        log.debug("Removed status %s", status_id)
         return True
 
     def is_status_active(self, status_id: str) -> bool:
@@ -110,19 +141,11 @@ class StatusManager:
 
     def update_statuses_for_round(self) -> List[str]:
         """Обновить статусы на новый раунд, вернуть истекшие"""
-        if not hasattr(self.game, "phase2_active_statuses_detailed"):
-            return []
-
-        expired_statuses = []
         current_round = self.game.phase2_round
-        print(f"Updating statuses for round {current_round}")
-        print(f"Current active statuses: {self.game.phase2_active_statuses}")
-        for status_id, active_status in list(
-            self.game.phase2_active_statuses_detailed.items()
-        ):
-            if active_status.is_expired(current_round):
-                expired_statuses.append(status_id)
-                self.remove_status(status_id)
+        log.debug("Updating statuses for round %s", current_round)
+        expired_statuses = self.game.phase2_active_statuses.due(current_round)
+        for status_id in expired_statuses:
+            self.remove_status(status_id)
 
         return expired_statuses
 
@@ -171,46 +194,43 @@ class StatusManager:
 
     def get_action_modifiers(self, action_id: str) -> Dict[str, Any]:
         """Получить модификаторы действия от статусов"""
-        modifiers = {
-            "difficulty_modifier": 0,
-            "effectiveness": 1.0,
-            "blocked": False,
-            "blocking_statuses": [],
-        }
-
-        for status_id in self.game.phase2_active_statuses:
-            status_def = self.status_definitions.get(status_id)
-            if not status_def:
-                continue
-
-            for action_mod in status_def.effects.action_modifiers:
-                if action_mod.action_id == action_id:
-                    modifiers["difficulty_modifier"] += action_mod.difficulty_modifier
-                    modifiers["effectiveness"] *= action_mod.effectiveness
-
-                    if action_mod.blocked:
-                        modifiers["blocked"] = True
-                        modifiers["blocking_statuses"].append(status_id)
-
-        return modifiers
-
-    def get_team_stat_modifiers(self) -> Dict[str, Dict[str, int]]:
-        """Получить модификаторы статов команд от статусов"""
-        modifiers = {"bunker": {}, "outside": {}}
-
-        for status_id in self.game.phase2_active_statuses:
-            status_def = self.status_definitions.get(status_id)
-            if not status_def:
-                continue
-
-            for team, team_mods in status_def.effects.team_stats.items():
-                if team not in modifiers:
-                    continue
+        modifiers = self._action_modifiers.get(action_id)
+        if modifiers is None:
+            return _neutral_modifiers()
+        return {**modifiers, "blocking_statuses": list(modifiers["blocking_statuses"])}
+
+    def rebuild(self) -> None:
+        """Сложить модификаторы действий заново по активным статусам"""
+        self._action_modifiers.clear()
+        for action_id in self._modifier_index:
+            self._aggregate(action_id)
+
+    def _reaggregate(self, status_def: StatusDef) -> None:
+        """Пересчитать модификаторы действий, которых касается статус"""
+        for action_id in {mod.action_id for mod in status_def.effects.action_modifiers}:
+            self._aggregate(action_id)
+
+    def _aggregate(self, action_id: str) -> None:
+        active = self.game.phase2_active_statuses
+        entries = [
+            (active.rank(status_id), status_id, action_mod)
+            for status_id, action_mod in self._modifier_index.get(action_id, ())
+            if status_id in active
+        ]
+        if not entries:
+            self._action_modifiers.pop(action_id, None)
+            return
 
-                for stat, modifier in team_mods.items():
-                    modifiers[team][stat] = modifiers[team].get(stat, 0) + modifier
+        # порядок активации статусов — как при обходе активного списка
+        modifiers = _neutral_modifiers()
+        for _, status_id, action_mod in sorted(entries, key=lambda e: e[0]):
+            modifiers["difficulty_modifier"] += action_mod.difficulty_modifier
+            modifiers["effectiveness"] *= action_mod.effectiveness
 
-        return modifiers
+            if action_mod.blocked:
+                modifiers["blocked"] = True
+                modifiers["blocking_statuses"].append(status_id)
+        self._action_modifiers[action_id] = modifiers
 
     def _apply_immediate_effects(self, status_def: StatusDef) -> None:
         """Применить немедленные эффекты статуса"""
@@ -221,8 +241,11 @@ class StatusManager:
 
                 if obj_effect.status_change:
                     obj.status = obj_effect.status_change
-                    print(
-                        f"Object {obj_effect.object_id} status changed to {obj_effect.status_change}"
+                    self._notify_stats("object", obj_effect.object_id)
+                    log.debug(
+                        "Object %s status changed to %s",
+                        obj_effect.object_id,
+                        obj_effect.status_change,
                     )
 
     def _trigger_phobias(self, status_def: StatusDef) -> None:
@@ -253,105 +276,118 @@ class StatusManager:
                     # Обычная фобия - снижаем характеристики
                     from bunker.domain.models.models import PhobiaStatus
 
-                    char_stats = character.aggregate_stats()
-                    affected_stats = {}
+                    char_stats, mask = stat_profile(character)
                     floor = -2  # минимальное значение
-
-                    for stat, value in char_stats.items():
-                        if value > floor:
-                            affected_stats[stat] = floor - value
-
-                    phobia_status = PhobiaStatus(
-                        phobia_name=player_phobia,
-                        trigger_source=status_def.id,
-                        affected_stats=affected_stats,
+                    phobia_status = PhobiaStatus.for_character(
+                        player_phobia, status_def.id, char_stats, mask, floor
                     )
 
                     self.game.phase2_player_phobias[player_id] = phobia_status
+                    self._notify_stats("player", player_id)
+
+    def _recalculate_team_effects(self, status_id: str) -> None:
+        """Пометить вклад статуса в статы команд для пересчета в Phase2Engine"""
+        self._notify_stats("status", status_id)
 
-    def _recalculate_team_effects(self) -> None:
-        """Пересчитать эффекты команд после изменения статусов"""
-        # Этот метод будет вызван из Phase2Engine для пересчета статов
-        pass
+    def _notify_stats(self, kind: str, key: str) -> None:
+        if self._on_stats_change:
+            self._on_stats_change(kind, key)
 
     def get_statuses_for_api(self) -> List[Dict[str, Any]]:
         """Получить статусы для API с полной информацией"""
-        result = []
+        return [
+            {**self._describe(status_id), **state}
+            for status_id, state in self._active_states()
+        ]
+
+    def get_active_statuses(self) -> List[Dict[str, Any]]:
+        """Только динамические поля активных статусов — для снимков.
+
+        Описание статуса (имя, иконка, эффекты) клиент берет из манифеста
+        контента (``bunker.domain.phase2.manifest``).
+        """
+        return [state for _, state in self._active_states()]
 
+    def _active_states(self):
         for status_id in self.game.phase2_active_statuses:
-            status_def = self.status_definitions.get(status_id)
-            if not status_def:
+            if status_id not in self.status_definitions:
                 continue
 
-            active_status = None
-            if hasattr(self.game, "phase2_active_statuses_detailed"):
-                active_status = self.game.phase2_active_statuses_detailed.get(status_id)
-
-            status_data = {
-                "id": status_id,
-                "name": status_def.name,
-                "description": status_def.description,
-                "severity": status_def.severity,
-                "ui": {"icon": status_def.ui.icon, "color": status_def.ui.color},
-                "effects": self._format_effects_for_api(status_def),
-                "removal_conditions": [
-                    {
-                        "action_id": cond.action_id,
-                        "description": f"Требуется действие: {cond.action_id}",
-                    }
-                    for cond in status_def.removal_conditions
-                ],
-            }
-
+            state: Dict[str, Any] = {"id": status_id}
+            active_status = self.game.phase2_active_statuses.get(status_id)
             if active_status:
-                status_data["applied_at_round"] = active_status.applied_at_round
-                status_data["remaining_rounds"] = active_status.remaining_rounds
-                status_data["source"] = active_status.source
-                status_data["enhanced_by"] = active_status.enhanced_by
-
-            result.append(status_data)
-
-        return result
-
-    def _format_effects_for_api(self, status_def: StatusDef) -> List[str]:
-        """Форматировать эффекты для показа в UI"""
-        effects = []
-
-        # Per-round эффекты
-        for resource, change in status_def.effects.per_round_effects.items():
-            if change > 0:
-                effects.append(f"+{change} {resource} каждый раунд")
+                state["applied_at_round"] = active_status.applied_at_round
+                state["remaining_rounds"] = active_status.remaining_rounds
+                state["source"] = active_status.source
+                state["enhanced_by"] = list(active_status.enhanced_by)
+            yield status_id, state
+
+    def _describe(self, status_id: str) -> Dict[str, Any]:
+        described = self._descriptions.get(status_id)
+        if described is None:
+            described = describe_status(self.status_definitions[status_id])
+            self._descriptions[status_id] = described
+        return described
+
+
+def describe_status(status_def: StatusDef) -> Dict[str, Any]:
+    """Статическое описание статуса для UI (не зависит от партии)"""
+    return {
+        "id": status_def.id,
+        "name": status_def.name,
+        "description": status_def.description,
+        "severity": status_def.severity,
+        "ui": {"icon": status_def.ui.icon, "color": status_def.ui.color},
+        "effects": format_status_effects(status_def),
+        "removal_conditions": [
+            {
+                "action_id": cond.action_id,
+                "description": f"Требуется действие: {cond.action_id}",
+            }
+            for cond in status_def.removal_conditions
+        ],
+    }
+
+
+def format_status_effects(status_def: StatusDef) -> List[str]:
+    """Форматировать эффекты для показа в UI"""
+    effects = []
+
+    # Per-round эффекты
+    for resource, change in status_def.effects.per_round_effects.items():
+        if change > 0:
+            effects.append(f"+{change} {resource} каждый раунд")
+        else:
+            effects.append(f"{change} {resource} каждый раунд")
+
+    # Статы команд
+    for team, team_mods in status_def.effects.team_stats.items():
+        for stat, modifier in team_mods.items():
+            if modifier > 0:
+                effects.append(f"+{modifier} {stat} для команды {team}")
             else:
-                effects.append(f"{change} {resource} каждый раунд")
-
-        # Статы команд
-        for team, team_mods in status_def.effects.team_stats.items():
-            for stat, modifier in team_mods.items():
-                if modifier > 0:
-                    effects.append(f"+{modifier} {stat} для команды {team}")
-                else:
-                    effects.append(f"{modifier} {stat} для команды {team}")
-
-        # Заблокированные действия
-        blocked_actions = [
-            mod.action_id for mod in status_def.effects.action_modifiers if mod.blocked
-        ]
-        if blocked_actions:
-            effects.append(f"Блокирует действия: {', '.join(blocked_actions)}")
-
-        # Затрудненные действия
-        harder_actions = [
-            f"{mod.action_id} (+{mod.difficulty_modifier})"
-            for mod in status_def.effects.action_modifiers
-            if mod.difficulty_modifier > 0 and not mod.blocked
-        ]
-        if harder_actions:
-            effects.append(f"Затрудняет: {', '.join(harder_actions)}")
-
-        # Фобии
-        if status_def.effects.triggers_phobias:
-            effects.append(
-                f"Триггерит фобии: {', '.join(status_def.effects.triggers_phobias)}"
-            )
+                effects.append(f"{modifier} {stat} для команды {team}")
+
+    # Заблокированные действия
+    blocked_actions = [
+        mod.action_id for mod in status_def.effects.action_modifiers if mod.blocked
+    ]
+    if blocked_actions:
+        effects.append(f"Блокирует действия: {', '.join(blocked_actions)}")
+
+    # Затрудненные действия
+    harder_actions = [
+        f"{mod.action_id} (+{mod.difficulty_modifier})"
+        for mod in status_def.effects.action_modifiers
+        if mod.difficulty_modifier > 0 and not mod.blocked
+    ]
+    if harder_actions:
+        effects.append(f"Затрудняет: {', '.join(harder_actions)}")
+
+    # Фобии
+    if status_def.effects.triggers_phobias:
+        effects.append(
+            f"Триггерит фобии: {', '.join(status_def.effects.triggers_phobias)}"
+        )
 
-        return effects
+    return effects
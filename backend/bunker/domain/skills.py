@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set
 from enum import Enum
+from bunker.core.logs import get_logger
+
+log = get_logger(__name__)
 
 
 class StatType(Enum):
@@ -82,7 +85,7 @@ class SkillCheckResolver:
 
         # Базовый бросок
         roll = self._rng.randint(1, 20)
-        print(f"Бросок кубика: {roll}")
+        log.debug("Бросок кубика: %s", roll)
         # Применяем модификаторы
         total_modifier = 0
         for stat_name, modifier in skill_check.modifiers.items():
@@ -27,6 +27,7 @@ class ActionType(Enum):
     PROCESS_ACTION = auto()  # новое
     RESOLVE_CRISIS = auto()  # новое
     FINISH_TEAM_TURN = auto()  # новое
+    TURN_TIMEOUT = auto()  # системное: истек срок хода (таймер сервера)
 
 
 @dataclass(frozen=True)
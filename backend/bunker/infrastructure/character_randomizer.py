@@ -1,13 +1,14 @@
 import os
-import yaml
 import random
 
+from bunker.core.loader import load_raw
+
 CHARACTER_ATTRS = [
-    ("profession", "professions.yml"),
-    ("hobby", "hobbies.yml"),
-    ("health", "healths.yml"),
-    ("item", "items.yml"),
-    ("phobia", "phobias.yml"),
+    ("profession", "professions"),
+    ("hobby", "hobbies"),
+    ("health", "healths"),
+    ("item", "items"),
+    ("phobia", "phobias"),
 ]
 
 POOLS = {}
@@ -22,10 +23,10 @@ def load_all_character_pools():
     global POOLS
     POOLS = {}
     base_dir = os.path.abspath(_data_dir())
-    for attr, fname in CHARACTER_ATTRS:
-        full_path = os.path.join(base_dir, fname)
-        with open(full_path, encoding="utf-8") as f:
-            POOLS[attr] = yaml.safe_load(f)
+    # те же файлы, что и у GameData, — берем из скомпилированного пакета
+    raw = load_raw(base_dir)
+    for attr, name in CHARACTER_ATTRS:
+        POOLS[attr] = raw[name]
     return POOLS
 
 
@@ -0,0 +1,88 @@
+"""Очередь сообщений Socket.IO между воркерами.
+
+Комнаты липкие — сокеты партии живут на воркере-владельце, — но emit может
+прийти и из другого процесса (роутер, фоновые задачи, соседний шард). Для
+этого менеджер клиентов Socket.IO работает поверх общей шины:
+
+* ``redis://…`` / ``amqp://…`` — штатные менеджеры python-socketio
+  (нужен пакет ``redis`` или ``kombu``);
+* ``local://<канал>`` — замена для тестов и одного процесса: менеджеры
+  с одним каналом доставляют друг другу emit синхронно, без брокера.
+"""
+
+from __future__ import annotations
+import weakref
+from typing import Optional
+
+import socketio
+
+__all__ = ("LocalQueueManager", "client_manager")
+
+LOCAL_SCHEME = "local://"
+
+
+class LocalQueueManager(socketio.Manager):
+    """In-process шина между серверами Socket.IO одного канала.
+
+    Не наследует ``PubSubManager``: с ним не работает тестовый клиент
+    Flask-SocketIO, а доставка внутри процесса и так синхронная.
+    """
+
+    _channels: "dict[str, weakref.WeakSet[LocalQueueManager]]" = {}
+
+    def __init__(self, channel: str = "socketio", write_only: bool = False):
+        super().__init__()
+        self.channel = channel
+        self.write_only = write_only
+        if not write_only:
+            self._channels.setdefault(channel, weakref.WeakSet()).add(self)
+
+    def emit(
+        self,
+        event,
+        data,
+        namespace=None,
+        room=None,
+        skip_sid=None,
+        callback=None,
+        to=None,
+        **kwargs,
+    ):
+        namespace = namespace or "/"
+        room = to or room
+        if self.server is not None:
+            super().emit(
+                event,
+                data,
+                namespace,
+                room=room,
+                skip_sid=skip_sid,
+                callback=callback,
+            )
+        if kwargs.get("ignore_queue"):
+            return
+        # ответы (callback) между серверами не доставляются — как и у
+        # PubSubManager без общего ack-хранилища
+        for peer in list(self._channels.get(self.channel, ())):
+            if peer is not self and peer.server is not None:
+                peer.emit(
+                    event,
+                    data,
+                    namespace,
+                    room=room,
+                    skip_sid=skip_sid,
+                    ignore_queue=True,
+                )
+
+
+def client_manager(
+    url: Optional[str], channel: str = "bunker", write_only: bool = False
+) -> Optional[socketio.Manager]:
+    """Менеджер клиентов для ``BUNKER_MESSAGE_QUEUE`` (None — без очереди)"""
+    if not url:
+        return None
+    if url.startswith(LOCAL_SCHEME):
+        return LocalQueueManager(url[len(LOCAL_SCHEME) :] or channel, write_only)
+    if url.startswith(("redis://", "rediss://")):
+        return socketio.RedisManager(url, channel=channel, write_only=write_only)
+    return socketio.KombuManager(url, channel=channel, write_only=write_only)
@@ -0,0 +1,259 @@
+"""SQLite-хранилище партий: журнал событий + контрольные точки.
+
+Каждое принятое изменение партии дописывается в ``events`` (append-only),
+периодически в ``checkpoints`` кладется сжатый снимок состояния. Для
+восстановления берется последняя контрольная точка и хвост событий после нее.
+
+Запись идет мимо пути запроса: ``append``/``checkpoint`` только кладут строку
+в очередь, отдельный поток-писатель забирает их пачками и коммитит одной
+транзакцией (WAL, ``synchronous=NORMAL``), так что задержка действия не
+включает fsync. Если пачка не записалась, строки повторяются по одной; партии,
+чьи строки так и не легли в базу, отдает ``take_lost`` — журнал снимает для
+них внеочередную контрольную точку.
+"""
+
+from __future__ import annotations
+import json
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from bunker.core.logs import get_logger
+
+try:
+    # под eventlet.monkey_patch писатель должен остаться настоящим потоком,
+    # иначе fsync заблокирует весь hub
+    from eventlet.patcher import original
+
+    _threading = original("threading")
+    _queue = original("queue")
+except ImportError:  # pragma: no cover - зависит от окружения
+    import queue as _queue
+    import threading as _threading
+
+__all__ = ("SCHEMA_VERSION", "StoredGame", "SQLiteEventStore")
+
+log = get_logger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id          TEXT PRIMARY KEY,
+    status      TEXT NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    game_id     TEXT NOT NULL,
+    seq         INTEGER NOT NULL,
+    kind        TEXT NOT NULL,
+    body        TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    PRIMARY KEY (game_id, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS checkpoints (
+    game_id     TEXT PRIMARY KEY,
+    seq         INTEGER NOT NULL,
+    body        BLOB NOT NULL,
+    created_at  REAL NOT NULL
+);
+"""
+
+# Сколько строк очереди писатель коммитит одной транзакцией
+BATCH_SIZE = 256
+
+_STOP = object()
+
+
+class StoredGame:
+    """Последняя контрольная точка партии и события после нее"""
+
+    __slots__ = ("game_id", "status", "seq", "checkpoint", "events")
+
+    def __init__(
+        self,
+        game_id: str,
+        status: str,
+        seq: int,
+        checkpoint: bytes,
+        events: List[Tuple[int, str, Dict[str, Any]]],
+    ):
+        self.game_id = game_id
+        self.status = status
+        self.seq = seq  # seq контрольной точки
+        self.checkpoint = checkpoint  # распакованные байты снимка
+        self.events = events  # [(seq, kind, body)] с seq > self.seq
+
+    @property
+    def last_seq(self) -> int:
+        return self.events[-1][0] if self.events else self.seq
+
+
+class SQLiteEventStore:
+    """Журнал событий партий в SQLite с фоновым писателем"""
+
+    def __init__(self, path: Path | str, batch_size: int = BATCH_SIZE):
+        self.path = str(path)
+        self.batch_size = batch_size
+        self._queue: "_queue.Queue" = _queue.Queue()
+        self._closed = False
+        self._lost: Set[str] = set()
+        self._lost_lock = _threading.Lock()
+
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self._writer = _threading.Thread(
+            target=self._write_loop, name="bunker-event-store", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    # ── запись (неблокирующая) ─────────────────────────────
+    def append(self, game_id: str, seq: int, kind: str, body: Dict[str, Any]) -> None:
+        """Дописать событие партии (в очередь писателя)"""
+        self._put(
+            game_id,
+            "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)",
+            (game_id, seq, kind, json.dumps(body, ensure_ascii=False), time.time()),
+        )
+
+    def checkpoint(self, game_id: str, seq: int, blob: bytes, status: str) -> None:
+        """Заменить контрольную точку партии снимком на момент события ``seq``"""
+        now = time.time()
+        self._put(
+            game_id,
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)",
+            (game_id, seq, zlib.compress(blob), now),
+        )
+        self._put(
+            game_id,
+            "INSERT OR REPLACE INTO games VALUES (?, ?, ?)",
+            (game_id, status, now),
+        )
+
+    def set_status(self, game_id: str, status: str) -> None:
+        self._put(
+            game_id,
+            "UPDATE games SET status = ?, updated_at = ? WHERE id = ?",
+            (status, time.time(), game_id),
+        )
+
+    def delete(self, game_id: str) -> None:
+        for table, column in (("events", "game_id"), ("checkpoints", "game_id")):
+            self._put(game_id, f"DELETE FROM {table} WHERE {column} = ?", (game_id,))
+        self._put(game_id, "DELETE FROM games WHERE id = ?", (game_id,))
+
+    def _put(self, game_id: str, sql: str, params: tuple) -> None:
+        if self._closed:
+            raise RuntimeError("Event store is closed")
+        self._queue.put((game_id, sql, params))
+
+    def take_lost(self) -> Set[str]:
+        """Забрать id партий, у которых часть записей не легла в базу"""
+        if not self._lost:
+            return set()
+        with self._lost_lock:
+            lost, self._lost = self._lost, set()
+        return lost
+
+    # ── писатель ───────────────────────────────────────────
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except _queue.Empty:
+                        break
+                stop = self._commit(conn, batch)
+                for _ in batch:
+                    self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: list) -> bool:
+        rows = [item for item in batch if item is not _STOP]
+        try:
+            with conn:
+                for _game_id, sql, params in rows:
+                    conn.execute(sql, params)
+        except sqlite3.Error:
+            # транзакция откатилась: повторяем по строке, чтобы сбойная
+            # строка не утянула за собой события других партий
+            log.warning("Event store batch of %s rows failed, retrying", len(rows))
+            for game_id, sql, params in rows:
+                try:
+                    with conn:
+                        conn.execute(sql, params)
+                except sqlite3.Error:
+                    log.exception("Event store write for game %s failed", game_id)
+                    with self._lost_lock:
+                        self._lost.add(game_id)
+        return len(rows) != len(batch)
+
+    def flush(self) -> None:
+        """Дождаться записи всего, что уже стоит в очереди"""
+        self._queue.join()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._queue.put(_STOP)
+        self._closed = True
+        self._writer.join()
+
+    # ── чтение (для восстановления) ────────────────────────
+    def active_games(self) -> List[str]:
+        """id партий, которые не завершены и не выселены в архив"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT id FROM games WHERE status NOT IN ('finished', 'archived') "
+                "ORDER BY updated_at"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def load(self, game_id: str) -> Optional[StoredGame]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT c.seq, c.body, g.status FROM checkpoints c "
+                "JOIN games g ON g.id = c.game_id WHERE c.game_id = ?",
+                (game_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            seq, blob, status = row
+            events = conn.execute(
+                "SELECT seq, kind, body FROM events "
+                "WHERE game_id = ? AND seq > ? ORDER BY seq",
+                (game_id, seq),
+            ).fetchall()
+        return StoredGame(
+            game_id,
+            status,
+            seq,
+            zlib.decompress(blob),
+            [(s, kind, json.loads(body)) for s, kind, body in events],
+        )
+
+    def events(self, game_id: str) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """Полный журнал партии"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT seq, kind, body FROM events WHERE game_id = ? ORDER BY seq",
+                (game_id,),
+            ).fetchall()
+        return [(s, kind, json.loads(body)) for s, kind, body in rows]
@@ -0,0 +1,53 @@
+"""HTTP-маршрутизация клиентов по шардам.
+
+Клиент спрашивает, куда подключаться, и открывает Socket.IO уже на
+воркере-владельце партии::
+
+    GET /route/ABC123  → {"id": "ABC123", "shard": 1, "url": "http://…:5002"}
+    GET /route         → воркер для новой партии (по кругу)
+
+Тот же blueprint отдает каждый воркер и отдельный роутер из
+``bunker.cluster``.
+"""
+
+from __future__ import annotations
+import itertools
+
+from flask import Blueprint, Flask, current_app, jsonify
+
+from bunker.core.sharding import ShardMap
+
+__all__ = ("routing", "init_routing", "create_router")
+
+EXTENSION = "bunker.shards"
+
+routing = Blueprint("routing", __name__)
+
+
+def init_routing(app: Flask, shards: ShardMap) -> None:
+    app.extensions[EXTENSION] = (shards, itertools.count())
+    app.register_blueprint(routing)
+
+
+@routing.get("/route/<game_id>")
+def route_game(game_id: str):
+    shards, _ = current_app.extensions[EXTENSION]
+    return jsonify(shards.route(game_id))
+
+
+@routing.get("/route")
+def route_new_game():
+    shards, counter = current_app.extensions[EXTENSION]
+    index = next(counter) % shards.count
+    url = shards.urls[index] if shards.urls else None
+    return jsonify({"id": None, "shard": index, "url": url})
+
+
+def create_router(shards: ShardMap) -> Flask:
+    """Маленький фронтовой роутер без игр и сокетов"""
+    from .extensions import cors
+
+    app = Flask(__name__)
+    cors.init_app(app, resources={r"/*": {"origins": "*"}})
+    init_routing(app, shards)
+    return app
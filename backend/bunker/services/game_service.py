@@ -1,116 +1,444 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from .repo import game_repo
-from bunker.domain.models.models import Game, Player
+from .journal import GameJournal, checkpoint_blob
+from .mailbox import GameMailbox
+from .reaper import IdleReaper, ReapPolicy
+from .snapshots import SnapshotTracker
+from .timeouts import GameTimeouts, TimeoutPolicy
+from .projection import ViewProjector
+from bunker.domain.models.models import Game, Player, gen_code
 from bunker.domain.engine import GameEngine
-from bunker.domain.types import ActionType
+from bunker.domain.phase2.manifest import ContentManifest, content_manifest
+from bunker.domain.types import ActionType, GameAction, GamePhase
 from bunker.core.loader import GameData
 from bunker.domain.game_init import GameInitializer
+from bunker.core.logs import get_logger
+from bunker.core.sharding import ShardMap
+from bunker.core.timers import TimerWheel
+
+log = get_logger(__name__)
+
+HISTORY_KINDS = ("detailed", "log")
+HISTORY_PAGE_SIZE = 50
+HISTORY_PAGE_MAX = 200
+
+# действия, которые шлет только сам сервер (таймеры), а не клиенты
+SYSTEM_ACTIONS = frozenset({ActionType.TURN_TIMEOUT})
 
 
 class GameService:
-    """Use-case слой: хранит GameEngine-ы и отдаёт фронту их snapshots."""
+    """Use-case слой: хранит GameEngine-ы и отдаёт фронту их snapshots.
+
+    Все изменения партии проходят через ее ``GameMailbox``; чтения отдают
+    последний опубликованный ящиком снимок.
+    """
 
     def __init__(self) -> None:
         self._engines: dict[str, GameEngine] = {}
+        self._mailboxes: dict[str, GameMailbox] = {}
+        # чем ждать занятый ящик; под eventlet — socketio.sleep
+        self._idle: Callable[[float], Any] = time.sleep
+        self._snapshots = SnapshotTracker()
+        self._projector = ViewProjector()
 
         # Загружаем данные один раз
         data_dir = Path(r"C:/Users/Zema/bunker-game/backend/data")
         self._game_data = GameData(root=data_dir)
         self._initializer = GameInitializer(self._game_data)
 
+        # Долговечный журнал партий (None — только память процесса)
+        self._journal: Optional[GameJournal] = None
+        # Какие партии принадлежат этому воркеру
+        self.shards = ShardMap()
+
+        # Выселение простаивающих партий из памяти
+        self.reap_policy = ReapPolicy()
+        self.reaper = IdleReaper(self._idle_ttl, self.evict)
+        self._reaper_task = None
+        # уведомление транспорта: комнату партии пора закрыть (gid, reason)
+        self.on_evict: Optional[Callable[[str, str], Any]] = None
+
+        # Сроки хода/хоста/переподключения (None — без таймеров)
+        self.timeouts: Optional[GameTimeouts] = None
+        # уведомление транспорта: партия изменилась не по запросу клиента
+        self.on_update: Optional[Callable[[str], Any]] = None
+
+    def content_manifest(self) -> ContentManifest:
+        """Манифест статического контента (для ``GET /content/manifest``)"""
+        return content_manifest(self._game_data)
+
+    def configure_shards(self, shards: ShardMap) -> None:
+        self.shards = shards
+
+    def configure_idle(self, idle: Callable[[float], Any]) -> None:
+        self._idle = idle
+        for mailbox in self._mailboxes.values():
+            mailbox.idle = idle
+
+    # ───────────────── Persistence ──────────────────────────────────
+    def attach_journal(self, journal: Optional[GameJournal]) -> None:
+        self._journal = journal
+
+    def recover(self) -> List[str]:
+        """Поднять незавершенные партии из журнала; вернуть их id"""
+        if not self._journal:
+            return []
+        engines = self._journal.recover(
+            self._initializer,
+            self._game_data,
+            skip=set(self._engines),
+            owns=self.shards.owns,
+        )
+        for eng in engines:
+            self._register(eng)
+        return [eng.game.id for eng in engines]
+
+    # ───────────────── Eviction ─────────────────────────────────────
+    def configure_reaper(self, policy: ReapPolicy) -> None:
+        self.reap_policy = policy
+
+    def start_reaper(
+        self, spawn: Callable[..., Any], sleep: Callable[[float], Any]
+    ) -> bool:
+        """Запустить фоновую задачу выселения (одну на процесс)"""
+        interval = self.reap_policy.interval
+        if self._reaper_task is not None or interval <= 0:
+            return False
+        self._reaper_task = spawn(self.reaper.run_forever, sleep, interval)
+        return True
+
+    def evict(self, gid: str, reason: str = "idle", delete: bool = False) -> int:
+        """Выгрузить партию из памяти (сначала в журнал, если он есть).
+
+        С ``delete`` партия закрывается насовсем: журнал удаляет ее записи,
+        и по следующему обращению она уже не поднимется.
+        Возвращает оценку освобожденной памяти — размер контрольной точки.
+        """
+        mailbox = self._mailboxes.get(gid)
+        if mailbox is None:
+            return 0
+
+        def archive(eng: GameEngine) -> int:
+            mailbox.closed = True
+            if self._journal and not delete:
+                return self._journal.archive(eng)
+            if self._journal:
+                self._journal.forget(gid, delete=True)
+            return len(checkpoint_blob(eng))
+
+        size, _ = mailbox.submit(archive)
+        self.reaper.cancel(gid)
+        if self.timeouts:
+            self.timeouts.forget(gid)
+        del self._mailboxes[gid]
+        self._engines.pop(gid, None)
+        game_repo.remove(gid)
+        self._snapshots.forget(gid)
+        self._projector.forget(gid)
+        if self.on_evict:
+            self.on_evict(gid, reason)
+        return size
+
+    # ───────────────── Timers ───────────────────────────────────────
+    def start_timers(
+        self,
+        policy: TimeoutPolicy,
+        spawn: Callable[..., Any],
+        sleep: Callable[[float], Any],
+    ) -> bool:
+        """Запустить колесо таймеров (одно на процесс); повторно — сменить сроки"""
+        if self.timeouts is not None:
+            self.timeouts.configure(policy)
+            return False
+        wheel = TimerWheel(policy.tick)
+        self.timeouts = GameTimeouts(self, wheel, policy)
+        spawn(wheel.run_forever, sleep)
+        return True
+
+    def notify(self, gid: str) -> None:
+        if self.on_update:
+            self.on_update(gid)
+
     # ───────────────── Lobby ────────────────────────────────────────
     def create_game(self, host_name: str, sid: str) -> Dict[str, Any]:
         host = Player(host_name, sid)
-        game = Game(host)
+        game = Game(host, id=self.shards.new_game_id(gen_code))
 
         # Создаем движок с данными
         eng = GameEngine(game, self._initializer, self._game_data)
 
-        self._engines[game.id] = eng
-        game_repo.add(game)
+        if self._journal:
+            self._journal.game_created(eng)
 
-        return eng.view()
+        return self._register(eng).published.public
 
     def join_game(
         self, gid: str, player_name: str, sid: str
     ) -> tuple[Dict[str, Any], str]:
-        game = game_repo.get(gid) or self._not_found()
-        player = Player(player_name, sid)
-        game.players[player.id] = player
-        return self._engines[gid].view(), player.id
+        def join(eng: GameEngine) -> str:
+            player = Player(player_name, sid)
+            eng.game.players[player.id] = player
+            game_repo.bind_sid(sid, gid, player.id)
+            if self._journal:
+                self._journal.player_joined(eng, player)
+            return player.id
+
+        pid, published = self._submit(gid, join)
+        return published.public, pid
 
     # ───────────────── Gameplay ─────────────────────────────────────
     def execute_game_action(
         self, gid: str, action: str, payload: Dict[str, Any] | None = None
     ) -> Dict[str, Any]:
-        eng = self._engines.get(gid) or self._not_found()
+        """Действие от клиента; системные действия сюда не пускаются"""
         try:
             action_type = ActionType[action.upper()]
-            from bunker.domain.types import GameAction
-
-            game_action = GameAction(type=action_type, payload=payload or {})
-            eng.execute(game_action)
         except KeyError:
             raise ValueError(f"Unknown action '{action}'")
-        return eng.view()
+        if action_type in SYSTEM_ACTIONS:
+            raise ValueError(f"Action '{action}' is not allowed")
+        return self._execute(gid, action_type, payload)
+
+    def expire_turn(self, gid: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Истек срок хода команды (вызывается таймером, а не клиентом)"""
+        return self._execute(gid, ActionType.TURN_TIMEOUT, payload)
+
+    def _execute(
+        self, gid: str, action_type: ActionType, payload: Dict[str, Any] | None
+    ) -> Dict[str, Any]:
+        def apply(eng: GameEngine) -> None:
+            game_action = GameAction(type=action_type, payload=payload or {})
+            try:
+                eng.execute(game_action)
+            except KeyError:
+                raise ValueError(f"Unknown action '{action_type.name.lower()}'")
+            if self._journal:
+                self._journal.action_applied(eng, game_action)
+
+        _, published = self._submit(gid, apply)
+        return published.public
 
     def get_game_snapshot(self, gid: str) -> Optional[Dict[str, Any]]:
         """Получить снимок игры без выполнения действий"""
-        eng = self._engines.get(gid)
-        if not eng:
-            return None
-        return eng.view()
+        mailbox = self._lookup(gid)
+        return mailbox.published.full if mailbox else None
+
+    def get_public_snapshot(self, gid: str) -> Optional[Dict[str, Any]]:
+        """Общая для комнаты база снимка (без личных надбавок)"""
+        mailbox = self._lookup(gid)
+        return mailbox.published.public if mailbox else None
 
     def get_phase2_available_actions(self, gid: str, team: str) -> List[Dict[str, Any]]:
         """Получить доступные действия для команды в Phase2"""
-        eng = self._engines.get(gid) or self._not_found()
-        if not eng._phase2_engine:
-            return []
 
-        actions = eng._phase2_engine.get_available_actions(team)
-        return [
-            {
-                "id": action.id,
-                "name": action.name,
-                "difficulty": action.difficulty,
-                "required_stats": action.required_stats,
-                "stat_weights": action.stat_weights,
-            }
-            for action in actions
-        ]
+        def read(eng: GameEngine) -> List[Dict[str, Any]]:
+            if not eng._phase2_engine:
+                return []
+            return [
+                {
+                    "id": action.id,
+                    "name": action.name,
+                    "difficulty": action.difficulty,
+                    "required_stats": action.required_stats,
+                    "stat_weights": action.stat_weights,
+                }
+                for action in eng._phase2_engine.get_available_actions(team)
+            ]
+
+        return self._query(gid, read)
 
     def get_phase2_team_stats(self, gid: str) -> Dict[str, Dict[str, int]]:
-        """Получить статистики команд"""
-        eng = self._engines.get(gid) or self._not_found()
-        game = eng.game
-        return game.phase2_team_stats
+        """Получить статистики команд (из опубликованного снимка)"""
+        mailbox = self._lookup(gid) or self._not_found()
+        return mailbox.published.public.get("phase2", {}).get("team_stats", {})
+
+    def get_action_preview(
+        self, gid: str, participants: List[str], action_id: str
+    ) -> Dict[str, Any]:
+        """Предварительный расчет действия Phase2"""
+
+        def read(eng: GameEngine) -> Dict[str, Any]:
+            if not eng._phase2_engine:
+                raise ValueError("Phase2 not available")
+            return eng._phase2_engine.get_action_preview(participants, action_id)
+
+        return self._query(gid, read)
+
+    def get_action_history(
+        self,
+        gid: str,
+        kind: str = "detailed",
+        after: Optional[List[int]] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Страница истории Phase2 после курсора ``after`` = [раунд, номер]"""
+        if kind not in HISTORY_KINDS:
+            raise ValueError(f"Unknown history kind '{kind}'")
+        if after is not None and (
+            len(after) != 2 or not all(isinstance(x, int) for x in after)
+        ):
+            raise ValueError("Invalid history cursor")
+        limit = min(limit or HISTORY_PAGE_SIZE, HISTORY_PAGE_MAX)
+
+        def read(eng: GameEngine) -> Tuple[list, Any, bool]:
+            if not eng._phase2_engine:
+                return [], after, False
+            return eng._phase2_engine.get_history_page(kind, after, limit)
+
+        entries, cursor, has_more = self._query(gid, read)
+        return {
+            "id": gid,
+            "kind": kind,
+            "entries": entries,
+            "cursor": list(cursor) if cursor else None,
+            "has_more": has_more,
+        }
 
     # ───────────────── Re/connect ───────────────────────────────────
     def rejoin(self, gid: str, player_id: str, sid: str) -> Dict[str, Any]:
-        game = game_repo.get(gid) or self._not_found()
-        player = game.players.get(player_id)
-        if not player and getattr(game, "host", None) and game.host.id == player_id:
-            print(f"Found host")
-            player = game.host
-        if not player:
-            print(f"NotFound player")
-            self._player_not_found()
-
-        player.sid, player.online = sid, True
-        return self._engines[gid].view()
+        def reattach(eng: GameEngine) -> None:
+            game = eng.game
+            player = game.players.get(player_id)
+            if not player and getattr(game, "host", None) and game.host.id == player_id:
+                log.debug("rejoin: host %s", player_id)
+                player = game.host
+            if not player:
+                log.warning("rejoin: player %s not found in game %s", player_id, gid)
+                self._player_not_found()
+
+            # старый сокет игрока больше не его
+            if player.sid and game_repo.locate_sid(player.sid) == (gid, player.id):
+                game_repo.unbind_sid(player.sid)
+            player.sid, player.online = sid, True
+            game_repo.bind_sid(sid, gid, player.id)
+            if self.timeouts:
+                self.timeouts.player_back(gid, player.id)
+
+        _, published = self._submit(gid, reattach)
+        return published.public
 
     def disconnect(self, sid: str) -> Optional[Dict[str, Any]]:
-        for gid, game in game_repo.games.items():
-            for p in game.players.values():
-                if p.sid == sid:
-                    p.online = False
-                    return self._engines[gid].view()
-        return None
+        located = game_repo.locate_sid(sid)
+        if not located:
+            return None
+        gid, _ = located
+
+        def detach_sid(eng: GameEngine) -> None:
+            # сокет могли перепривязать, пока команда ждала в очереди
+            found = game_repo.by_sid(sid)
+            game_repo.unbind_sid(sid)
+            if found:
+                found[1].online = False
+                if self.timeouts:
+                    self.timeouts.player_left(eng, found[1])
+
+        _, published = self._submit(gid, detach_sid)
+        return published.public
+
+    # ───────────────── Broadcast ───────────────────────────────────
+    def publish(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """Патч снимка относительно последнего разосланного в комнату."""
+        game = game_repo.get(snapshot["id"]) or self._not_found()
+        return self._snapshots.patch(game, snapshot, frozen=True)
+
+    def phase_changed(self, snapshot: Dict[str, Any]) -> bool:
+        """Фаза снимка отличается от последней разосланной комнате"""
+        last = self._snapshots.last(snapshot["id"])
+        return last is None or last.get("phase") != snapshot.get("phase")
+
+    def full_snapshot(
+        self, snapshot: Dict[str, Any], sid: str | None = None
+    ) -> Dict[str, Any]:
+        """Полный снимок с версией — для create/join/rejoin и ресинка.
+
+        Получатель определяется по сокету (индекс sid в репозитории), а не
+        по словам клиента: надбавку получает только сокет, привязанный к
+        игроку этой партии. Чужим сокетам уходит одна публичная база.
+        """
+        game = game_repo.get(snapshot["id"]) or self._not_found()
+        full = self._snapshots.full(game, snapshot, frozen=True)
+        owner = game_repo.locate_sid(sid) if sid else None
+        if owner and owner[0] == game.id:
+            full["private"] = self._query(
+                game.id, lambda eng: self._projector.mark_sent(eng, owner[1], sid)
+            )
+        return full
+
+    def private_updates(self, gid: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Изменившиеся личные надбавки участников: [(sid, payload)]."""
+
+        def read(eng: GameEngine) -> List[Tuple[str, Dict[str, Any]]]:
+            version = eng.game.state_version
+            return [
+                (sid, {"id": gid, "version": version, "private": overlay})
+                for sid, overlay in self._projector.changed(eng)
+            ]
+
+        return self._query(gid, read)
+
+    def resync(
+        self,
+        snapshot: Dict[str, Any],
+        client_version: int | None,
+        sid: str | None = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Полный снимок, если у клиента разрыв версий; иначе None.
+
+        Вызывать после ``publish(snapshot)``, чтобы комната не отстала.
+        """
+        game = game_repo.get(snapshot["id"]) or self._not_found()
+        if client_version == game.state_version:
+            return None
+        return self.full_snapshot(snapshot, sid)
 
     # ───────────────── Internals ───────────────────────────────────
+    def _register(self, eng: GameEngine) -> GameMailbox:
+        mailbox = GameMailbox(eng, self._idle)
+        self._engines[eng.game.id] = eng
+        self._mailboxes[eng.game.id] = mailbox
+        game_repo.add(eng.game)
+        self.reaper.touch(eng.game.id)
+        return mailbox
+
+    def _lookup(self, gid: str) -> Optional[GameMailbox]:
+        """Ящик партии; выселенную партию поднимает из журнала"""
+        mailbox = self._mailboxes.get(gid)
+        if mailbox or not (self._journal and self.shards.owns(gid)):
+            return mailbox
+        eng = self._journal.restore(gid, self._initializer, self._game_data)
+        if eng is None:
+            return None
+        log.info("Revived game %s from the event store", gid)
+        return self._register(eng)
+
+    def _submit(self, gid: str, command: Callable[[GameEngine], Any]):
+        """Команда в ящик партии; любое изменение продлевает ей жизнь"""
+        mailbox = self._lookup(gid) or self._not_found()
+        result = mailbox.submit(command)
+        self.reaper.touch(gid)
+        if self.timeouts:
+            self.timeouts.game_changed(mailbox.engine)
+        return result
+
+    def _query(self, gid: str, command: Callable[[GameEngine], Any]):
+        """Чтение живого движка в очереди партии, без новой публикации"""
+        return (self._lookup(gid) or self._not_found()).query(command)
+
+    def _idle_ttl(self, gid: str) -> float:
+        eng = self._engines.get(gid)
+        if eng is None:
+            return 0.0
+        game = eng.game
+        if game.status == "finished" or eng.phase == GamePhase.FINISHED:
+            return self.reap_policy.finished
+        if not any(p.online for p in (game.host, *game.players.values())):
+            return self.reap_policy.abandoned
+        return self.reap_policy.idle
+
     @staticmethod
     def _not_found() -> None:
         raise ValueError("Game not found")
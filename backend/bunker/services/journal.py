@@ -0,0 +1,228 @@
+from __future__ import annotations
+import pickle
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from bunker.core.loader import GameData
+from bunker.core.logs import get_logger
+from bunker.domain.engine import GameEngine
+from bunker.domain.game_init import GameInitializer
+from bunker.domain.models.models import Game, Player
+from bunker.domain.types import ActionType, GameAction, GamePhase
+
+log = get_logger(__name__)
+
+# Контрольная точка — не реже, чем раз в столько событий партии
+CHECKPOINT_EVERY = 50
+# Статус выселенной из памяти незавершенной партии
+ARCHIVED = "archived"
+# Версия формата контрольной точки: растет при любом несовместимом изменении
+# pickle-состояния движка. Точку другой версии не читаем — партия
+# проигрывается заново по полному журналу.
+CHECKPOINT_FORMAT = 1
+
+
+# ───────────────── События журнала ────────────────────────────────
+def player_event(player: Player) -> Dict[str, Any]:
+    return {
+        "player_id": player.id,
+        "name": player.name,
+        "joined_at": player.joined_at.isoformat(),
+    }
+
+
+def _player(body: Dict[str, Any]) -> Player:
+    return Player(
+        body["name"],
+        "",
+        id=body["player_id"],
+        joined_at=datetime.fromisoformat(body["joined_at"]),
+    )
+
+
+def new_engine(
+    body: Dict[str, Any], initializer: GameInitializer, game_data: GameData
+) -> GameEngine:
+    """Пустая партия из события ``create``"""
+    game = Game(_player(body["host"]), id=body["game_id"], seed=body["seed"])
+    return GameEngine(game, initializer, game_data)
+
+
+def checkpoint_blob(engine: GameEngine) -> bytes:
+    return pickle.dumps(
+        (CHECKPOINT_FORMAT, engine.checkpoint_state()),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def load_checkpoint(blob: bytes) -> Optional[Any]:
+    """Состояние движка из контрольной точки; None — чужой формат"""
+    try:
+        version, state = pickle.loads(blob)
+    except Exception:
+        return None
+    return state if version == CHECKPOINT_FORMAT else None
+
+
+def apply_event(engine: GameEngine, kind: str, body: Dict[str, Any]) -> None:
+    if kind == "join":
+        player = _player(body)
+        engine.game.players[player.id] = player
+    elif kind == "action":
+        engine.execute(
+            GameAction(type=ActionType[body["type"]], payload=body["payload"])
+        )
+    else:
+        raise ValueError(f"Unknown event kind '{kind}'")
+
+
+class GameJournal:
+    """Долговечный журнал партий поверх хранилища событий.
+
+    События (создание, вход игрока, принятое ``GameAction``) получают
+    сквозной номер внутри партии; ``create`` — всегда номер 0, так что по
+    журналу партию можно проиграть с нуля (``bunker.services.replay``).
+    Контрольная точка — pickle ``GameEngine.checkpoint_state`` — пишется при
+    создании партии, при смене фазы и каждые ``checkpoint_every`` событий;
+    восстановление = точка + повтор хвоста.
+    """
+
+    def __init__(self, store, checkpoint_every: int = CHECKPOINT_EVERY):
+        self.store = store
+        self.checkpoint_every = checkpoint_every
+        self._seq: Dict[str, int] = {}
+        self._checkpoint_seq: Dict[str, int] = {}
+        self._phase: Dict[str, GamePhase] = {}
+        # партии, часть записей которых хранилище не смогло сохранить
+        self._dirty: Set[str] = set()
+
+    # ── запись ─────────────────────────────────────────────
+    def game_created(self, engine: GameEngine) -> None:
+        game = engine.game
+        self._seq[game.id] = 0
+        body = {"game_id": game.id, "seed": game.seed, "host": player_event(game.host)}
+        self.store.append(game.id, 0, "create", body)
+        self._checkpoint(engine)
+
+    def player_joined(self, engine: GameEngine, player: Player) -> None:
+        self._append(engine, "join", player_event(player))
+
+    def action_applied(self, engine: GameEngine, action: GameAction) -> None:
+        body = {"type": action.type.name, "payload": action.payload or {}}
+        self._append(engine, "action", body)
+
+    def forget(self, game_id: str, delete: bool = False) -> None:
+        for index in (self._seq, self._checkpoint_seq, self._phase):
+            index.pop(game_id, None)
+        self._dirty.discard(game_id)
+        if delete:
+            self.store.delete(game_id)
+
+    def _append(self, engine: GameEngine, kind: str, body: Dict[str, Any]) -> None:
+        gid = engine.game.id
+        seq = self._seq[gid] = self._seq.get(gid, 0) + 1
+        self.store.append(gid, seq, kind, body)
+
+        self._dirty |= self.store.take_lost()
+        if (
+            gid in self._dirty
+            or engine.phase != self._phase.get(gid)
+            or seq - self._checkpoint_seq.get(gid, 0) >= self.checkpoint_every
+        ):
+            self._checkpoint(engine)
+
+    def archive(self, engine: GameEngine) -> int:
+        """Последняя точка перед выселением партии из памяти; размер точки.
+
+        Незавершенная партия получает статус ``archived``: при рестарте она
+        не поднимается, но ``restore`` вернет ее по первому обращению.
+        """
+        gid = engine.game.id
+        status = self._status(engine)
+        if status != "finished":
+            status = ARCHIVED
+        size = self._checkpoint(engine, status)
+        self.forget(gid)
+        return size
+
+    def _checkpoint(self, engine: GameEngine, status: Optional[str] = None) -> int:
+        gid = engine.game.id
+        seq = self._seq[gid]
+        blob = checkpoint_blob(engine)
+        self.store.checkpoint(gid, seq, blob, status or self._status(engine))
+        self._checkpoint_seq[gid] = seq
+        self._phase[gid] = engine.phase
+        self._dirty.discard(gid)
+        return len(blob)
+
+    @staticmethod
+    def _status(engine: GameEngine) -> str:
+        if engine.phase == GamePhase.FINISHED:
+            return "finished"
+        return engine.game.status
+
+    # ── восстановление ─────────────────────────────────────
+    def recover(
+        self,
+        initializer,
+        game_data: GameData,
+        skip: Optional[set] = None,
+        owns: Optional[Callable[[str], bool]] = None,
+    ) -> List[GameEngine]:
+        """Поднять незавершенные партии из хранилища (только свои, если ``owns``)"""
+        engines = []
+        for gid in self.store.active_games():
+            if (skip and gid in skip) or (owns and not owns(gid)):
+                continue
+            try:
+                engine = self.restore(gid, initializer, game_data)
+            except Exception:
+                log.exception("Cannot restore game %s", gid)
+                continue
+            if engine is not None:
+                engines.append(engine)
+        log.info("Recovered %s game(s) from the event store", len(engines))
+        return engines
+
+    def restore(
+        self, game_id: str, initializer, game_data: GameData
+    ) -> Optional[GameEngine]:
+        stored = self.store.load(game_id)
+        if stored is None:
+            return None
+        state = load_checkpoint(stored.checkpoint)
+        if state is not None:
+            engine = GameEngine.restore(state, initializer, game_data)
+            events, checkpoint_seq = stored.events, stored.seq
+        else:
+            log.warning("Stale checkpoint of game %s, replaying its journal", game_id)
+            events = self.store.events(game_id)
+            if not events or events[0][1] != "create":
+                raise ValueError(f"Game {game_id} has no 'create' event")
+            engine = new_engine(events[0][2], initializer, game_data)
+            events, checkpoint_seq = events[1:], -1
+
+        for seq, kind, body in events:
+            try:
+                apply_event(engine, kind, body)
+            except Exception:
+                # хвост после сбойного события не применим — партия
+                # продолжается с последнего согласованного состояния, а новая
+                # контрольная точка ниже закрывает отброшенные события
+                log.exception("Replay of game %s stopped at event %s", game_id, seq)
+                break
+
+        seq = stored.last_seq
+
+        # сокетов после рестарта нет: все офлайн до rejoin
+        for player in [engine.game.host, *engine.game.players.values()]:
+            player.sid, player.online = "", False
+
+        self._seq[game_id] = seq
+        self._checkpoint_seq[game_id] = checkpoint_seq
+        self._phase[game_id] = engine.phase
+        if seq != checkpoint_seq:
+            self._checkpoint(engine)
+        elif stored.status == ARCHIVED:
+            self.store.set_status(game_id, self._status(engine))
+        return engine
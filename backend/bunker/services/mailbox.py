@@ -0,0 +1,132 @@
+"""Почтовый ящик партии: все изменения одной игры идут строго по очереди.
+
+Команда — функция ``command(engine)``. ``submit`` кладет ее в ящик; кто
+первым застал ящик свободным, тот и разбирает его целиком (flat combining):
+применяет все накопившиеся команды пачкой в порядке прихода и публикует
+один снимок на пачку. Остальные отправители ждут, уступая управление
+(``idle`` — ``socketio.sleep`` под eventlet, ``time.sleep`` в потоках).
+
+Чтения (``published``) ящик не трогают: снимок после публикации не
+меняется, ссылку на него можно отдавать без блокировок. Чтения, которым
+нужен живой движок, идут через ``query``: в той же очереди, но без новой
+публикации.
+"""
+
+from __future__ import annotations
+import time
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from bunker.domain.engine import GameEngine
+from .snapshots import detach
+
+__all__ = ("PublishedSnapshot", "GameMailbox")
+
+T = TypeVar("T")
+Command = Callable[[GameEngine], T]
+
+
+@dataclass(frozen=True)
+class PublishedSnapshot:
+    """Снимок партии после очередной пачки команд. Только для чтения."""
+
+    version: int  # номер публикации, растет с каждой пачкой
+    public: Dict[str, Any]  # общая база для комнаты
+    full: Dict[str, Any]  # база + действия текущего игрока (``view()``)
+
+
+class _Ticket:
+    __slots__ = ("command", "readonly", "result", "error", "snapshot")
+
+    def __init__(self, command: Command, readonly: bool = False) -> None:
+        self.command = command
+        self.readonly = readonly
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.snapshot: Optional[PublishedSnapshot] = None
+
+
+class GameMailbox:
+    """Единственный исполнитель команд одной партии."""
+
+    def __init__(
+        self, engine: GameEngine, idle: Callable[[float], Any] = time.sleep
+    ) -> None:
+        self.engine = engine
+        self.idle = idle
+        self._pending: Deque[_Ticket] = deque()
+        self._token = Lock()
+        self._version = 0
+        self._published = self._snapshot()
+        # партия выгружена: команды после закрытия получают ошибку
+        self.closed = False
+
+    @property
+    def published(self) -> PublishedSnapshot:
+        """Последний опубликованный снимок (без блокировок)"""
+        return self._published
+
+    def submit(self, command: Command) -> Tuple[T, PublishedSnapshot]:
+        """Выполнить команду в очереди партии.
+
+        Возвращает результат команды и снимок той пачки, в которой она
+        применилась. Исключение команды пробрасывается отправителю; ящик
+        при этом остается рабочим.
+        """
+        return self._run(_Ticket(command))
+
+    def query(self, command: Command) -> T:
+        """Прочитать движок в очереди партии, не публикуя новый снимок.
+
+        Команда не должна менять состояние партии.
+        """
+        result, _ = self._run(_Ticket(command, readonly=True))
+        return result
+
+    # ───────────────── Internals ───────────────────────────────────
+    def _run(self, ticket: _Ticket) -> Tuple[Any, PublishedSnapshot]:
+        self._pending.append(ticket)
+        while ticket.snapshot is None:
+            if self._token.acquire(blocking=False):
+                try:
+                    self._drain()
+                finally:
+                    self._token.release()
+            else:
+                self.idle(0)
+        if ticket.error is not None:
+            raise ticket.error
+        return ticket.result, ticket.snapshot
+
+    def _drain(self) -> None:
+        while self._pending:
+            batch = []
+            while self._pending:
+                batch.append(self._pending.popleft())
+            for ticket in batch:
+                if self.closed:
+                    ticket.error = ValueError("Game not found")
+                    continue
+                try:
+                    ticket.result = ticket.command(self.engine)
+                except Exception as e:
+                    ticket.error = e
+            if all(ticket.readonly for ticket in batch):
+                snapshot = self._published
+            else:
+                try:
+                    self._published = snapshot = self._snapshot()
+                except Exception as e:
+                    # снимок не собрался — пачка получает ошибку, а не вечное ожидание
+                    snapshot = self._published
+                    for ticket in batch:
+                        ticket.error = ticket.error or e
+            for ticket in batch:
+                ticket.snapshot = snapshot
+
+    def _snapshot(self) -> PublishedSnapshot:
+        self._version += 1
+        public = detach(self.engine.public_view())
+        return PublishedSnapshot(self._version, public, self.engine.full_view(public))
@@ -0,0 +1,62 @@
+"""Проекция снимка на получателей: одна публичная база + личные надбавки.
+
+База (``GameEngine.public_view``) считается один раз на изменение состояния и
+уходит всей комнате. Каждому получателю отдельно уходит только его небольшая
+надбавка: свои черты (``Character.to_owner_dict``), свои действия Phase2,
+а ведущему — закрытые поля. Надбавка отправляется, только если изменилась.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+
+from bunker.domain.engine import GameEngine
+
+__all__ = ("ViewProjector",)
+
+
+class ViewProjector:
+    """Персональные надбавки к общей базе снимка."""
+
+    def __init__(self) -> None:
+        # gid -> player_id -> (sid, последняя отправленная надбавка)
+        self._sent: Dict[str, Dict[str, Tuple[str, Dict[str, Any]]]] = {}
+
+    def overlay(self, engine: GameEngine, player_id: str) -> Dict[str, Any]:
+        """Надбавка для игрока или ведущего."""
+        if player_id == engine.game.host.id:
+            return engine.host_overlay()
+        return engine.player_overlay(player_id)
+
+    def recipients(self, engine: GameEngine) -> List[Tuple[str, str]]:
+        """Пары (player_id, sid) всех подключённых участников, включая ведущего."""
+        game = engine.game
+        result = []
+        if game.host.online and game.host.sid:
+            result.append((game.host.id, game.host.sid))
+        for pid, player in game.players.items():
+            if player.online and player.sid and pid != game.host.id:
+                result.append((pid, player.sid))
+        return result
+
+    def changed(self, engine: GameEngine) -> List[Tuple[str, Dict[str, Any]]]:
+        """Надбавки, изменившиеся с прошлой отправки: [(sid, overlay)]."""
+        sent = self._sent.setdefault(engine.game.id, {})
+        updates = []
+        for pid, sid in self.recipients(engine):
+            overlay = self.overlay(engine, pid)
+            if sent.get(pid) != (sid, overlay):
+                sent[pid] = (sid, overlay)
+                updates.append((sid, overlay))
+        return updates
+
+    def mark_sent(
+        self, engine: GameEngine, player_id: str, sid: Optional[str]
+    ) -> Dict[str, Any]:
+        """Надбавка, отправленная в составе полного снимка."""
+        overlay = self.overlay(engine, player_id)
+        if sid:
+            self._sent.setdefault(engine.game.id, {})[player_id] = (sid, overlay)
+        return overlay
+
+    def forget(self, gid: str) -> None:
+        self._sent.pop(gid, None)
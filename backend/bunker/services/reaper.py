@@ -0,0 +1,132 @@
+"""Выселение простаивающих партий из памяти процесса.
+
+Одна фоновая задача на процесс (``run_forever``) и куча дедлайнов: каждая
+партия лежит в куче один раз, с дедлайном «последняя активность + TTL».
+Активность (``touch``) только обновляет время — в кучу ничего не кладется,
+если дедлайн не стал раньше. Когда запись всплывает, TTL пересчитывается
+по текущему состоянию партии: если партия успела ожить, запись уходит
+обратно в кучу, иначе партия выселяется.
+
+Отмена (``cancel``) ленивая: устаревшие записи пропускаются при извлечении,
+а куча пересобирается, когда мусора в ней становится больше живых записей.
+"""
+
+from __future__ import annotations
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bunker.core.logs import get_logger
+
+__all__ = ("ReapPolicy", "IdleReaper")
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ReapPolicy:
+    """Сколько секунд без активности партия живет в памяти"""
+
+    finished: float = 600.0  # партия завершена
+    abandoned: float = 1800.0  # в комнате никого нет онлайн
+    idle: float = 6 * 3600.0  # кто-то онлайн, но ничего не происходит
+    interval: float = 30.0  # как часто просыпается фоновая задача; 0 — выкл.
+
+    @classmethod
+    def from_config(cls, config) -> "ReapPolicy":
+        return cls(
+            finished=config.get("GAME_TTL_FINISHED", cls.finished),
+            abandoned=config.get("GAME_TTL_ABANDONED", cls.abandoned),
+            idle=config.get("GAME_TTL_IDLE", cls.idle),
+            interval=config.get("GAME_REAP_INTERVAL", cls.interval),
+        )
+
+
+class IdleReaper:
+    """Куча дедлайнов простоя; ``evict(game_id)`` возвращает освобожденные байты"""
+
+    def __init__(
+        self,
+        ttl: Callable[[str], float],
+        evict: Callable[[str], int],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.evict = evict
+        self.clock = clock
+        self._heap: List[Tuple[float, str]] = []
+        self._deadline: Dict[str, float] = {}
+        self._activity: Dict[str, float] = {}
+        self.evicted = 0
+        self.reclaimed = 0  # байт, оценка по размеру контрольной точки
+
+    def __len__(self) -> int:
+        return len(self._deadline)
+
+    def touch(self, game_id: str) -> None:
+        """Партия активна сейчас"""
+        now = self.clock()
+        self._activity[game_id] = now
+        deadline = now + self.ttl(game_id)
+        if deadline < self._deadline.get(game_id, float("inf")):
+            self._schedule(game_id, deadline)
+
+    def cancel(self, game_id: str) -> None:
+        self._activity.pop(game_id, None)
+        self._deadline.pop(game_id, None)
+        if len(self._heap) > 2 * len(self._deadline) + 64:
+            self._heap = [(d, gid) for gid, d in self._deadline.items()]
+            heapq.heapify(self._heap)
+
+    def next_deadline(self) -> Optional[float]:
+        while self._heap and self._deadline.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def reap(self, now: Optional[float] = None) -> List[str]:
+        """Выселить партии с истекшим дедлайном; вернуть их id"""
+        now = self.clock() if now is None else now
+        evicted, freed_total = [], 0
+        while self._heap and self._heap[0][0] <= now:
+            deadline, gid = heapq.heappop(self._heap)
+            if self._deadline.get(gid) != deadline:
+                continue  # отменена или перенесена
+            del self._deadline[gid]
+            due = self._activity.get(gid, now) + self.ttl(gid)
+            if due > now:
+                self._schedule(gid, due)
+                continue
+            self.cancel(gid)
+            try:
+                freed = self.evict(gid)
+            except Exception:
+                log.exception("Cannot evict game %s", gid)
+                self.touch(gid)  # повторить через TTL
+                continue
+            evicted.append(gid)
+            freed_total += freed or 0
+        self.evicted += len(evicted)
+        self.reclaimed += freed_total
+        if evicted:
+            log.info(
+                "Evicted %s idle game(s), ~%s KB reclaimed (%s KB total, %s live)",
+                len(evicted),
+                freed_total // 1024,
+                self.reclaimed // 1024,
+                len(self),
+            )
+        return evicted
+
+    def run_forever(self, sleep: Callable[[float], Any], interval: float) -> None:
+        """Цикл фоновой задачи: спать до ближайшего дедлайна (не дольше interval)"""
+        while True:
+            self.reap()
+            deadline = self.next_deadline()
+            delay = interval if deadline is None else deadline - self.clock()
+            sleep(min(max(delay, 0.0), interval))
+
+    # ───────────────── Internals ───────────────────────────────────
+    def _schedule(self, game_id: str, deadline: float) -> None:
+        self._deadline[game_id] = deadline
+        heapq.heappush(self._heap, (deadline, game_id))
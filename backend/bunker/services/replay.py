@@ -0,0 +1,124 @@
+"""Повтор записанной партии по журналу событий.
+
+Журнал — это события ``GameJournal``: ``create`` (id, seed, ведущий),
+``join`` и ``action``. Вся случайность партии идет из ``Game.rng(seed)``,
+поэтому повтор дает то же итоговое состояние, что и на сервере::
+
+    python -m bunker.services.replay --db games.db --game ABC123
+    python -m bunker.services.replay --log bug-report.jsonl --fast
+
+Обычный режим после каждого события строит ``view()``, как это делает
+сервер; ``--fast`` пропускает снимки и только применяет действия.
+Присутствие игроков (online/sid) в журнал не пишется и при повторе не
+восстанавливается.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from bunker.core.loader import GameData
+from bunker.domain.engine import GameEngine
+from bunker.domain.game_init import GameInitializer
+from .journal import apply_event, new_engine
+
+__all__ = (
+    "ReplayResult",
+    "replay",
+    "read_log",
+    "write_log",
+)
+
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+
+Event = Tuple[int, str, Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class ReplayResult:
+    engine: GameEngine
+    applied: int  # сколько событий применено после create
+    views: Optional[List[Dict[str, Any]]]  # None в быстром режиме
+
+
+# ───────────────── Повтор ─────────────────────────────────────────
+def replay(
+    events: Iterable[Event],
+    game_data: GameData,
+    fast: bool = False,
+    initializer: Optional[GameInitializer] = None,
+) -> ReplayResult:
+    """Проиграть журнал партии с начала (первое событие — ``create``)"""
+    initializer = initializer or GameInitializer(game_data)
+    events = iter(events)
+    try:
+        _seq, kind, body = next(events)
+    except StopIteration:
+        raise ValueError("Empty game log") from None
+    if kind != "create":
+        raise ValueError("Game log must start with a 'create' event")
+
+    engine = new_engine(body, initializer, game_data)
+    views = None if fast else [engine.view()]
+    applied = 0
+    for _seq, kind, body in events:
+        apply_event(engine, kind, body)
+        applied += 1
+        if views is not None:
+            views.append(engine.view())
+    return ReplayResult(engine=engine, applied=applied, views=views)
+
+
+# ───────────────── Файлы журнала ──────────────────────────────────
+def read_log(path: Path | str) -> List[Event]:
+    """Журнал из JSON-lines: ``{"seq": .., "kind": .., "body": {..}}``"""
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                events.append((row["seq"], row["kind"], row["body"]))
+    return events
+
+
+def write_log(events: Iterable[Event], path: Path | str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for seq, kind, body in events:
+            row = {"seq": seq, "kind": kind, "body": body}
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Повтор записанной партии")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", help="SQLite-журнал сервера (BUNKER_DB)")
+    source.add_argument("--log", help="журнал в JSON-lines")
+    parser.add_argument("--game", help="id партии (для --db)")
+    parser.add_argument("--export", help="сохранить журнал партии в JSON-lines")
+    parser.add_argument("--fast", action="store_true", help="без снимков по ходу")
+    parser.add_argument("--data-dir", default=str(DATA_DIR))
+    args = parser.parse_args(argv)
+
+    if args.db:
+        from bunker.infrastructure.sqlite.event_store import SQLiteEventStore
+
+        if not args.game:
+            parser.error("--game is required with --db")
+        store = SQLiteEventStore(args.db)
+        events = store.events(args.game)
+        store.close()
+    else:
+        events = read_log(args.log)
+
+    if args.export:
+        write_log(events, args.export)
+
+    result = replay(events, GameData(root=args.data_dir), fast=args.fast)
+    print(json.dumps(result.engine.view(), ensure_ascii=False, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
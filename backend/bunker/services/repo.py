@@ -1,21 +1,71 @@
+from __future__ import annotations
+from typing import Dict, Optional, Set, Tuple
+
+
 class InMemoryGameRepo:
-    """Простое хранилище партий (в памяти процесса)."""
+    """Простое хранилище партий (в памяти процесса).
+
+    Помимо самих партий держит обратный индекс sid → (game_id, player_id),
+    чтобы disconnect и поиск по сокету не обходили все комнаты.
+    """
 
     def __init__(self):
         self.games = {}
+        self._sids: Dict[str, Tuple[str, str]] = {}
+        self._game_sids: Dict[str, Set[str]] = {}
 
     def add(self, game):
         self.games[game.id] = game
+        host = getattr(game, "host", None)
+        if host and host.sid:
+            self.bind_sid(host.sid, game.id, host.id)
+        for player in game.players.values():
+            if player.sid:
+                self.bind_sid(player.sid, game.id, player.id)
 
     def get(self, game_id):
         return self.games.get(game_id)
 
     def remove(self, game_id):
         self.games.pop(game_id, None)
+        for sid in self._game_sids.pop(game_id, ()):
+            self._sids.pop(sid, None)
 
     def all(self):
         return list(self.games.values())
 
+    # ── sid index ──────────────────────────────────────────────
+    def bind_sid(self, sid: str, game_id: str, player_id: str) -> None:
+        """Запомнить, что сокет ``sid`` — это игрок ``player_id`` партии"""
+        self.unbind_sid(sid)
+        self._sids[sid] = (game_id, player_id)
+        self._game_sids.setdefault(game_id, set()).add(sid)
+
+    def unbind_sid(self, sid: str) -> Optional[Tuple[str, str]]:
+        entry = self._sids.pop(sid, None)
+        if entry:
+            sids = self._game_sids.get(entry[0])
+            if sids is not None:
+                sids.discard(sid)
+        return entry
+
+    def locate_sid(self, sid: str) -> Optional[Tuple[str, str]]:
+        """(game_id, player_id) для сокета или None"""
+        return self._sids.get(sid)
+
+    def by_sid(self, sid: str):
+        """(game, player) для сокета или None — за O(1)"""
+        entry = self._sids.get(sid)
+        if not entry:
+            return None
+        game = self.games.get(entry[0])
+        if not game:
+            return None
+        player = game.players.get(entry[1])
+        if not player and getattr(game, "host", None) and game.host.id == entry[1]:
+            player = game.host
+        return (game, player) if player else None
+
 
 # Единственный экземпляр
 game_repo = InMemoryGameRepo()
@@ -0,0 +1,176 @@
+"""Версионированные снимки партий и JSON-Patch-подобные диффы между ними.
+
+Вместо полного ``GameEngine.view()`` в комнату уходит список операций
+``{"op": "add" | "remove" | "replace", "path": "/phase2/bunker_hp", "value": ...}``
+относительно последнего разосланного снимка. У каждой партии есть
+монотонно растущий ``Game.state_version``; клиент, заметивший разрыв версий,
+запрашивает полный снимок (``sync_game``).
+"""
+
+from __future__ import annotations
+from copy import deepcopy
+from typing import Any, Dict, List, Optional
+
+__all__ = ("detach", "diff_views", "apply_patch", "SnapshotTracker")
+
+Patch = List[Dict[str, Any]]
+
+
+# ── JSON-pointer helpers (RFC 6901) ─────────────────────────
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _split(path: str) -> List[str]:
+    if not path:
+        return []
+    return [_unescape(t) for t in path.split("/")[1:]]
+
+
+def detach(view: Any) -> Any:
+    """Копия снимка, не разделяющая с игрой ни одного контейнера.
+
+    Быстрее ``deepcopy`` для JSON-подобных данных: копируются dict/list/
+    tuple/set, листья (строки, числа, datetime) неизменяемы и не копируются.
+    """
+    if isinstance(view, dict):
+        return {k: detach(v) for k, v in view.items()}
+    if isinstance(view, list):
+        return [detach(v) for v in view]
+    if isinstance(view, tuple):
+        return tuple(detach(v) for v in view)
+    if isinstance(view, (set, frozenset)):
+        return type(view)(view)
+    return view
+
+
+# ── diff ────────────────────────────────────────────────────
+def diff_views(old: Any, new: Any, path: str = "") -> Patch:
+    """Построить список операций, превращающих ``old`` в ``new``."""
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(new, dict):
+        ops: Patch = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            sub = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": sub, "value": value})
+            else:
+                ops.extend(diff_views(old[key], value, sub))
+        return ops
+
+    if isinstance(new, list):
+        common = min(len(old), len(new))
+        ops = []
+        for i in range(common):
+            ops.extend(diff_views(old[i], new[i], f"{path}/{i}"))
+        # хвост: дописанные элементы (лог действий растёт только в конец)
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{i}", "value": new[i]})
+        # удалённые элементы снимаем с конца, чтобы индексы не съезжали
+        for i in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{i}"})
+
+        # Перестановки дают каскад replace-ов — дешевле заменить список целиком
+        if len(ops) > max(1, len(new)):
+            return [{"op": "replace", "path": path, "value": new}]
+        return ops
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+def apply_patch(doc: Any, ops: Patch) -> Any:
+    """Применить операции к копии ``doc`` (эталон для клиентов и тестов)."""
+    doc = deepcopy(doc)
+    for op in ops:
+        tokens = _split(op["path"])
+        if not tokens:
+            if op["op"] == "remove":
+                doc = None
+            else:
+                doc = deepcopy(op["value"])
+            continue
+
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+
+        last = tokens[-1]
+        if isinstance(parent, list):
+            idx = len(parent) if last == "-" else int(last)
+            if op["op"] == "add":
+                parent.insert(idx, deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del parent[idx]
+            else:
+                parent[idx] = deepcopy(op["value"])
+        else:
+            if op["op"] == "remove":
+                parent.pop(last, None)
+            else:
+                parent[last] = deepcopy(op["value"])
+    return doc
+
+
+# ── tracker ─────────────────────────────────────────────────
+class SnapshotTracker:
+    """Помнит последний разосланный снимок каждой партии и её версию."""
+
+    def __init__(self) -> None:
+        self._last: Dict[str, Dict[str, Any]] = {}
+
+    def patch(
+        self, game, snapshot: Dict[str, Any], frozen: bool = False
+    ) -> Dict[str, Any]:
+        """Дифф ``snapshot`` против последнего разосланного; поднимает версию.
+
+        ``frozen`` — снимок уже отвязан от игры и больше не меняется
+        (опубликован ящиком партии), копировать его не нужно.
+        """
+        base_version = game.state_version
+        previous = self._last.get(game.id)
+
+        if previous is None:
+            ops: Patch = [{"op": "replace", "path": "", "value": snapshot}]
+        else:
+            ops = diff_views(previous, snapshot)
+
+        if ops:
+            game.state_version += 1
+            # view() отдаёт живые списки игры — храним независимую копию
+            self._last[game.id] = snapshot if frozen else detach(snapshot)
+
+        return {
+            "id": game.id,
+            "base_version": base_version,
+            "version": game.state_version,
+            "ops": ops,
+        }
+
+    def full(
+        self, game, snapshot: Dict[str, Any], frozen: bool = False
+    ) -> Dict[str, Any]:
+        """Полный снимок (create/join/resync) с текущей версией партии.
+
+        Если снимок отличается от разосланного, он фиксируется как новая база —
+        остальным участникам комнаты вызывающий должен отправить ``patch``.
+        """
+        self.patch(game, snapshot, frozen)
+        return {"game": snapshot, "version": game.state_version}
+
+    def last(self, gid: str) -> Optional[Dict[str, Any]]:
+        """Последний разосланный комнате снимок (None — еще не рассылали)"""
+        return self._last.get(gid)
+
+    def forget(self, gid: str) -> None:
+        self._last.pop(gid, None)
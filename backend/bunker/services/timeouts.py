@@ -0,0 +1,146 @@
+"""Игровые сроки поверх общего колеса таймеров (``bunker.core.timers``).
+
+* **ведущий вышел** — если он не вернулся за ``host_grace``, партия
+  закрывается (как в первой версии сервера, но без потока на таймер);
+* **срок хода команды** в Phase2 — по истечении ``turn_timeout`` все, кто не
+  выбрал действие, пропускают ход (``turn_timeout`` → noop), и если
+  обрабатывать нечего, ход переходит к другой команде;
+* **окно переподключения** — игрок, не вернувшийся за ``reconnect_window``,
+  считается ушедшим: его очередь в Phase2 пропускается сразу.
+
+Все пропуски идут обычным действием ``TURN_TIMEOUT`` через ящик партии и
+попадают в журнал, так что повтор партии детерминирован.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Set, Tuple
+
+from bunker.core.logs import get_logger
+from bunker.core.timers import TimerWheel
+from bunker.domain.engine import GameEngine
+from bunker.domain.types import GamePhase
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .game_service import GameService
+
+__all__ = ("TimeoutPolicy", "GameTimeouts")
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    """Сроки в секундах; 0 — срок не действует"""
+
+    host_grace: float = 60.0
+    turn_timeout: float = 120.0
+    reconnect_window: float = 90.0
+    tick: float = 0.25  # точность колеса
+
+    @classmethod
+    def from_config(cls, config) -> "TimeoutPolicy":
+        return cls(
+            host_grace=config.get("HOST_GRACE_PERIOD", cls.host_grace),
+            turn_timeout=config.get("TURN_TIMEOUT", cls.turn_timeout),
+            reconnect_window=config.get("RECONNECT_WINDOW", cls.reconnect_window),
+            tick=config.get("TIMER_TICK", cls.tick),
+        )
+
+
+class GameTimeouts:
+    """Таймеры партий одного процесса: хост, ход команды, переподключение."""
+
+    def __init__(
+        self, service: "GameService", wheel: TimerWheel, policy: TimeoutPolicy
+    ) -> None:
+        self.service = service
+        self.wheel = wheel
+        self.policy = policy
+        self._keys: Dict[str, Set[Hashable]] = {}
+        self._turns: Dict[str, Tuple[int, str]] = {}
+        self._away: Dict[str, Set[str]] = {}
+
+    def configure(self, policy: TimeoutPolicy) -> None:
+        self.policy = replace(policy, tick=self.wheel.tick)
+
+    # ── события партии ─────────────────────────────────────
+    def player_left(self, engine: GameEngine, player) -> None:
+        gid = engine.game.id
+        if player.id == engine.game.host.id:
+            if self.policy.host_grace > 0:
+                self._set(
+                    gid, ("host", gid), self.policy.host_grace, self._host_gone, gid
+                )
+        elif self.policy.reconnect_window > 0:
+            self._set(
+                gid,
+                ("reconnect", gid, player.id),
+                self.policy.reconnect_window,
+                self._player_gone,
+                gid,
+                player.id,
+            )
+
+    def player_back(self, gid: str, player_id: str) -> None:
+        self.wheel.cancel(("host", gid))
+        self.wheel.cancel(("reconnect", gid, player_id))
+        self._away.get(gid, set()).discard(player_id)
+
+    def game_changed(self, engine: GameEngine) -> None:
+        """После каждого изменения: новый ход — новый срок; ушедших пропустить"""
+        gid, game = engine.game.id, engine.game
+        if engine.phase != GamePhase.PHASE2 or not engine._phase2_engine:
+            if self._turns.pop(gid, None):
+                self.wheel.cancel(("turn", gid))
+            return
+
+        mark = (game.phase2_round, game.phase2_current_team)
+        if self._turns.get(gid) != mark:
+            self._turns[gid] = mark
+            if self.policy.turn_timeout > 0:
+                self._set(
+                    gid,
+                    ("turn", gid),
+                    self.policy.turn_timeout,
+                    self._timeout,
+                    gid,
+                    {"round": mark[0], "team": mark[1]},
+                )
+
+        current = engine._phase2_engine.get_current_player()
+        if current and current in self._away.get(gid, ()):
+            payload = {"round": mark[0], "team": mark[1], "player_id": current}
+            self._set(gid, ("skip", gid), 0, self._timeout, gid, payload)
+
+    def forget(self, gid: str) -> None:
+        for key in self._keys.pop(gid, ()):
+            self.wheel.cancel(key)
+        self._turns.pop(gid, None)
+        self._away.pop(gid, None)
+
+    # ───────────────── Internals ───────────────────────────────────
+    def _set(self, gid: str, key: Hashable, delay: float, callback, *args) -> None:
+        self._keys.setdefault(gid, set()).add(key)
+        self.wheel.set(key, delay, callback, *args)
+
+    def _timeout(self, gid: str, payload: Dict[str, Any]) -> None:
+        try:
+            self.service.expire_turn(gid, payload)
+        except ValueError as e:
+            log.debug("Turn timeout in %s ignored: %s", gid, e)
+            return
+        log.info("Turn timeout in game %s: %s", gid, payload)
+        self.service.notify(gid)
+
+    def _player_gone(self, gid: str, player_id: str) -> None:
+        self._away.setdefault(gid, set()).add(player_id)
+        engine = self.service._engines.get(gid)
+        if engine:
+            self.game_changed(engine)
+
+    def _host_gone(self, gid: str) -> None:
+        engine = self.service._engines.get(gid)
+        if engine and not engine.game.host.online:
+            log.info("Closing game %s: host did not come back", gid)
+            self.service.evict(gid, reason="host_absent", delete=True)
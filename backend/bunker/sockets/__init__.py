@@ -2,5 +2,5 @@ from flask_socketio import SocketIO
 from .events import register_events
 
 
-def register_socket_events(socketio: SocketIO):
-    register_events(socketio)
+def register_socket_events(socketio: SocketIO, broadcast_window: float = 0.0):
+    register_events(socketio, broadcast_window)
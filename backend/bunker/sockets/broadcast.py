@@ -0,0 +1,106 @@
+"""Планировщик рассылок комнатам: пачка изменений — один ``game_patch``.
+
+Первое изменение в тихой комнате уходит сразу. Следующие в течение окна
+``window`` только помечают комнату «грязной»; по истечении окна уходит
+один патч к последнему опубликованному снимку. ``urgent`` (смена фазы,
+вход в комнату, ресинк) отправляет накопленное немедленно — до полного
+снимка отдельному клиенту база комнаты должна быть разослана.
+
+Сам планировщик о снимках не знает: ``send(game_id)`` собирает и
+отправляет патч (см. ``events._emit_room``).
+"""
+
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+__all__ = ("BroadcastScheduler",)
+
+
+@dataclass
+class _Room:
+    last_sent: float = float("-inf")
+    dirty: bool = False
+    pending: bool = False  # отложенная отправка уже запланирована
+    changes: int = 0
+    emits: int = 0
+
+
+class BroadcastScheduler:
+    """Коалесцирует рассылки по комнатам (одна на окно ``window`` секунд)."""
+
+    def __init__(
+        self,
+        send: Optional[Callable[[str], Any]] = None,
+        window: float = 0.0,
+        spawn: Optional[Callable[..., Any]] = None,
+        sleep: Callable[[float], Any] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.send = send
+        self.window = window
+        self.spawn = spawn
+        self.sleep = sleep
+        self.clock = clock
+        self._rooms: Dict[str, _Room] = {}
+        self._lock = Lock()
+
+    def bind(
+        self,
+        send: Callable[[str], Any],
+        window: float,
+        spawn: Callable[..., Any],
+        sleep: Callable[[float], Any],
+    ) -> None:
+        self.send, self.window, self.spawn, self.sleep = send, window, spawn, sleep
+
+    def changed(self, game_id: str, urgent: bool = False) -> None:
+        """Снимок партии изменился: разослать сейчас или в конце окна"""
+        with self._lock:
+            room = self._rooms.setdefault(game_id, _Room())
+            room.changes += 1
+            room.dirty = True
+            wait = room.last_sent + self.window - self.clock()
+            if not urgent and (room.pending or wait > 0):
+                if not room.pending:
+                    room.pending = True
+                    self.spawn(self._flush_later, game_id, wait)
+                return
+        self.flush(game_id)
+
+    def flush(self, game_id: str) -> None:
+        """Немедленно разослать накопленные изменения комнаты (если есть)"""
+        with self._lock:
+            room = self._rooms.get(game_id)
+            if not room or not room.dirty:
+                return
+            room.dirty = False
+            room.last_sent = self.clock()
+            room.emits += 1
+        self.send(game_id)
+
+    def forget(self, game_id: str) -> None:
+        with self._lock:
+            self._rooms.pop(game_id, None)
+
+    def stats(self, game_id: Optional[str] = None) -> Dict[str, int]:
+        """Счетчики изменений, рассылок и подавленных рассылок"""
+        with self._lock:
+            if game_id is None:
+                rooms = list(self._rooms.values())
+            else:
+                rooms = [self._rooms[game_id]] if game_id in self._rooms else []
+            changes = sum(r.changes for r in rooms)
+            emits = sum(r.emits for r in rooms)
+        return {"changes": changes, "emits": emits, "suppressed": changes - emits}
+
+    # ───────────────── Internals ───────────────────────────────────
+    def _flush_later(self, game_id: str, delay: float) -> None:
+        self.sleep(delay)
+        with self._lock:
+            room = self._rooms.get(game_id)
+            if room:
+                room.pending = False
+        self.flush(game_id)
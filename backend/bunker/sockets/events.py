@@ -1,10 +1,18 @@
 from datetime import datetime
+from functools import partial, wraps
 from flask import request
 from flask_socketio import emit, join_room
 
 from ..services.game_service import GameService
+from .broadcast import BroadcastScheduler
+from .wire import WireRegistry
+from bunker.core.logs import get_logger
+
+log = get_logger(__name__)
 
 service = GameService()
+broadcasts = BroadcastScheduler()
+wire = WireRegistry()
 DEFAULT_HOST_NAME = "Host"
 
 
@@ -20,27 +28,106 @@ def _snake(s: str) -> str:
     return s.lower()
 
 
+def _redirect_foreign(game_id: str) -> bool:
+    """Партия живет на другом шарде: сказать клиенту, куда переподключиться"""
+    if service.shards.owns(game_id):
+        return False
+    emit("shard_redirect", service.shards.route(game_id), room=request.sid)
+    return True
+
+
+def _shard_local(key: str):
+    """Обработчик партии ``data[key]``: чужую партию — редирект на ее шард"""
+
+    def wrap(handler):
+        @wraps(handler)
+        def guarded(data):
+            game_id = data.get(key) if isinstance(data, dict) else None
+            if game_id and _redirect_foreign(game_id):
+                return None
+            return handler(data)
+
+        return guarded
+
+    return wrap
+
+
+def _broadcast(snapshot: dict, urgent: bool = False) -> None:
+    """Снимок комнаты изменился: патч уйдет сразу или в конце окна рассылки.
+
+    ``urgent`` — не ждать окна (вход в комнату, ресинк, конец хода); смена
+    фазы срочная всегда.
+    """
+    urgent = urgent or service.phase_changed(snapshot)
+    broadcasts.changed(snapshot["id"], urgent)
+
+
+def _emit_room(sio, game_id: str) -> None:
+    """Разослать комнате дифф последнего снимка (``game_patch``), если есть."""
+    snapshot = service.get_public_snapshot(game_id)
+    if not snapshot:
+        return
+    patch = service.publish(snapshot)
+    if patch["ops"]:
+        wire.emit(sio, "game_patch", patch, room=_room_id(snapshot))
+    _emit_private(sio, game_id)
+
+
+def _emit_private(sio, game_id: str) -> None:
+    """Личные надбавки (свои черты, свои действия, поля ведущего) — адресно"""
+    for sid, private in service.private_updates(game_id):
+        wire.emit(sio, "game_private", private, to=sid)
+
+
+def _close_room(sio, game_id: str, reason: str = "idle") -> None:
+    """Партия выгружена из памяти: сообщить оставшимся и закрыть комнату"""
+    broadcasts.forget(game_id)
+    sio.emit("game_closed", {"id": game_id, "reason": reason}, room=_room_id(game_id))
+    sio.close_room(_room_id(game_id))
+
+
 # ───────────────── events ──────────────────────────────────
-def register_events(sio):
+def register_events(sio, broadcast_window: float = 0.0):
+    broadcasts.bind(
+        partial(_emit_room, sio),
+        broadcast_window,
+        spawn=sio.start_background_task,
+        sleep=sio.sleep,
+    )
+    service.on_evict = partial(_close_room, sio)
+    # пропуск хода по таймеру — тот же конец хода, рассылаем сразу
+    service.on_update = partial(broadcasts.changed, urgent=True)
+
     # ---------- connect / disconnect -----------------------
     @sio.event
-    def connect():
-        print("[connect]", request.sid)
+    def connect(auth=None):
+        log.debug("connect %s", request.sid)
+        requested = (auth or {}).get("wire") or request.args.get("wire")
+        if requested:
+            fmt = wire.negotiate(request.sid, requested)
+            emit("wire_format", {"format": fmt}, room=request.sid)
 
     @sio.event
     def disconnect():
+        wire.forget(request.sid)
         snap = service.disconnect(request.sid)
         if snap:
-            sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
+            _broadcast(snap, urgent=True)
 
     # ---------- lobby --------------------------------------
     @sio.on("create_game")
     def create_game(_data):
         snap = service.create_game(DEFAULT_HOST_NAME, request.sid)
         join_room(_room_id(snap))
-        emit("game_created", {"game": snap}, room=request.sid)
+        wire.emit(
+            sio,
+            "game_created",
+            service.full_snapshot(snap, request.sid),
+            to=request.sid,
+        )
 
     @sio.on("join_game")
+    @_shard_local("id")
     def join_game(data):
         try:
             snap, pid = service.join_game(data["id"], data.get("name"), request.sid)
@@ -48,10 +135,16 @@ def register_events(sio):
             return emit("error", {"message": str(e)})
 
         join_room(_room_id(snap))
-        sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
-        emit("joined", {"game": snap, "player_id": pid}, room=request.sid)
+        _broadcast(snap, urgent=True)
+        wire.emit(
+            sio,
+            "joined",
+            {**service.full_snapshot(snap, request.sid), "player_id": pid},
+            to=request.sid,
+        )
 
     @sio.on("rejoin_game")
+    @_shard_local("id")
     def rejoin_game(data):
         try:
             player_id = data.get("player_id") or data.get("playerId")
@@ -60,24 +153,34 @@ def register_events(sio):
             snap = service.rejoin(data["id"], player_id, request.sid)
         except ValueError as e:
             return emit("error", {"message": str(e)})
-        print("[rejoin_game]2", snap)
+        log.debug("rejoin_game %s", snap)
         join_room(_room_id(snap))
-        sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
-        emit("rejoined", {"game": snap, "player_id": player_id})
+        _broadcast(snap, urgent=True)
+        wire.emit(
+            sio,
+            "rejoined",
+            {
+                **service.full_snapshot(snap, request.sid),
+                "player_id": player_id,
+            },
+            to=request.sid,
+        )
 
     # ---------- gameplay -----------------------------------
     @sio.on("game_action")
+    @_shard_local("gameId")
     def game_action(data):
         try:
-            print("[game_action]", data)
+            log.debug("game_action %s", data)
             snap = service.execute_game_action(
                 data["gameId"], _snake(data["action"]), data.get("payload")
             )
-            sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
+            _broadcast(snap)
         except ValueError as e:
             emit("error", {"message": str(e)})
 
     @sio.on("start_game")
+    @_shard_local("id")
     def start_game(data):
         try:
             snap = service.execute_game_action(
@@ -85,14 +188,36 @@ def register_events(sio):
             )
         except ValueError as e:
             return emit("error", {"message": str(e)})
-        sio.emit("game_started", {"game": snap}, room=_room_id(snap))
+        wire.emit(sio, "game_started", service.full_snapshot(snap), room=_room_id(snap))
+        _emit_private(sio, snap["id"])
+
+    @sio.on("sync_game")
+    @_shard_local("gameId")
+    def sync_game(data):
+        """Клиент сообщает свою версию снимка; при разрыве — полный ресинк"""
+        try:
+            if "gameId" not in data:
+                return emit("error", {"message": "Missing gameId"})
+
+            snap = service.get_public_snapshot(data["gameId"])
+            if not snap:
+                return emit("error", {"message": "Game not found"})
+
+            _broadcast(snap, urgent=True)
+            full = service.resync(snap, data.get("version"), request.sid)
+            if full:
+                wire.emit(sio, "game_updated", full, to=request.sid)
+
+        except ValueError as e:
+            emit("error", {"message": str(e)})
 
     # ---------- Phase2 specific events --------------------
     @sio.on("phase2_player_action")
+    @_shard_local("gameId")
     def phase2_player_action(data):
         """Игрок выбирает действие в Phase2"""
         try:
-            print("[phase2_player_action]", data)
+            log.debug("phase2_player_action %s", data)
             required_fields = ["gameId", "playerId", "actionId"]
             if not all(field in data for field in required_fields):
                 return emit("error", {"message": "Missing required fields"})
@@ -106,32 +231,34 @@ def register_events(sio):
                     "params": data.get("params", {}),
                 },
             )
-            sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
+            _broadcast(snap)
             emit("action_added", {"success": True}, room=request.sid)
 
         except ValueError as e:
             emit("error", {"message": str(e)})
 
     @sio.on("phase2_process_action")
+    @_shard_local("gameId")
     def phase2_process_action(data):
         """Обработать следующее действие в очереди"""
         try:
-            print("[phase2_process_action]", data)
+            log.debug("phase2_process_action %s", data)
             if "gameId" not in data:
                 return emit("error", {"message": "Missing gameId"})
 
             snap = service.execute_game_action(data["gameId"], "process_action", {})
-            sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
+            _broadcast(snap)
             emit("action_processed", {"success": True}, room=request.sid)
 
         except ValueError as e:
             emit("error", {"message": str(e)})
 
     @sio.on("phase2_resolve_crisis")
+    @_shard_local("gameId")
     def phase2_resolve_crisis(data):
         """Разрешить кризисную ситуацию"""
         try:
-            print("[phase2_resolve_crisis]", data)
+            log.debug("phase2_resolve_crisis %s", data)
             required_fields = ["gameId", "result"]
             if not all(field in data for field in required_fields):
                 return emit("error", {"message": "Missing required fields"})
@@ -142,28 +269,30 @@ def register_events(sio):
             snap = service.execute_game_action(
                 data["gameId"], "resolve_crisis", {"result": data["result"]}
             )
-            sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
+            _broadcast(snap, urgent=True)
             emit("crisis_resolved", {"success": True}, room=request.sid)
 
         except ValueError as e:
             emit("error", {"message": str(e)})
 
     @sio.on("phase2_finish_turn")
+    @_shard_local("gameId")
     def phase2_finish_turn(data):
         """Завершить ход команды"""
         try:
-            print("[phase2_finish_turn]", data)
+            log.debug("phase2_finish_turn %s", data)
             if "gameId" not in data:
                 return emit("error", {"message": "Missing gameId"})
 
             snap = service.execute_game_action(data["gameId"], "finish_team_turn", {})
-            sio.emit("game_updated", {"game": snap}, room=_room_id(snap))
+            _broadcast(snap, urgent=True)
             emit("turn_finished", {"success": True}, room=request.sid)
 
         except ValueError as e:
             emit("error", {"message": str(e)})
 
     @sio.on("get_phase2_info")
+    @_shard_local("gameId")
     def get_phase2_info(data):
         """Получить детальную информацию о Phase2"""
         try:
@@ -181,8 +310,27 @@ def register_events(sio):
         except ValueError as e:
             emit("error", {"message": str(e)})
 
+    @sio.on("get_action_history")
+    @_shard_local("gameId")
+    def get_action_history(data):
+        """Страница истории Phase2 после курсора [раунд, номер]"""
+        try:
+            if "gameId" not in data:
+                return emit("error", {"message": "Missing gameId"})
+            page = service.get_action_history(
+                data["gameId"],
+                data.get("kind", "detailed"),
+                data.get("after"),
+                data.get("limit"),
+            )
+            emit("action_history", page, room=request.sid)
+
+        except ValueError as e:
+            emit("error", {"message": str(e)})
+
     # ---------- misc ---------------------------------------
     @sio.on("host_message")
+    @_shard_local("id")
     def host_message(data):
         gid, msg = data.get("id"), (data.get("message") or "")[:500]
         if not (gid and msg):
@@ -195,6 +343,7 @@ def register_events(sio):
         )
 
     @sio.on("player_action")
+    @_shard_local("id")
     def player_action(data):
         gid = data.get("id")
         action = (data.get("action") or "")[:500]
@@ -212,26 +361,17 @@ def register_events(sio):
         )
 
     @sio.on("phase2_get_action_preview")
+    @_shard_local("gameId")
     def phase2_get_action_preview(data):
         """Получить предварительный расчет действия"""
         try:
-            print("[phase2_get_action_preview]", data)
+            log.debug("phase2_get_action_preview %s", data)
             required_fields = ["gameId", "participants", "actionId"]
             if not all(field in data for field in required_fields):
                 return emit("error", {"message": "Missing required fields"})
 
-            snap = service.get_game_snapshot(data["gameId"])
-            if not snap:
-                return emit("error", {"message": "Game not found"})
-
-            # Получаем движок
-            eng = service._engines.get(data["gameId"])
-            if not eng or not eng._phase2_engine:
-                return emit("error", {"message": "Phase2 not available"})
-
-            # Получаем предварительный расчет
-            preview = eng._phase2_engine.get_action_preview(
-                data["participants"], data["actionId"]
+            preview = service.get_action_preview(
+                data["gameId"], data["participants"], data["actionId"]
             )
 
             emit("action_preview", {"preview": preview}, room=request.sid)
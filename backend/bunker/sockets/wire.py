@@ -0,0 +1,146 @@
+"""Формат кадров со снимками, выбираемый клиентом при подключении.
+
+Клиент передает ``wire`` в ``auth`` (или в query-строке) и получает в
+ответ ``wire_format`` с тем, что сервер согласился слать:
+
+* ``json``    — как раньше, для старых клиентов (по умолчанию);
+* ``msgpack`` — кадр целиком в MessagePack, двоичным вложением Socket.IO
+  (нужен пакет ``msgpack``);
+* ``compact`` — JSON с интернированием ключей: ``{"$k": [формы], "$d": …}``,
+  где объект передается строкой значений и номером своего набора ключей.
+
+Снимки в основном состоят из повторяющихся ключей (персонажи, Phase2),
+поэтому оба двоичных/сжатых формата заметно короче. Кадр кодируется один
+раз на формат, а не на получателя.
+"""
+
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - зависит от окружения
+    msgpack = None
+
+__all__ = (
+    "JSON",
+    "MSGPACK",
+    "COMPACT",
+    "available_formats",
+    "encode",
+    "intern_keys",
+    "expand_keys",
+    "WireRegistry",
+)
+
+JSON = "json"
+MSGPACK = "msgpack"
+COMPACT = "compact"
+
+NAMESPACE = "/"
+
+
+def available_formats() -> tuple:
+    formats = [JSON, COMPACT]
+    if msgpack is not None:
+        formats.append(MSGPACK)
+    return tuple(formats)
+
+
+def encode(fmt: str, payload: Any) -> Any:
+    """Кадр ``payload`` в формате ``fmt``"""
+    if fmt == MSGPACK:
+        return msgpack.packb(payload, use_bin_type=True)
+    if fmt == COMPACT:
+        return intern_keys(payload)
+    return payload
+
+
+# ── compact ─────────────────────────────────────────────────
+def intern_keys(payload: Any) -> Dict[str, Any]:
+    """Заменить ключи объектов номерами «форм» — наборов ключей кадра.
+
+    Объект → ``[номер формы, значения…]``, массив → ``[-1, элементы…]``.
+    Записи одной формы (игроки, персонажи, действия) передают ключи один раз.
+    """
+    shapes: Dict[tuple, int] = {}
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            ref = shapes.setdefault(tuple(value), len(shapes))
+            return [ref, *[walk(item) for item in value.values()]]
+        if isinstance(value, (list, tuple)):
+            return [-1, *[walk(item) for item in value]]
+        return value
+
+    data = walk(payload)
+    return {"$k": [list(shape) for shape in shapes], "$d": data}
+
+
+def expand_keys(frame: Dict[str, Any]) -> Any:
+    """Обратное к ``intern_keys`` (для тестов и python-клиентов)"""
+    shapes = frame["$k"]
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, list):
+            items = [walk(item) for item in value[1:]]
+            return items if value[0] == -1 else dict(zip(shapes[value[0]], items))
+        return value
+
+    return walk(frame["$d"])
+
+
+# ── registry ────────────────────────────────────────────────
+class WireRegistry:
+    """Кто из подключенных клиентов какой формат выбрал.
+
+    Хранит только не-JSON клиентов: пока их нет, рассылка идет одним
+    обычным emit без просмотра состава комнаты.
+    """
+
+    def __init__(self) -> None:
+        self._formats: Dict[str, str] = {}
+
+    def negotiate(self, sid: str, requested: Optional[str]) -> str:
+        fmt = requested if requested in available_formats() else JSON
+        if fmt == JSON:
+            self._formats.pop(sid, None)
+        else:
+            self._formats[sid] = fmt
+        return fmt
+
+    def forget(self, sid: str) -> None:
+        self._formats.pop(sid, None)
+
+    def format_of(self, sid: str) -> str:
+        return self._formats.get(sid, JSON)
+
+    def emit(
+        self,
+        sio,
+        event: str,
+        payload: Any,
+        room: Optional[str] = None,
+        to: Optional[str] = None,
+    ) -> None:
+        """Отправить кадр со снимком комнате ``room`` или клиенту ``to``"""
+        if to is not None:
+            sio.emit(event, encode(self.format_of(to), payload), to=to)
+            return
+        if not self._formats:
+            sio.emit(event, payload, room=room)
+            return
+
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for sid, _ in sio.server.manager.get_participants(NAMESPACE, room):
+            groups[self._formats.get(sid, JSON)].append(sid)
+        plain = groups.pop(JSON, None)
+        if plain and not groups:
+            sio.emit(event, payload, room=room)
+            return
+
+        if plain:
+            sio.emit(event, payload, to=plain)
+        for fmt, sids in groups.items():
+            sio.emit(event, encode(fmt, payload), to=sids)
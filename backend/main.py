@@ -1,6 +1,8 @@
+import os
+
 from bunker import create_app, socketio
 
 app = create_app()
 
 if __name__ == "__main__":
-    socketio.run(app, host="0.0.0.0", port=5000)
+    socketio.run(app, host="0.0.0.0", port=int(os.getenv("BUNKER_PORT", "5000")))
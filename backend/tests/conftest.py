@@ -1,2 +1,39 @@
-import sys, pathlib 
+import sys, pathlib
+
 sys.path.append(str(pathlib.Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from bunker.core.loader import GameData
+from bunker.domain.engine import GameEngine
+from bunker.domain.game_init import GameInitializer
+from bunker.domain.types import ActionType, GameAction
+from bunker.domain.models.models import Game, Player
+
+DATA_DIR = pathlib.Path(__file__).resolve().parents[1] / "data"
+
+
+@pytest.fixture
+def started_game():
+    """Ведущий и 4 игрока после START_GAME: (GameEngine, Game)"""
+    game_data = GameData(root=DATA_DIR)
+    game = Game(Player("Host", "H"))
+    for i in range(4):
+        p = Player(f"P{i}", f"S{i}")
+        game.players[p.id] = p
+
+    eng = GameEngine(game, GameInitializer(game_data), game_data)
+    eng.execute(GameAction(type=ActionType.START_GAME))
+    return eng, game
+
+
+@pytest.fixture
+def phase2_game(started_game):
+    """Та же партия в Phase2: двое снаружи, двое в бункере"""
+    eng, game = started_game
+    player_ids = list(game.players.keys())
+    game.team_outside = set(player_ids[:2])
+    game.team_in_bunker = set(player_ids[2:])
+    game.eliminated_ids = set(player_ids[:2])
+    eng._init_phase2()
+    return eng, game
@@ -0,0 +1,33 @@
+def test_view_and_validation_share_one_computation(phase2_game):
+    eng, game = phase2_game
+    phase2 = eng._phase2_engine
+    calls = []
+    original = phase2._action_filter.get_available_actions
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    phase2._action_filter.get_available_actions = counting
+    player_id = phase2.get_current_player()
+
+    eng.view()
+    eng.view()
+    action_id = eng.view()["phase2"]["available_actions"][0]["id"]
+    assert phase2.add_player_action(player_id, action_id)
+    assert calls == [player_id]
+
+
+def test_status_change_refreshes_available_actions(phase2_game):
+    eng, game = phase2_game
+    phase2 = eng._phase2_engine
+    bunker_player = next(iter(game.team_in_bunker))
+
+    def action_ids():
+        return {a["id"] for a in phase2.get_player_action_table(bunker_player)}
+
+    assert "tech_repair" not in action_ids()
+    phase2._status_manager.apply_status("tech_malfunction", "test")
+    assert "tech_repair" in action_ids()
+    phase2._status_manager.remove_status("tech_malfunction")
+    assert "tech_repair" not in action_ids()
@@ -0,0 +1,77 @@
+from bunker.sockets.broadcast import BroadcastScheduler
+
+
+class FakeLoop:
+    """Ручные часы и отложенные задачи вместо green-потоков"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.tasks = []
+
+    def clock(self):
+        return self.now
+
+    def spawn(self, fn, *args):
+        self.tasks.append((fn, args))
+
+    def sleep(self, delay):
+        self.now += delay
+
+    def run(self):
+        tasks, self.tasks = self.tasks, []
+        for fn, args in tasks:
+            fn(*args)
+
+
+def _scheduler(window=0.05):
+    loop, sent = FakeLoop(), []
+    scheduler = BroadcastScheduler(
+        sent.append, window, spawn=loop.spawn, sleep=loop.sleep, clock=loop.clock
+    )
+    return scheduler, loop, sent
+
+
+def test_burst_is_coalesced_into_one_trailing_emit():
+    scheduler, loop, sent = _scheduler()
+
+    for _ in range(5):
+        scheduler.changed("G")
+    # первое изменение — сразу, остальные ждут конца окна
+    assert sent == ["G"]
+    assert len(loop.tasks) == 1
+
+    loop.run()
+    assert sent == ["G", "G"]
+    assert scheduler.stats("G") == {"changes": 5, "emits": 2, "suppressed": 3}
+
+
+def test_urgent_change_flushes_pending_immediately():
+    scheduler, loop, sent = _scheduler()
+    scheduler.changed("G")
+    scheduler.changed("G")
+    scheduler.changed("G", urgent=True)
+    assert sent == ["G", "G"]
+
+    # отложенная задача уже нечего слать
+    loop.run()
+    assert sent == ["G", "G"]
+
+
+def test_rooms_are_throttled_independently():
+    scheduler, loop, sent = _scheduler()
+    scheduler.changed("A")
+    scheduler.changed("B")
+    assert sent == ["A", "B"]
+
+    loop.now += 1
+    scheduler.changed("A")
+    assert sent == ["A", "B", "A"]
+    assert scheduler.stats()["suppressed"] == 0
+
+
+def test_zero_window_sends_every_change():
+    scheduler, loop, sent = _scheduler(window=0)
+    for _ in range(3):
+        scheduler.changed("G")
+    assert sent == ["G"] * 3
+    assert not loop.tasks
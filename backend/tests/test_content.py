@@ -0,0 +1,51 @@
+import json
+
+from bunker import create_app
+from bunker.config import DevConfig
+from bunker.sockets.events import service
+
+from .test_replay import _next_move
+
+
+def test_manifest_is_served_with_etag_and_revalidated():
+    client = create_app(DevConfig).test_client()
+    manifest = service.content_manifest()
+
+    first = client.get("/content/manifest")
+    assert first.status_code == 200
+    assert first.headers["ETag"] == f'"{manifest.version}"'
+    assert "no-cache" in first.headers["Cache-Control"]
+    body = first.get_json()
+    assert body["version"] == manifest.version
+    assert body["mini_games"] and body["statuses"] and body["actions"]
+
+    again = client.get(
+        "/content/manifest", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert again.status_code == 304 and not again.data
+
+    pinned = client.get(f"/content/manifest?v={manifest.version}")
+    assert "immutable" in pinned.headers["Cache-Control"]
+
+
+def test_phase2_snapshot_carries_ids_not_definitions():
+    gid = service.create_game("Host", "host-sid")["id"]
+    for i in range(6):
+        service.join_game(gid, f"P{i}", f"sid-{i}")
+    for _ in range(400):
+        move = _next_move(service, gid)
+        if move[0] == "make_action":
+            break
+        service.execute_game_action(gid, *move)
+
+    phase2 = service.get_game_snapshot(gid)["phase2"]
+    assert phase2["content_version"] == service.content_manifest().version
+    text = json.dumps(phase2, ensure_ascii=False)
+    content = service.content_manifest().content
+    for mini_game in content["mini_games"].values():
+        assert mini_game["rules"] not in text
+
+    eng = service._engines[gid]
+    table = eng._phase2_engine.get_player_action_table(phase2["current_player"])
+    assert table and all(row["id"] in content["actions"] for row in table)
+    assert all("stat_weights" not in row for row in table)
@@ -0,0 +1,61 @@
+import os
+import shutil
+from pathlib import Path
+
+from bunker.core.content_pack import PACK_NAME, load_pack
+from bunker.core.loader import BASE_FILES, GameData
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _counting_build(calls):
+    def build(root):
+        calls.append(root)
+        return {"text": (root / "a.yml").read_text("utf-8")}
+
+    return build
+
+
+def test_pack_rebuilds_only_on_content_change(tmp_path):
+    source = tmp_path / "a.yml"
+    source.write_text("one", "utf-8")
+    calls = []
+    build = _counting_build(calls)
+
+    assert load_pack(tmp_path, ["a.yml"], build) == {"text": "one"}
+    assert load_pack(tmp_path, ["a.yml"], build) == {"text": "one"}
+    assert len(calls) == 1
+
+    # mtime поменялся, содержимое то же — пакет остается
+    st = source.stat()
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert load_pack(tmp_path, ["a.yml"], build) == {"text": "one"}
+    assert len(calls) == 1
+
+    source.write_text("two", "utf-8")
+    assert load_pack(tmp_path, ["a.yml"], build) == {"text": "two"}
+    assert len(calls) == 2
+
+
+def test_corrupted_pack_is_rebuilt(tmp_path):
+    (tmp_path / "a.yml").write_text("one", "utf-8")
+    calls = []
+    load_pack(tmp_path, ["a.yml"], _counting_build(calls))
+    (tmp_path / PACK_NAME).write_bytes(b"garbage")
+
+    assert load_pack(tmp_path, ["a.yml"], _counting_build(calls)) == {"text": "one"}
+    assert len(calls) == 2
+
+
+def test_game_data_from_pack_matches_yaml(tmp_path):
+    for name in BASE_FILES.values():
+        shutil.copy(DATA_DIR / name, tmp_path / name)
+
+    cold = GameData(root=tmp_path)
+    assert (tmp_path / PACK_NAME).exists()
+    warm = GameData(root=tmp_path)
+
+    assert warm.professions == cold.professions
+    assert warm.phase2_config == cold.phase2_config
+    assert warm.phase2_actions.keys() == cold.phase2_actions.keys()
+    assert all(a.compiled_requirements for a in warm.phase2_actions.values())
@@ -0,0 +1,159 @@
+import pickle
+from pathlib import Path
+
+from bunker.core.loader import GameData
+from bunker.domain.engine import GameEngine
+from bunker.domain.game_init import GameInitializer
+from bunker.domain.types import ActionType, GameAction
+from bunker.domain.models.models import Game, Player
+from bunker.infrastructure.sqlite.event_store import SQLiteEventStore
+from bunker.services.game_service import GameService
+from bunker.services.journal import GameJournal, load_checkpoint
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _without_presence(view):
+    view = dict(view)
+    view["players"] = [
+        {k: v for k, v in p.items() if k != "online"} for p in view["players"]
+    ]
+    return view
+
+
+def test_store_keeps_checkpoint_and_tail(tmp_path):
+    store = SQLiteEventStore(tmp_path / "games.db")
+    store.checkpoint("G1", 0, b"state-0", "waiting")
+    for seq in (1, 2, 3):
+        store.append("G1", seq, "action", {"n": seq})
+    store.checkpoint("G1", 2, b"state-2", "in_progress")
+    store.flush()
+
+    stored = store.load("G1")
+    assert stored.checkpoint == b"state-2"
+    assert [e[0] for e in stored.events] == [3]
+    assert stored.last_seq == 3
+    assert store.active_games() == ["G1"]
+
+    store.set_status("G1", "finished")
+    store.close()
+    assert SQLiteEventStore(tmp_path / "games.db").active_games() == []
+
+
+def test_service_recovers_game_after_restart(tmp_path):
+    store = SQLiteEventStore(tmp_path / "games.db")
+    before = GameService()
+    before.attach_journal(GameJournal(store))
+
+    gid = before.create_game("Host", "host-sid")["id"]
+    for i in range(4):
+        before.join_game(gid, f"P{i}", f"sid-{i}")
+    before.execute_game_action(gid, "start_game")
+    before.execute_game_action(gid, "open_bunker")
+    turn = before.get_game_snapshot(gid)["current_turn"]
+    before.execute_game_action(
+        gid,
+        "reveal",
+        {"player_id": turn["player_id"], "attribute": turn["allowed"][0]},
+    )
+    store.flush()
+    # последний reveal лежит в хвосте после контрольной точки
+    assert store.load(gid).events
+
+    after = GameService()
+    after.attach_journal(GameJournal(SQLiteEventStore(tmp_path / "games.db")))
+    assert gid in after.recover()
+
+    restored = after.get_public_snapshot(gid)
+    assert _without_presence(restored) == _without_presence(
+        before.get_public_snapshot(gid)
+    )
+    assert not any(p["online"] for p in restored["players"])
+    store.close()
+
+
+def test_stale_checkpoint_format_is_rebuilt_from_journal(tmp_path):
+    store = SQLiteEventStore(tmp_path / "games.db")
+    before = GameService()
+    before.attach_journal(GameJournal(store))
+    gid = before.create_game("Host", "host-sid")["id"]
+    for i in range(4):
+        before.join_game(gid, f"P{i}", f"sid-{i}")
+    before.execute_game_action(gid, "start_game")
+    store.flush()
+
+    # контрольная точка без версии формата (как писалась раньше)
+    stored = store.load(gid)
+    state = before._engines[gid].checkpoint_state()
+    store.checkpoint(gid, stored.seq, pickle.dumps(state), "in_progress")
+    store.flush()
+    assert load_checkpoint(store.load(gid).checkpoint) is None
+
+    after = GameService()
+    after.attach_journal(GameJournal(store))
+    assert gid in after.recover()
+    assert _without_presence(after.get_public_snapshot(gid)) == _without_presence(
+        before.get_public_snapshot(gid)
+    )
+    store.flush()
+    assert load_checkpoint(store.load(gid).checkpoint) is not None
+    store.close()
+
+
+def test_phase2_checkpoint_restores_rng_and_turns():
+    game_data = GameData(root=DATA_DIR)
+    game = Game(Player("Host", "H"))
+    for i in range(4):
+        p = Player(f"P{i}", f"S{i}")
+        game.players[p.id] = p
+    initializer = GameInitializer(game_data)
+    eng = GameEngine(game, initializer, game_data)
+    eng.execute(GameAction(type=ActionType.START_GAME))
+    player_ids = list(game.players)
+    game.team_outside = set(player_ids[:2])
+    game.team_in_bunker = set(player_ids[2:])
+    eng._init_phase2()
+
+    state = pickle.loads(pickle.dumps(eng.checkpoint_state()))
+    copy = GameEngine.restore(state, initializer, game_data)
+
+    for engine in (eng, copy):
+        phase2 = engine._phase2_engine
+        while (pid := phase2.get_current_player()) is not None:
+            action = phase2.get_available_actions_for_player(pid)[0]
+            engine.execute(
+                GameAction(
+                    type=ActionType.MAKE_ACTION,
+                    payload={"player_id": pid, "action_id": action.id},
+                )
+            )
+        engine.execute(GameAction(type=ActionType.PROCESS_ACTION))
+
+    assert copy.view() == eng.view()
+
+
+def test_failed_row_does_not_drop_other_games(tmp_path):
+    store = SQLiteEventStore(tmp_path / "games.db")
+    before = GameService()
+    before.attach_journal(GameJournal(store, checkpoint_every=100))
+    gid = before.create_game("Host", "host-sid")["id"]
+
+    store.checkpoint("G1", 0, b"state-0", "waiting")
+    store.append("G1", 1, "action", {"n": 1})
+    # строка, которую SQLite не примет (словарь вместо текста)
+    store._put(
+        gid,
+        "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?)",
+        (gid, 99, "action", {"bad": True}, 0.0),
+    )
+    store.append("G1", 2, "action", {"n": 2})
+    store.flush()
+
+    assert [e[0] for e in store.load("G1").events] == [1, 2]
+
+    # следующая запись партии со сбоем снимает внеочередную точку
+    before.join_game(gid, "P0", "sid-0")
+    store.flush()
+    stored = store.load(gid)
+    assert stored.seq == stored.last_seq == 1
+    store.close()
@@ -6,6 +6,7 @@ import pytest
 from bunker.core.loader import GameData
 from bunker.domain.engine import GameEngine
 from bunker.domain.game_init import GameInitializer
+from bunker.domain.phase2.manifest import content_manifest
 from bunker.domain.types import GamePhase, ActionType, GameAction
 from bunker.domain.models.models import Game, Player
 
@@ -165,18 +166,21 @@ def test_full_game_and_phase2_flow(game_data: GameData, initializer: GameInitial
         if phase2_data.get("current_crisis"):
             crisis = phase2_data["current_crisis"]
             crises_encountered += 1
-            print(f"Crisis {crises_encountered}: {crisis['name']}")
+            content = content_manifest(game_data).content
+            print(
+                f"Crisis {crises_encountered}: {content['crises'][crisis['id']]['name']}"
+            )
 
             # НОВАЯ ПРОВЕРКА: Проверяем наличие мини-игры
             assert "mini_game" in crisis, "Crisis should have mini_game data"
 
             if crisis["mini_game"]:
-                mini_game = crisis["mini_game"]
+                assert "id" in crisis["mini_game"], "Mini-game should have ID"
+                mini_game = content["mini_games"][crisis["mini_game"]["id"]]
                 print(f"  Mini-game: {mini_game['name']}")
                 print(f"  Rules: {mini_game['rules'][:50]}...")  # Первые 50 символов
 
                 # Проверяем структуру мини-игры
-                assert "id" in mini_game, "Mini-game should have ID"
                 assert "name" in mini_game, "Mini-game should have name"
                 assert "rules" in mini_game, "Mini-game should have rules"
                 assert (
@@ -45,3 +45,42 @@ def test_bunker_cards(loader: GameData):
     # 5 скрытых карт
     assert len(game.bunker_cards) == 5
     assert game.bunker_reveal_idx == 0
+
+
+def test_traits_are_shared_and_reveal_is_per_game(loader: GameData):
+    a, b = make_game_with_players(6), make_game_with_players(6)
+    GameInitializer(loader).setup_new_game(a)
+    GameInitializer(loader).setup_new_game(b)
+
+    # одна черта на содержимое: те же объекты между партиями и загрузками
+    by_name = {t.name: t for c in a.characters.values() for t in c.traits.values()}
+    shared = [
+        (ca, cb, attr)
+        for ca in a.characters.values()
+        for cb in b.characters.values()
+        for attr in TRAIT_ATTRS
+        if ca.traits[attr] is cb.traits[attr]
+    ]
+    assert shared, "traits must be interned flyweights"
+    again = GameData(root=DATA_DIR)
+    assert any(t is by_name.get(t.name) for t in again.phobias)
+
+    ca, cb, attr = shared[0]
+    ca.reveal(attr)
+    assert ca.is_revealed(attr) and not cb.is_revealed(attr)
+    assert cb.to_public_dict()[attr] is None
+    assert ca.to_public_dict()[attr]["revealed"] is True
+
+
+def test_character_checkpoint_keeps_reveal_mask(loader: GameData):
+    import pickle
+
+    game = make_game_with_players(6)
+    GameInitializer(loader).setup_new_game(game)
+    char = next(iter(game.characters.values()))
+    char.reveal(char.reveal_order[-1])
+
+    restored = pickle.loads(pickle.dumps(char))
+    assert restored == char and restored.revealed == [char.reveal_order[-1]]
+    assert all(restored.traits[a] is char.traits[a] for a in char.reveal_order)
+    assert restored.aggregate_stats() == char.aggregate_stats()
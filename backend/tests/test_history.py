@@ -0,0 +1,63 @@
+import pytest
+
+from bunker.domain.phase2.history import ActionHistory
+from bunker.services.game_service import GameService
+
+from .test_replay import _play
+
+
+def test_pages_follow_round_index_cursor():
+    history = ActionHistory()
+    history.extend(1, [{"n": 0}, {"n": 1}])
+    history.extend(2, [{"n": 2}])
+    history.extend(2, [{"n": 3}])
+
+    entries, cursor, more = history.page(limit=3)
+    assert [e["n"] for e in entries] == [0, 1, 2]
+    assert cursor == (2, 0) and more
+
+    entries, cursor, more = history.page([2, 0], limit=3)
+    assert [e["n"] for e in entries] == [3]
+    assert cursor == (2, 1) and not more
+
+    # дочитанная история: пустая страница, курсор на месте
+    assert history.page([2, 1]) == ([], (2, 1), False)
+
+
+def test_history_is_served_by_pages_not_snapshots():
+    service = GameService()
+    gid = service.create_game("Host", "host-sid")["id"]
+    for i in range(6):
+        service.join_game(gid, f"P{i}", f"sid-{i}")
+    _play(service, gid)
+
+    view = service.get_game_snapshot(gid)
+    assert "detailed_history" not in view["phase2"]
+    assert "action_log" not in view["phase2"]
+
+    eng = service._engines[gid]
+    expected = {
+        "detailed": eng._phase2_engine.get_detailed_action_history(),
+        "log": eng.game.phase2_action_log,
+    }
+    assert expected["log"]
+    for kind, entries in expected.items():
+        pages, after = [], None
+        while True:
+            page = service.get_action_history(gid, kind, after, limit=3)
+            pages.extend(page["entries"])
+            after = page["cursor"]
+            if not page["has_more"]:
+                break
+        assert pages == entries
+        assert after == view["phase2"]["history_head"][kind]
+
+
+def test_history_rejects_bad_requests():
+    service = GameService()
+    gid = service.create_game("Host", "host-sid")["id"]
+    with pytest.raises(ValueError):
+        service.get_action_history(gid, "everything")
+    with pytest.raises(ValueError):
+        service.get_action_history(gid, after=["1", 2])
+    assert service.get_action_history(gid)["entries"] == []
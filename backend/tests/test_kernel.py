@@ -0,0 +1,66 @@
+import random
+from itertools import combinations
+
+from pathlib import Path
+
+import pytest
+
+from bunker.core.loader import GameData
+from bunker.domain.game_init import GameInitializer
+from bunker.domain.models.models import Game, Player
+from bunker.domain.phase2.phase2_engine import Phase2Engine
+
+pytest.importorskip("numpy")
+
+from bunker.domain.phase2.kernel import draw_rolls, encode_rows, resolve_batch
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _engine(game_data, seed):
+    rng = random.Random(seed)
+    game = Game(Player("Host", "H"))
+    for i in range(6):
+        p = Player(f"P{i}", f"S{i}", id=f"P{i}")
+        game.players[p.id] = p
+    GameInitializer(game_data, rng).setup_new_game(game)
+    game.team_in_bunker = {"P0", "P1", "P2"}
+    game.team_outside = {"P3", "P4", "P5"}
+    engine = Phase2Engine(game, game_data, rng)
+    engine.initialize_phase2()
+    return engine
+
+
+def test_batch_matches_scalar_path():
+    game_data = GameData(root=DATA_DIR)
+    rows = []
+    for seed in range(4):
+        engine = _engine(game_data, seed)
+        if seed % 2:
+            status_id = next(iter(game_data.statuses))
+            engine._status_manager.apply_status(status_id, "test")
+        for action in game_data.phase2_actions.values():
+            team = sorted(engine._team_states[action.team].players)
+            for size in (1, 2, 3):
+                for group in combinations(team, size):
+                    rows.append((engine, list(group), action.id))
+
+    batch = encode_rows(rows)
+    rolls = draw_rolls(
+        [random.Random(i) for i in range(len(rows))], batch.blocked.tolist()
+    )
+    result = resolve_batch(batch, rolls)
+
+    for i, (engine, participants, action_id) in enumerate(rows):
+        action_def = game_data.phase2_actions[action_id]
+        modifiers = engine._status_manager.get_action_modifiers(action_id)
+        combined = engine._calculate_action_stats_with_bonuses(participants, action_def)
+        total = engine._odds.effective_stats(combined, modifiers)
+        difficulty = action_def.difficulty + modifiers["difficulty_modifier"]
+
+        assert result.combined[i] == combined
+        assert result.total_stats[i] == total
+        if modifiers["blocked"]:
+            assert not result.success[i]
+        else:
+            assert result.success[i] == (rolls[i] + total >= difficulty)
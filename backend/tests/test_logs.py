@@ -0,0 +1,46 @@
+import io
+import json
+import logging
+
+from bunker.core.logs import configure_logging, get_logger, parse_levels
+
+
+class _Exploding:
+    def __str__(self):
+        raise AssertionError("formatted while level is disabled")
+
+
+def test_disabled_level_does_not_format():
+    stream = io.StringIO()
+    configure_logging("INFO", stream=stream)
+    try:
+        get_logger("bunker.domain.test").debug("value %s", _Exploding())
+        assert stream.getvalue() == ""
+    finally:
+        configure_logging("WARNING")
+
+
+def test_module_levels_and_json_sink(tmp_path):
+    sink = tmp_path / "events.jsonl"
+    stream = io.StringIO()
+    configure_logging(
+        "WARNING",
+        parse_levels("bunker.sockets=DEBUG, bad-entry"),
+        sink,
+        stream=stream,
+    )
+    try:
+        get_logger("bunker.sockets.events").debug(
+            "game_action %s", "start", extra={"game_id": "G1"}
+        )
+        get_logger("bunker.domain.engine").debug("hidden")
+    finally:
+        configure_logging("WARNING")
+        logging.getLogger("bunker.sockets").setLevel(logging.NOTSET)
+
+    records = [json.loads(line) for line in sink.read_text("utf-8").splitlines()]
+    assert len(records) == 1
+    assert records[0]["event"] == "game_action %s"
+    assert records[0]["message"] == "game_action start"
+    assert records[0]["game_id"] == "G1"
+    assert "hidden" not in stream.getvalue()
@@ -0,0 +1,112 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from bunker.core.loader import GameData
+from bunker.domain.engine import GameEngine
+from bunker.domain.game_init import GameInitializer
+from bunker.domain.models.models import Game, Player
+from bunker.services.mailbox import GameMailbox
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _mailbox():
+    game_data = GameData(root=DATA_DIR)
+    game = Game(Player("Host", "H"))
+    return GameMailbox(GameEngine(game, GameInitializer(game_data), game_data))
+
+
+def _add_player(name):
+    def command(eng):
+        player = Player(name, name)
+        eng.game.players[player.id] = player
+        return name
+
+    return command
+
+
+def _wait_until(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_queued_commands_run_in_order_as_one_batch():
+    mailbox = _mailbox()
+    entered, gate = threading.Event(), threading.Event()
+    order, results = [], {}
+
+    def slow(eng):
+        entered.set()
+        gate.wait(5)
+        order.append("slow")
+
+    def record(name):
+        def command(eng):
+            order.append(name)
+            return _add_player(name)(eng)
+
+        return command
+
+    def submit(key, command):
+        results[key] = mailbox.submit(command)
+
+    threads = [threading.Thread(target=submit, args=("slow", slow))]
+    threads[0].start()
+    entered.wait(5)
+    for i, name in enumerate(("B", "C"), start=1):
+        threads.append(threading.Thread(target=submit, args=(name, record(name))))
+        threads[-1].start()
+        _wait_until(lambda: len(mailbox._pending) == i)
+    gate.set()
+    for t in threads:
+        t.join(5)
+
+    assert order == ["slow", "B", "C"]
+    # B и C пришли, пока ящик был занят: одна пачка — один снимок
+    assert results["B"][1] is results["C"][1]
+    assert results["B"][1].version == results["slow"][1].version + 1
+    names = {p["name"] for p in results["C"][1].public["players"]}
+    assert {"B", "C"} <= names
+
+
+def test_published_snapshot_is_detached_from_game():
+    mailbox = _mailbox()
+    _, published = mailbox.submit(_add_player("A"))
+    players = len(published.public["players"])
+
+    mailbox.engine.game.players.clear()
+
+    assert mailbox.published is published
+    assert len(published.public["players"]) == players
+    assert published.full["id"] == published.public["id"]
+
+
+def test_failed_command_reraises_and_mailbox_keeps_working():
+    mailbox = _mailbox()
+
+    def boom(eng):
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        mailbox.submit(boom)
+
+    result, published = mailbox.submit(_add_player("A"))
+    assert result == "A"
+    assert any(p["name"] == "A" for p in published.public["players"])
+
+
+def test_query_reads_in_queue_without_publishing():
+    mailbox = _mailbox()
+    published = mailbox.published
+
+    assert mailbox.query(lambda eng: len(eng.game.players)) == 0
+    assert mailbox.published is published
+
+    mailbox.closed = True
+    with pytest.raises(ValueError, match="Game not found"):
+        mailbox.query(lambda eng: eng.game.id)
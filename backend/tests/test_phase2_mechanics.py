@@ -4,6 +4,7 @@ from pathlib import Path
 from bunker.core.loader import GameData
 from bunker.domain.engine import GameEngine
 from bunker.domain.game_init import GameInitializer
+from bunker.domain.phase2.manifest import content_manifest
 from bunker.domain.types import GamePhase, ActionType, GameAction
 from bunker.domain.models.models import Game, Player
 
@@ -134,20 +135,23 @@ def test_crisis_with_mini_game_in_view(setup_phase2):
         current_crisis = phase2_data["current_crisis"]
         assert current_crisis is not None, "Current crisis should not be None"
 
-        # Проверяем структуру кризиса
+        # Проверяем структуру кризиса: в снимке id, тексты — в манифесте
+        manifest = content_manifest(game_data)
+        assert phase2_data["content_version"] == manifest.version
         assert "id" in current_crisis, "Crisis should have ID"
-        assert "name" in current_crisis, "Crisis should have name"
-        assert "description" in current_crisis, "Crisis should have description"
         assert "mini_game" in current_crisis, "Crisis should have mini_game field"
+        crisis_def = manifest.content["crises"][current_crisis["id"]]
+        assert "name" in crisis_def, "Crisis should have name"
+        assert "description" in crisis_def, "Crisis should have description"
 
         # Проверяем структуру мини-игры
-        mini_game = current_crisis["mini_game"]
-        assert mini_game is not None, "Mini-game should not be None"
-        assert "id" in mini_game, "Mini-game should have ID"
+        assert current_crisis["mini_game"] is not None, "Mini-game should not be None"
+        assert "id" in current_crisis["mini_game"], "Mini-game should have ID"
+        mini_game = manifest.content["mini_games"][current_crisis["mini_game"]["id"]]
         assert "name" in mini_game, "Mini-game should have name"
         assert "rules" in mini_game, "Mini-game should have rules"
 
-        print(f"Crisis in view: {current_crisis['name']}")
+        print(f"Crisis in view: {crisis_def['name']}")
         print(f"Mini-game in view: {mini_game['name']}")
         print(f"Rules length: {len(mini_game['rules'])} characters")
 
@@ -5,8 +5,10 @@ from unittest.mock import Mock
 from bunker.core.loader import GameData
 from bunker.domain.engine import GameEngine
 from bunker.domain.game_init import GameInitializer
+from bunker.domain.phase2.manifest import content_manifest
 from bunker.domain.types import GamePhase, ActionType, GameAction
 from bunker.domain.models.models import Game, Player
+from bunker.domain.models.stats import STATS
 
 # Используем основные данные
 DATA_DIR = Path(r"C:/Users/Zema/bunker-game/backend/data")
@@ -163,13 +165,12 @@ class TestPhase2WithStatuses:
         # Применяем статус
         eng._phase2_engine._status_manager.apply_status("fire", "test")
 
-        # Получаем модификаторы статов
-        modifiers = eng._phase2_engine._status_manager.get_team_stat_modifiers()
+        # Вклад статуса в статы команды бункера
+        ledger = eng._phase2_engine._stat_ledger
+        modifiers = STATS.nonzero(ledger.delta("bunker", ("status", "fire")))
 
-        # Проверяем что статы команды бункера изменились
-        assert "bunker" in modifiers
-        assert modifiers["bunker"]["ЗДР"] == -2
-        assert modifiers["bunker"]["ТЕХ"] == -1
+        assert modifiers["ЗДР"] == -2
+        assert modifiers["ТЕХ"] == -1
 
     def test_status_triggers_phobia(self, setup_phase2_with_statuses):
         """Тест триггера фобии от статуса"""
@@ -206,15 +207,19 @@ class TestPhase2WithStatuses:
 
         assert len(active_statuses) == 1
 
-        fire_status = active_statuses[0]
-        assert fire_status["id"] == "fire"
+        # в снимке — id и динамика, описание статуса — в манифесте контента
+        fire_state = active_statuses[0]
+        assert fire_state["id"] == "fire"
+        assert fire_state["source"] == "crisis_test"
+        assert "name" not in fire_state
+
+        fire_status = content_manifest(game_data).content["statuses"]["fire"]
         assert fire_status["name"] == "Пожар"
         assert (
             fire_status["description"]
             == "В бункере бушует пожар. Повреждает здания и блокирует действия."
         )
         assert fire_status["severity"] == "high"
-        assert fire_status["source"] == "crisis_test"
         assert fire_status["ui"]["icon"] == "fire"
         assert fire_status["ui"]["color"] == "error"
         assert len(fire_status["effects"]) > 0
@@ -231,7 +236,7 @@ class TestPhase2WithStatuses:
         eng._phase2_engine._status_manager.apply_status("fire", "test")
 
         # Проверяем что fire усилен darkness
-        active_fire = game.phase2_active_statuses_detailed["fire"]
+        active_fire = game.phase2_active_statuses.get("fire")
         assert "darkness" in active_fire.enhanced_by
 
         # Проверяем что оба статуса активны
@@ -249,14 +254,13 @@ class TestPhase2WithStatuses:
         assert eng._phase2_engine._status_manager.is_status_active("high_morale")
 
         # Проверяем что статус временный
-        active_positive = game.phase2_active_statuses_detailed["high_morale"]
+        active_positive = game.phase2_active_statuses.get("high_morale")
         assert active_positive.remaining_rounds == 2
         assert active_positive.source == "action_success"
 
-        # Получаем модификаторы статов
-        modifiers = eng._phase2_engine._status_manager.get_team_stat_modifiers()
+        # Вклад статуса в статы команды бункера
+        ledger = eng._phase2_engine._stat_ledger
+        modifiers = STATS.nonzero(ledger.delta("bunker", ("status", "high_morale")))
 
-        # Проверяем что статы команды бункера улучшились
-        assert "bunker" in modifiers
-        assert modifiers["bunker"]["ХАР"] == 3
-        assert modifiers["bunker"]["ЭМП"] == 2
+        assert modifiers["ХАР"] == 3
+        assert modifiers["ЭМП"] == 2
@@ -0,0 +1,53 @@
+from bunker.domain.phase2.probability import required_roll, success_chance
+
+
+def test_success_chance_matches_enumeration():
+    for difficulty in range(-5, 35):
+        for stats in range(-5, 25):
+            wins = sum(1 for roll in range(1, 21) if roll + stats >= difficulty)
+            assert success_chance(difficulty, stats) == wins / 20
+            assert 1 <= required_roll(difficulty, stats) <= 21
+
+
+def test_preview_uses_resolution_stats(phase2_game):
+    eng, game = phase2_game
+    engine = eng._phase2_engine
+    players = sorted(game.team_in_bunker)
+    action = next(a for a in engine.data.phase2_actions.values() if a.team == "bunker")
+
+    preview = engine.get_action_preview(players, action.id)
+    combined = engine._calculate_action_stats_with_bonuses(players, action)
+    modifiers = engine._status_manager.get_action_modifiers(action.id)
+
+    assert preview["total_stats"] == int(combined * modifiers["effectiveness"])
+    assert preview["success_probability"] == success_chance(
+        preview["modified_difficulty"], preview["total_stats"]
+    )
+
+
+def test_previews_for_every_participant_set(phase2_game):
+    eng, game = phase2_game
+    engine = eng._phase2_engine
+    action = next(a for a in engine.data.phase2_actions.values() if a.team == "bunker")
+
+    previews = engine.get_action_previews(action.id)
+    groups = {tuple(sorted(p["participants"])) for p in previews}
+    players = sorted(game.team_in_bunker)
+
+    assert groups == {(players[0],), (players[1],), tuple(players)}
+    for p in previews:
+        single = engine.get_action_preview(p["participants"], action.id)
+        assert single["success_chance"] == p["success_chance"]
+
+
+def test_preview_stats_keep_character_and_action_keys(phase2_game):
+    eng, game = phase2_game
+    engine = eng._phase2_engine
+    players = sorted(game.team_in_bunker)
+    action = next(a for a in engine.data.phase2_actions.values() if a.team == "bunker")
+
+    for details in engine.get_action_preview(players, action.id)["participants"]:
+        own = game.characters[details["player_id"]].aggregate_stats()
+        assert details["base_stats"].keys() == own.keys()
+        assert details["final_stats"].keys() == own.keys()
+        assert list(details["stat_contributions"]) == list(action.stat_weights)
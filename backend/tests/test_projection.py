@@ -0,0 +1,44 @@
+from bunker.services.projection import ViewProjector
+
+
+def test_public_view_hides_unrevealed_traits(started_game):
+    eng, game = started_game
+    pid = next(iter(game.players))
+    game.characters[pid].reveal("profession")
+
+    public = eng.public_view()["characters"][pid]
+
+    assert (
+        public["profession"]["name"] == game.characters[pid].traits["profession"].name
+    )
+    assert public["phobia"] is None
+
+
+def test_overlays_per_recipient(started_game):
+    eng, game = started_game
+    projector = ViewProjector()
+    pid = next(iter(game.players))
+
+    own = projector.overlay(eng, pid)
+    assert own["player_id"] == pid
+    assert own["character"]["phobia"]["revealed"] is False
+    assert own["character"]["phobia"]["name"]
+
+    host = projector.overlay(eng, game.host.id)
+    assert set(host["characters"]) == set(game.players)
+
+
+def test_only_changed_overlays_are_resent(started_game):
+    eng, game = started_game
+    projector = ViewProjector()
+
+    first = projector.changed(eng)
+    assert len(first) == len(game.players) + 1  # игроки + ведущий
+    assert projector.changed(eng) == []
+
+    pid = next(iter(game.players))
+    game.characters[pid].reveal("hobby")
+    resent = projector.changed(eng)
+
+    # раскрытие видят владелец и ведущий
+    assert {sid for sid, _ in resent} == {game.players[pid].sid, game.host.sid}
@@ -0,0 +1,91 @@
+import pytest
+
+from bunker.infrastructure.sqlite.event_store import SQLiteEventStore
+from bunker.services.game_service import GameService
+from bunker.services.journal import GameJournal
+from bunker.services.reaper import IdleReaper, ReapPolicy
+from bunker.services.repo import game_repo
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reaper_evicts_only_games_idle_past_their_ttl():
+    clock, ttl, evicted = Clock(), {"A": 10.0, "B": 10.0, "C": 100.0}, []
+    reaper = IdleReaper(ttl.get, lambda gid: evicted.append(gid) or 1, clock)
+    for gid in ttl:
+        reaper.touch(gid)
+
+    clock.now += 5
+    reaper.touch("B")  # активность переносит дедлайн
+    clock.now += 6
+    assert reaper.reap() == ["A"]
+
+    # партия завершилась (это тоже действие) — дедлайн стал раньше
+    ttl["C"] = 1.0
+    reaper.touch("C")
+    clock.now += 5
+    assert sorted(reaper.reap()) == ["B", "C"]
+    assert reaper.evicted == 3 and len(reaper) == 0
+    assert reaper.next_deadline() is None
+
+
+def test_cancelled_games_are_not_evicted():
+    clock, evicted = Clock(), []
+    reaper = IdleReaper(lambda gid: 1.0, evicted.append, clock)
+    for i in range(200):
+        reaper.touch(f"G{i}")
+        reaper.cancel(f"G{i}")
+    clock.now += 2
+    assert reaper.reap() == [] and not evicted
+    # отмененные записи не копятся в куче
+    assert len(reaper._heap) <= 64
+
+
+def _service(tmp_path, store=None):
+    service = GameService()
+    service.reaper.clock = Clock()
+    service.configure_reaper(ReapPolicy(finished=60, abandoned=60, idle=600))
+    if store:
+        service.attach_journal(GameJournal(store))
+    gid = service.create_game("Host", "host-sid")["id"]
+    service.join_game(gid, "P0", "p0-sid")
+    return service, gid
+
+
+def test_abandoned_game_is_archived_and_revived(tmp_path):
+    store = SQLiteEventStore(tmp_path / "games.db")
+    service, gid = _service(tmp_path, store)
+    before = service.get_public_snapshot(gid)
+    host_id = before["host_id"]
+
+    service.disconnect("host-sid")
+    service.disconnect("p0-sid")
+    service.reaper.clock.now += 61
+    assert service.reaper.reap() == [gid]
+    assert gid not in service._engines and game_repo.get(gid) is None
+    assert service.reaper.reclaimed > 0
+
+    store.flush()
+    assert store.load(gid).status == "archived"
+    assert gid not in store.active_games()
+
+    # первое обращение поднимает партию из журнала
+    after = service.rejoin(gid, host_id, "host-sid-2")
+    assert [p["id"] for p in after["players"]] == [p["id"] for p in before["players"]]
+    store.flush()
+    assert gid in store.active_games()
+    store.close()
+
+
+def test_eviction_without_store_forgets_the_game(tmp_path):
+    service, gid = _service(tmp_path)
+    service.reaper.clock.now += 601
+    assert service.reaper.reap() == [gid]
+    with pytest.raises(ValueError, match="Game not found"):
+        service.join_game(gid, "Late", "late-sid")
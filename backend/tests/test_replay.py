@@ -0,0 +1,94 @@
+from pathlib import Path
+
+from bunker.core.loader import GameData
+from bunker.domain.models.models import Game, Player
+from bunker.infrastructure.sqlite.event_store import SQLiteEventStore
+from bunker.services.game_service import GameService
+from bunker.services.journal import GameJournal
+from bunker.services.replay import read_log, replay, write_log
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def _next_move(service, gid):
+    """Первое допустимое действие ведущего/игроков в текущем снимке"""
+    view = service.get_game_snapshot(gid)
+    available = view["available_actions"]
+    if "reveal" in available:
+        turn = view["current_turn"]
+        return "reveal", {
+            "player_id": turn["player_id"],
+            "attribute": turn["allowed"][0],
+        }
+    if "cast_vote" in available:
+        alive = [
+            p["id"] for p in view["players"] if p["id"] not in view["eliminated_ids"]
+        ]
+        voted = service._engines[gid].game.votes
+        voter = next(pid for pid in alive if pid not in voted)
+        return "cast_vote", {"voter_id": voter, "target_id": alive[-1]}
+    if "make_action" in available:
+        phase2 = view["phase2"]
+        action = phase2["available_actions"][0]["id"]
+        return "make_action", {
+            "player_id": phase2["current_player"],
+            "action_id": action,
+        }
+    if "resolve_crisis" in available:
+        return "resolve_crisis", {"result": "bunker_lose"}
+    for name in (
+        "start_game",
+        "open_bunker",
+        "end_discussion",
+        "reveal_results",
+        "process_action",
+        "finish_team_turn",
+    ):
+        if name in available:
+            return name, {}
+    return None
+
+
+def _play(service, gid, max_steps=400):
+    for _ in range(max_steps):
+        move = _next_move(service, gid)
+        if move is None:
+            return
+        service.execute_game_action(gid, *move)
+
+
+def test_same_seed_same_game():
+    a, b = Game(Player("H", "h"), seed=7), Game(Player("H", "h"), seed=7)
+    for game in (a, b):
+        for i in range(5):
+            game.players[f"P{i}"] = Player(f"P{i}", "", id=f"P{i}")
+        game.shuffle_turn_order()
+    assert a.turn_order == b.turn_order
+    assert a.rng.random() == b.rng.random()
+
+
+def test_recorded_game_replays_to_same_state(tmp_path):
+    store = SQLiteEventStore(tmp_path / "games.db")
+    service = GameService()
+    service.attach_journal(GameJournal(store))
+
+    gid = service.create_game("Host", "host-sid")["id"]
+    for i in range(6):
+        service.join_game(gid, f"P{i}", f"sid-{i}")
+    _play(service, gid)
+    live = service.get_game_snapshot(gid)
+    assert live["phase"] in ("phase2", "finished")
+
+    store.flush()
+    events = store.events(gid)
+    store.close()
+    write_log(events, tmp_path / "game.jsonl")
+
+    game_data = GameData(root=DATA_DIR)
+    full = replay(read_log(tmp_path / "game.jsonl"), game_data)
+    fast = replay(events, game_data, fast=True)
+
+    assert full.applied == fast.applied == len(events) - 1
+    assert fast.views is None and len(full.views) == len(events)
+    assert full.engine.view() == live
+    assert fast.engine.view() == live
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from bunker.core.loader import GameData
+from bunker.domain.models.character import Character
+from bunker.domain.models.models import Game, Player
+from bunker.domain.models.phase2_models import ActionRequirement
+from bunker.domain.phase2.action_filter import ActionFilter
+from bunker.domain.phase2.requirements import (
+    FACT_OBJECTS,
+    FACT_PHOBIAS,
+    FACT_STATUSES,
+    FACT_TEAMS,
+    FACT_TRAITS,
+    compile_requirement,
+)
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def test_dependencies_follow_requirement_kinds():
+    req = ActionRequirement(
+        any_of=[{"profession": ["Врач"]}, {"bunker_object": "generator"}],
+        not_having=[{"active_status": "fire"}],
+    )
+    assert compile_requirement(req).depends_on == {
+        FACT_TRAITS,
+        FACT_OBJECTS,
+        FACT_STATUSES,
+    }
+
+    cure = ActionRequirement(all_of=[{"target_has_phobia": True}])
+    assert compile_requirement(cure).depends_on == {FACT_PHOBIAS, FACT_TEAMS}
+
+    assert compile_requirement(ActionRequirement()).depends_on == frozenset()
+
+
+def test_game_data_compiles_every_action():
+    game_data = GameData(root=DATA_DIR)
+    for action in game_data.phase2_actions.values():
+        assert action.compiled_requirements is not None
+
+
+def test_filter_rechecks_actions_after_status_change():
+    game_data = GameData(root=DATA_DIR)
+    host = Player("Host", "H")
+    game = Game(host)
+    player = Player("P", "S")
+    game.players[player.id] = player
+    game.characters[player.id] = Character({})
+    game.team_in_bunker = {player.id}
+
+    action_filter = ActionFilter(game)
+
+    def available():
+        return {
+            a.id
+            for a in action_filter.get_available_actions(
+                player.id, "bunker", game_data.phase2_actions
+            )
+        }
+
+    assert "tech_repair" not in available()
+    game.phase2_active_statuses.append("tech_malfunction")
+    assert "tech_repair" in available()
+    game.phase2_active_statuses.remove("tech_malfunction")
+    assert "tech_repair" not in available()
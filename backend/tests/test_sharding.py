@@ -0,0 +1,72 @@
+from bunker import create_app, socketio
+from bunker.config import DevConfig
+from bunker.core.sharding import ShardMap, shard_for
+from bunker.domain.models.models import gen_code
+from bunker.infrastructure.message_queue import LocalQueueManager
+
+URLS = ("http://w0:5001", "http://w1:5002")
+
+
+class ShardZeroConfig(DevConfig):
+    SHARD_INDEX = 0
+    SHARD_COUNT = 2
+    SHARD_URLS = URLS
+
+
+class LocalQueueConfig(DevConfig):
+    MESSAGE_QUEUE = "local://test-fanout"
+
+
+def _foreign_id(shards: ShardMap) -> str:
+    return next(gid for gid in iter(gen_code, None) if not shards.owns(gid))
+
+
+def test_new_games_land_on_their_own_shard():
+    shards = [ShardMap(index=i, count=3) for i in range(3)]
+    for shard in shards:
+        gid = shard.new_game_id(gen_code)
+        assert shard_for(gid, 3) == shard.index
+        assert sum(s.owns(gid) for s in shards) == 1
+
+
+def test_foreign_game_is_redirected_to_owner():
+    app = create_app(ShardZeroConfig)
+    client = socketio.test_client(app)
+
+    client.emit("create_game", {})
+    created = client.get_received()[0]["args"][0]["game"]["id"]
+    assert shard_for(created, 2) == 0
+
+    foreign = _foreign_id(ShardMap.from_config(app.config))
+    client.emit("join_game", {"id": foreign, "name": "Guest"})
+    received = client.get_received()
+    assert received[0]["name"] == "shard_redirect"
+    assert received[0]["args"][0] == {"id": foreign, "shard": 1, "url": URLS[1]}
+
+    # любой обработчик с id партии, а не только вход в комнату
+    for event, data in (
+        ("game_action", {"gameId": foreign, "action": "start_game"}),
+        ("start_game", {"id": foreign, "host_id": "H"}),
+        ("get_action_history", {"gameId": foreign}),
+        ("phase2_get_action_preview", {"gameId": foreign}),
+    ):
+        client.emit(event, data)
+        assert [r["name"] for r in client.get_received()] == ["shard_redirect"]
+
+    route = app.test_client().get(f"/route/{foreign}").get_json()
+    assert route["url"] == URLS[1]
+
+
+def test_local_queue_fans_out_emits_from_other_processes():
+    app = create_app(LocalQueueConfig)
+    client = socketio.test_client(app)
+    client.emit("create_game", {})
+    gid = client.get_received()[0]["args"][0]["game"]["id"]
+
+    # «другой воркер» без своего сервера — только пишет в очередь
+    other = LocalQueueManager("test-fanout", write_only=True)
+    other.emit("notice", {"text": "hi"}, room=f"game:{gid}")
+
+    received = client.get_received()
+    assert [r["name"] for r in received] == ["notice"]
+    assert received[0]["args"][0] == {"text": "hi"}
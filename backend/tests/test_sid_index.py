@@ -0,0 +1,25 @@
+from bunker.domain.models.models import Game, Player
+from bunker.services.repo import InMemoryGameRepo
+
+
+def test_sid_index_follows_join_rejoin_disconnect():
+    repo = InMemoryGameRepo()
+    host = Player("Host", "sid-host")
+    game = Game(host)
+    repo.add(game)
+    assert repo.by_sid("sid-host") == (game, host)
+
+    player = Player("P", "sid-1")
+    game.players[player.id] = player
+    repo.bind_sid("sid-1", game.id, player.id)
+    assert repo.locate_sid("sid-1") == (game.id, player.id)
+
+    # переподключение с новым сокетом
+    repo.unbind_sid("sid-1")
+    repo.bind_sid("sid-2", game.id, player.id)
+    assert repo.by_sid("sid-1") is None
+    assert repo.by_sid("sid-2") == (game, player)
+
+    repo.remove(game.id)
+    assert repo.by_sid("sid-2") is None
+    assert repo.by_sid("sid-host") is None
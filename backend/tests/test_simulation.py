@@ -0,0 +1,27 @@
+from bunker.domain.phase2.simulation import run_batch
+
+
+def test_batch_aggregates_every_game():
+    report = run_batch(20, policy="random", seed=1, workers=0, chunk_size=7)
+
+    assert report.games == 20
+    assert sum(report.winners.values()) + report.stalled == 20
+    assert sum(report.rounds.values()) == sum(report.winners.values())
+    assert all(0 <= rate <= 1 for rate in report.success_rates().values())
+
+
+def test_same_seed_same_report():
+    first = run_batch(10, policy="greedy", seed=7, workers=0)
+    second = run_batch(10, policy="greedy", seed=7, workers=0)
+    assert first.to_dict() == second.to_dict()
+
+
+def test_config_overrides_apply():
+    report = run_batch(
+        10,
+        seed=3,
+        workers=0,
+        overrides={"game_settings": {"starting_bunker_hp": 1000, "max_rounds": 1}},
+        crisis_win_rate=1.0,
+    )
+    assert report.conditions.get("bunker_destroyed", 0) == 0
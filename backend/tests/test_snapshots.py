@@ -0,0 +1,63 @@
+from bunker.domain.models.models import Game, Player
+from bunker.services.snapshots import SnapshotTracker, apply_patch, diff_views
+
+
+def test_diff_roundtrip():
+    """Патч превращает старый снимок в новый"""
+    old = {
+        "id": "G1",
+        "phase2": {"bunker_hp": 7, "action_log": [{"type": "crisis"}], "x/y": 1},
+        "players": [{"id": "A", "online": True}],
+    }
+    new = {
+        "id": "G1",
+        "phase2": {
+            "bunker_hp": 5,
+            "action_log": [{"type": "crisis"}, {"type": "team_turn"}],
+            "x/y": 2,
+            "winner": None,
+        },
+        "players": [{"id": "A", "online": False}],
+    }
+
+    ops = diff_views(old, new)
+
+    assert apply_patch(old, ops) == new
+    assert {"op": "replace", "path": "/phase2/bunker_hp", "value": 5} in ops
+    assert {"op": "replace", "path": "/phase2/x~1y", "value": 2} in ops
+    assert {
+        "op": "add",
+        "path": "/phase2/action_log/1",
+        "value": {"type": "team_turn"},
+    } in ops
+
+
+def test_diff_shrinking_list_and_removed_keys():
+    old = {"queue": [1, 2, 3], "crisis": {"id": "fire"}}
+    new = {"queue": [1]}
+
+    ops = diff_views(old, new)
+
+    assert apply_patch(old, ops) == new
+    assert diff_views(new, new) == []
+
+
+def test_tracker_versions():
+    """Версия растёт только при реальных изменениях"""
+    game = Game(Player("Host", "H"))
+    tracker = SnapshotTracker()
+    snap = {"id": game.id, "players": [], "log": []}
+
+    full = tracker.full(game, snap)
+    assert full["version"] == 1
+
+    # view() отдаёт живые списки — мутация не должна портить базу диффа
+    snap["log"].append("action")
+    patch = tracker.patch(game, snap)
+    assert patch["base_version"] == 1
+    assert patch["version"] == 2
+    assert patch["ops"] == [{"op": "add", "path": "/log/0", "value": "action"}]
+
+    unchanged = tracker.patch(game, snap)
+    assert unchanged["ops"] == []
+    assert unchanged["version"] == 2
@@ -0,0 +1,76 @@
+from bunker.domain.models.models import PhobiaStatus
+from bunker.domain.models.stats import STATS
+from bunker.domain.phase2.stat_ledger import TeamStatLedger
+
+
+def _rebuilt(engine):
+    """Эталон: полная перестройка всех вкладов"""
+    engine._stats_need_rebuild = True
+    engine._calculate_team_stats()
+    return engine.game.phase2_team_stats
+
+
+def test_ledger_replaces_source_delta():
+    ledger = TeamStatLedger()
+    ledger.reset(["bunker"])
+
+    ledger.set("bunker", ("status", "fire"), STATS.vector({"СИЛ": -2, "ТЕХ": 1}))
+    ledger.set("bunker", ("player", "A"), STATS.vector({"СИЛ": 3, "UNKNOWN": 5}))
+    assert ledger.totals()["bunker"]["СИЛ"] == 1
+
+    ledger.set("bunker", ("status", "fire"), STATS.vector({"СИЛ": -1}))
+    assert ledger.totals()["bunker"]["СИЛ"] == 2
+    assert ledger.totals()["bunker"]["ТЕХ"] == 0
+
+    ledger.discard("bunker", ("player", "A"))
+    assert ledger.totals()["bunker"]["СИЛ"] == -1
+
+
+def test_stat_vectors_follow_registry_layout():
+    vector = STATS.vector({"ИНТ": 2, "ЗДР": 1, "UNKNOWN": 7})
+    assert vector == (1, 0, 2, 0, 0, 0)
+    assert STATS.to_dict(vector, STATS.mask(["ИНТ"])) == {"ИНТ": 2}
+    assert STATS.dot(vector, STATS.vector({"ИНТ": 0.5, "ЗДР": 1.0})) == 2.0
+
+    # фобия опускает до порога только статы, заданные у персонажа
+    mask = STATS.mask(["ЗДР", "ИНТ"])
+    phobia = PhobiaStatus.for_character("тьма", "test", vector, mask, -2)
+    assert STATS.nonzero(phobia.affected_stats) == {"ЗДР": -3, "ИНТ": -4}
+    assert phobia.apply(vector, mask, -2) == (-2, 0, -2, 0, 0, 0)
+
+
+def test_incremental_matches_full_rebuild(phase2_game):
+    eng, game = phase2_game
+    engine = eng._phase2_engine
+    status_id = next(
+        sid
+        for sid, sdef in engine.data.statuses.items()
+        if sdef.effects.team_stats.get("bunker")
+    )
+
+    engine._status_manager.apply_status(status_id, "test")
+    engine._apply_crisis_penalties(
+        {
+            "object_damage": list(game.phase2_bunker_objects),
+            "team_debuff": {
+                "target": "bunker",
+                "effect": "test_debuff",
+                "stat_penalties": {"СИЛ": -2},
+                "duration": 1,
+            },
+        }
+    )
+    bunker_player = next(iter(game.team_in_bunker))
+    phobia = game.characters[bunker_player].traits["phobia"].name
+    engine._trigger_phobias([phobia], "test")
+
+    engine._calculate_team_stats()
+    incremental = {t: dict(s) for t, s in game.phase2_team_stats.items()}
+    assert incremental == _rebuilt(engine)
+
+    # Снятие статуса и истечение дебафа вычитают только свои дельты
+    engine._status_manager.remove_status(status_id)
+    engine._update_debuffs()
+    engine._calculate_team_stats()
+    incremental = {t: dict(s) for t, s in game.phase2_team_stats.items()}
+    assert incremental == _rebuilt(engine)
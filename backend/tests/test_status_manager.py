@@ -45,8 +45,6 @@ def mock_game():
     game.phase2_bunker_hp = 10
     game.phase2_morale = 10
     game.phase2_supplies = 10
-    game.phase2_active_statuses = []
-    game.phase2_active_statuses_detailed = {}
     game.phase2_bunker_objects = {
         "generator": BunkerObjectState("generator", "Генератор", "working"),
         "ventilation": BunkerObjectState("ventilation", "Вентиляция", "working"),
@@ -94,9 +92,8 @@ class TestStatusManager:
 
         assert result is True
         assert "test_fire" in mock_game.phase2_active_statuses
-        assert "test_fire" in mock_game.phase2_active_statuses_detailed
 
-        active_status = mock_game.phase2_active_statuses_detailed["test_fire"]
+        active_status = mock_game.phase2_active_statuses.get("test_fire")
         assert active_status.status_id == "test_fire"
         assert active_status.source == "test_source"
         assert active_status.applied_at_round == 1
@@ -140,7 +137,7 @@ class TestStatusManager:
         assert result is True
         assert not status_manager.is_status_active("test_fire")
         assert "test_fire" not in mock_game.phase2_active_statuses
-        assert "test_fire" not in mock_game.phase2_active_statuses_detailed
+        assert mock_game.phase2_active_statuses.get("test_fire") is None
 
     def test_remove_nonexistent_status(self, status_manager):
         """Тест снятия несуществующего статуса"""
@@ -221,16 +218,35 @@ class TestStatusManager:
         assert normal_mods["difficulty_modifier"] == 0
         assert normal_mods["blocked"] is False
 
-    def test_get_team_stat_modifiers(self, status_manager, mock_game):
-        """Тест получения модификаторов статов команд"""
-        # Применяем статус
+    def test_action_modifiers_follow_apply_and_remove(self, status_manager, mock_game):
+        """Сложенные модификаторы обновляются при применении и снятии статусов"""
         status_manager.apply_status("test_fire", "test")
+        status_manager.apply_status("test_darkness", "test")
+        assert status_manager.get_action_modifiers("repair_bunker")[
+            "difficulty_modifier"
+        ] == (3 + 2)
+
+        status_manager.remove_status("test_fire")
+        assert (
+            status_manager.get_action_modifiers("repair_bunker")["difficulty_modifier"]
+            == 2
+        )
+        assert (
+            status_manager.get_action_modifiers("search_supplies")["blocked"] is False
+        )
 
-        modifiers = status_manager.get_team_stat_modifiers()
+        # результат — копия: правка вызывающим не портит сложенное значение
+        mods = status_manager.get_action_modifiers("repair_bunker")
+        mods["difficulty_modifier"] = 99
+        assert status_manager.get_action_modifiers("repair_bunker") != mods
 
-        assert "bunker" in modifiers
-        assert modifiers["bunker"]["ЗДР"] == -2
-        assert modifiers["bunker"]["ТЕХ"] == -1
+        # список изменен в обход менеджера — пересобрать
+        mock_game.phase2_active_statuses.clear()
+        status_manager.rebuild()
+        assert (
+            status_manager.get_action_modifiers("repair_bunker")["difficulty_modifier"]
+            == 0
+        )
 
     def test_trigger_phobias(self, status_manager, mock_game):
         """Тест триггера фобий"""
@@ -254,7 +270,7 @@ class TestStatusManager:
         assert status_manager.is_status_active("test_panic")
 
         # Проверяем что статус временный (2 раунда)
-        active_panic = mock_game.phase2_active_statuses_detailed["test_panic"]
+        active_panic = mock_game.phase2_active_statuses.get("test_panic")
         assert active_panic.remaining_rounds == 2
 
     def test_get_statuses_for_api(self, status_manager, mock_game):
@@ -283,3 +299,25 @@ class TestStatusManager:
         assert any("bunker_hp каждый раунд" in effect for effect in effects)
         assert any("ЗДР для команды bunker" in effect for effect in effects)
         assert any("Блокирует действия" in effect for effect in effects)
+
+
+def test_active_statuses_expire_by_round_queue():
+    """Истечение берется из очереди: снятые и переприменные не всплывают"""
+    from bunker.domain.models.status_models import ActiveStatus, ActiveStatuses
+
+    store = ActiveStatuses()
+    store.add(ActiveStatus("short", applied_at_round=1, remaining_rounds=1))
+    store.add(ActiveStatus("long", applied_at_round=1, remaining_rounds=3))
+    store.add(ActiveStatus("gone", applied_at_round=1, remaining_rounds=1))
+    store.append("forever")
+    store.discard("gone")
+
+    assert store.due(2) == []
+    assert store.due(3) == ["short"]
+    store.discard("short")
+
+    # переприменен с новым сроком — старая запись очереди устарела
+    store.add(ActiveStatus("long", applied_at_round=4, remaining_rounds=2))
+    assert store.due(5) == []
+    assert store.due(7) == ["long"]
+    assert list(store) == ["forever", "long"] and store == ["forever", "long"]
@@ -0,0 +1,135 @@
+import pytest
+
+from bunker.core.timers import TimerWheel
+from bunker.infrastructure.sqlite.event_store import SQLiteEventStore
+from bunker.services.game_service import GameService
+from bunker.services.journal import GameJournal
+from bunker.services.timeouts import GameTimeouts, TimeoutPolicy
+
+from .test_replay import _next_move
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_wheel_fires_in_order_and_never_early():
+    clock, fired = Clock(), []
+    wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+    wheel.schedule(3, fired.append, "b")
+    wheel.schedule(1.5, fired.append, "a")
+    wheel.schedule(20, fired.append, "far")  # больше одного оборота колеса
+    gone = wheel.schedule(2, fired.append, "cancelled")
+    assert wheel.cancel(gone) and not wheel.cancel(gone)
+
+    wheel.advance(1.0)
+    assert fired == []
+    wheel.advance(3.0)
+    assert fired == ["a", "b"]
+    wheel.advance(19.0)
+    assert fired == ["a", "b"]
+    wheel.advance(21.0)
+    assert fired == ["a", "b", "far"] and len(wheel) == 0
+
+
+def test_keyed_timer_replaces_previous():
+    clock, fired = Clock(), []
+    wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+    wheel.set("host", 2, fired.append, 1)
+    wheel.set("host", 5, fired.append, 2)
+    assert len(wheel) == 1 and wheel.pending("host")
+    wheel.advance(10.0)
+    assert fired == [2] and not wheel.pending("host")
+
+
+def _phase2_service(policy):
+    service = GameService()
+    clock = Clock()
+    service.timeouts = GameTimeouts(service, TimerWheel(1.0, clock=clock), policy)
+    gid = service.create_game("Host", "host-sid")["id"]
+    for i in range(6):
+        service.join_game(gid, f"P{i}", f"sid-{i}")
+    for _ in range(400):
+        move = _next_move(service, gid)
+        if move[0] == "make_action":
+            break
+        service.execute_game_action(gid, *move)
+    return service, gid, clock
+
+
+def test_turn_deadline_skips_the_team_turn():
+    service, gid, clock = _phase2_service(TimeoutPolicy(turn_timeout=10))
+    updates = []
+    service.on_update = updates.append
+    before = service.get_game_snapshot(gid)["phase2"]
+    team = before["current_team"]
+
+    clock.now += 9
+    service.timeouts.wheel.advance()
+    assert service.get_game_snapshot(gid)["phase2"]["current_team"] == team
+
+    clock.now += 2
+    service.timeouts.wheel.advance()
+    after = service.get_game_snapshot(gid)["phase2"]
+    assert (after["round"], after["current_team"]) != (before["round"], team)
+    assert updates == [gid]
+    # у нового хода свой срок
+    assert service.timeouts.wheel.pending(("turn", gid))
+
+
+def test_player_away_past_reconnect_window_is_skipped():
+    policy = TimeoutPolicy(turn_timeout=0, reconnect_window=5)
+    service, gid, clock = _phase2_service(policy)
+    eng = service._engines[gid]
+    current = eng._phase2_engine.get_current_player()
+    service.disconnect(eng.game.players[current].sid)
+
+    clock.now += 6
+    service.timeouts.wheel.advance()  # окно истекло — игрок ушел
+    clock.now += 1
+    service.timeouts.wheel.advance()  # его очередь пропущена
+    assert eng._phase2_engine.get_current_player() != current
+
+
+def test_clients_cannot_expire_a_turn():
+    service, gid, _ = _phase2_service(TimeoutPolicy(turn_timeout=0))
+    before = service.get_game_snapshot(gid)["phase2"]
+    payload = {"round": before["round"], "team": before["current_team"]}
+
+    with pytest.raises(ValueError):
+        service.execute_game_action(gid, "turn_timeout", payload)
+    assert service.get_game_snapshot(gid)["phase2"]["current_team"] == (
+        before["current_team"]
+    )
+
+    # тот же ход закрывает только серверный таймер
+    service.expire_turn(gid, payload)
+    after = service.get_game_snapshot(gid)["phase2"]
+    assert (after["round"], after["current_team"]) != (
+        before["round"],
+        before["current_team"],
+    )
+
+
+def test_game_closed_for_absent_host_is_not_revived(tmp_path):
+    store = SQLiteEventStore(tmp_path / "games.db")
+    service, clock = GameService(), Clock()
+    service.attach_journal(GameJournal(store))
+    policy = TimeoutPolicy(host_grace=5)
+    service.timeouts = GameTimeouts(service, TimerWheel(1.0, clock=clock), policy)
+    gid = service.create_game("Host", "host-sid")["id"]
+    service.join_game(gid, "P0", "sid-0")
+
+    service.disconnect("host-sid")
+    clock.now += 6
+    service.timeouts.wheel.advance()
+    store.flush()
+
+    # закрытая партия не поднимается из журнала по запросу игрока
+    assert service.get_game_snapshot(gid) is None
+    assert store.load(gid) is None
+    store.close()
@@ -69,3 +69,94 @@ def test_phase2_events_structure():
         assert len(received) > 0
 
     print("✓ Phase2 WebSocket events structure test completed")
+
+
+def test_game_patch_and_resync():
+    """Изменения приходят диффами, при разрыве версий — полный снимок"""
+    app = create_app()
+    host = socketio.test_client(app)
+    host.emit("create_game", {})
+    created = host.get_received()[0]["args"][0]
+    game_id = created["game"]["id"]
+    version = created["version"]
+
+    guest = socketio.test_client(app)
+    guest.emit("join_game", {"id": game_id, "name": "Guest"})
+
+    patches = [r["args"][0] for r in host.get_received() if r["name"] == "game_patch"]
+    assert len(patches) == 1
+    assert patches[0]["base_version"] == version
+    assert patches[0]["version"] == version + 1
+    assert any(op["path"].startswith("/players") for op in patches[0]["ops"])
+
+    host.emit("sync_game", {"gameId": game_id, "version": version})
+    resync = [r for r in host.get_received() if r["name"] == "game_updated"]
+    assert resync and resync[0]["args"][0]["version"] == version + 1
+
+    host.emit("sync_game", {"gameId": game_id, "version": version + 1})
+    assert not host.get_received()
+
+
+def test_resync_overlay_follows_socket_not_player_id():
+    """Надбавку ведущего нельзя получить, назвавшись его playerId"""
+    app = create_app()
+    host = socketio.test_client(app)
+    host.emit("create_game", {})
+    created = host.get_received()[0]["args"][0]
+    game_id, host_id = created["game"]["id"], created["game"]["host_id"]
+
+    guest = socketio.test_client(app)
+    guest.emit("join_game", {"id": game_id, "name": "Guest"})
+    guest_id = guest.get_received()[-1]["args"][0]["player_id"]
+    stranger = socketio.test_client(app)
+
+    forged = {"gameId": game_id, "version": -1, "playerId": host_id}
+    guest.emit("sync_game", forged)
+    full = [r["args"][0] for r in guest.get_received() if r["name"] == "game_updated"]
+    assert full[0]["private"]["player_id"] == guest_id
+    assert "characters" not in full[0]["private"]
+
+    stranger.emit("sync_game", forged)
+    full = [
+        r["args"][0] for r in stranger.get_received() if r["name"] == "game_updated"
+    ]
+    assert full and "private" not in full[0]
+
+
+def test_disconnect_marks_player_offline():
+    """disconnect находит игрока по индексу sid"""
+    app = create_app()
+    host = socketio.test_client(app)
+    host.emit("create_game", {})
+    game_id = host.get_received()[0]["args"][0]["game"]["id"]
+
+    guest = socketio.test_client(app)
+    guest.emit("join_game", {"id": game_id, "name": "Guest"})
+    host.get_received()
+
+    guest.disconnect()
+    patches = [r["args"][0] for r in host.get_received() if r["name"] == "game_patch"]
+    assert any(
+        op["path"].endswith("/online") and op["value"] is False
+        for patch in patches
+        for op in patch["ops"]
+    )
+
+
+def test_turn_timeout_is_not_a_client_action():
+    app = create_app()
+    host = socketio.test_client(app)
+    host.emit("create_game", {})
+    game_id = host.get_received()[0]["args"][0]["game"]["id"]
+
+    host.emit(
+        "game_action",
+        {
+            "gameId": game_id,
+            "action": "turn_timeout",
+            "payload": {"round": 1, "team": "outside"},
+        },
+    )
+    received = host.get_received()
+    assert [r["name"] for r in received] == ["error"]
+    assert "not allowed" in received[0]["args"][0]["message"]
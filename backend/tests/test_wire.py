@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from bunker import create_app, socketio
+from bunker.sockets.wire import COMPACT, JSON, encode, expand_keys, intern_keys
+
+
+def _size(payload):
+    return len(json.dumps(payload, separators=(",", ":")))
+
+
+def _events(client, name):
+    return [r["args"][0] for r in client.get_received() if r["name"] == name]
+
+
+def test_compact_roundtrip_is_smaller():
+    app = create_app()
+    host = socketio.test_client(app)
+    host.emit("create_game", {})
+    gid = host.get_received()[0]["args"][0]["game"]["id"]
+    for i in range(6):
+        socketio.test_client(app).emit("join_game", {"id": gid, "name": f"P{i}"})
+    host.emit("game_action", {"gameId": gid, "action": "start_game", "payload": {}})
+    host.emit("sync_game", {"gameId": gid})
+    snapshot = _events(host, "game_updated")[-1]
+    assert snapshot["game"]["characters"]
+
+    frame = intern_keys(snapshot)
+    assert expand_keys(frame) == snapshot
+    assert _size(frame) < 0.8 * _size(snapshot)
+
+
+def test_clients_get_frames_in_their_negotiated_format():
+    app = create_app()
+    host = socketio.test_client(app, auth={"wire": COMPACT})
+    assert _events(host, "wire_format") == [{"format": COMPACT}]
+
+    host.emit("create_game", {})
+    created = expand_keys(_events(host, "game_created")[0])
+    gid = created["game"]["id"]
+
+    legacy = socketio.test_client(app)
+    legacy.emit("join_game", {"id": gid, "name": "Legacy"})
+    joined = _events(legacy, "joined")[0]
+    assert joined["game"]["id"] == gid
+
+    # один и тот же патч: старому клиенту как есть, новому — в compact
+    guest = socketio.test_client(app)
+    guest.emit("join_game", {"id": gid, "name": "Guest"})
+    plain = _events(legacy, "game_patch")
+    packed = [expand_keys(f) for f in _events(host, "game_patch")]
+    assert plain and plain[-1] == packed[-1]
+
+
+def test_unknown_format_falls_back_to_json():
+    app = create_app()
+    client = socketio.test_client(app, auth={"wire": "carrier-pigeon"})
+    assert _events(client, "wire_format") == [{"format": JSON}]
+
+
+def test_msgpack_frames_decode_to_the_same_payload():
+    msgpack = pytest.importorskip("msgpack")
+    payload = {"id": "ABC", "players": [{"name": "P", "online": True}]}
+    assert msgpack.unpackb(encode("msgpack", payload)) == payload